@@ -0,0 +1,259 @@
+import os
+import sys
+import json
+import random
+import asyncio
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import (
+    HEADER,
+    WAIFU_TAGS,
+    FakeBot,
+    FakeChannel,
+    FakeContext,
+    FakeGuild,
+    FakeInteraction,
+    FakeMessage,
+    FakeUpstreams,
+    FakeUser,
+    Result,
+    Workspace,
+    run_concurrent,
+)
+
+SCENARIOS = ["waifu", "claim_burst", "collection", "leaderboard", "schedule", "rss"]
+
+
+class Bench:
+    def __init__(self, args):
+        self.args = args
+        self.bot: FakeBot = None
+        self.upstreams: FakeUpstreams = None
+        self.guild = FakeGuild()
+        self.channel: FakeChannel = None
+
+    async def setup(self):
+        from extensions.sendqueue import SendQueue
+        from extensions.ratelimit import RateLimiter
+
+        self.upstreams = await FakeUpstreams(delay=self.args.delay / 1000).start()
+        self.upstreams.point_cogs_here()
+
+        self.bot = FakeBot()
+        self.channel = self.bot.add_channel(FakeChannel(guild=self.guild))
+
+        # One Guild Fires Every Op - The Per-Guild Bucket Would Cap The Run
+        self.bot.rate_limiter = RateLimiter(config={"enabled": False})
+
+        if not self.args.discord_limits:
+            # Measure The Bot, Not Discord's Rate Limits
+            unlimited = 1e9
+            self.bot.send_queue = SendQueue(
+                channel_rate=unlimited,
+                channel_burst=unlimited,
+                global_rate=unlimited,
+                global_burst=unlimited,
+            )
+
+        import cogs.waifu
+        import cogs.schedule
+
+        cogs.waifu.setup(self.bot)
+        cogs.schedule.setup(self.bot)
+
+    async def teardown(self):
+        for cog in self.bot.cogs.values():
+            try:
+                cog.cog_unload()
+            except Exception:
+                pass
+
+        queue = getattr(self.bot, "send_queue", None)
+        if queue is not None:
+            queue.close()
+
+        await self.upstreams.stop()
+
+    @property
+    def waifu(self):
+        return self.bot.cogs["Waifu"]
+
+    @property
+    def schedule(self):
+        return self.bot.cogs["Schedule"]
+
+    def ctx(self, user: FakeUser = None) -> FakeContext:
+        return FakeContext(self.bot, user or FakeUser(guild=self.guild), self.channel)
+
+    async def spawn(self) -> tuple:
+        # Returns (view, message) For A Freshly Fetched Waifu
+        cog = self.waifu
+        ctx = self.ctx()
+        await cog.waifu_cmd.callback(cog, ctx, random.choice(WAIFU_TAGS))
+
+        kwargs = ctx.replies[-1][2]
+        view = kwargs.get("view")
+        message = FakeMessage(self.channel, embed=kwargs.get("embed"), view=view)
+        return view, message
+
+    def seed_collection(self, user: FakeUser, count: int):
+        db = self.waifu.db
+        db.add_user(self.guild.id, user.id, str(user))
+        user_row = db.get_user(self.guild.id, user.id)
+
+        for i in range(count):
+            api_id = 10_000_000 + user.id * 10_000 + i
+            db.add_waifu(
+                api_id,
+                f"https://cdn.invalid/images/{api_id}.jpg",
+                f"https://cdn.invalid/preview/{api_id}.jpg",
+                f"https://source.invalid/{api_id}",
+                "artist",
+                None,
+                False,
+                json.dumps([random.choice(WAIFU_TAGS)]),
+            )
+            waifu_row = db.get_waifu_by_api_id(api_id)
+            db.add_claim(self.guild.id, user_row[0], waifu_row[0])
+
+    # ───── SCENARIOS ─────
+
+    async def bench_waifu(self) -> Result:
+        cog = self.waifu
+
+        async def one(i):
+            ctx = self.ctx()
+            await cog.waifu_cmd.callback(cog, ctx, WAIFU_TAGS[i % len(WAIFU_TAGS)])
+            if not ctx.replies or ctx.replies[-1][2].get("view") is None:
+                raise RuntimeError("No Waifu Posted")
+
+        return await run_concurrent(
+            "/waifu", one, self.args.ops, self.args.concurrency
+        )
+
+    async def bench_claim_burst(self) -> Result:
+        spawns = [await self.spawn() for _ in range(self.args.spawns)]
+        clickers = self.args.clickers
+
+        async def one(i):
+            view, message = spawns[i // clickers]
+            interaction = FakeInteraction(
+                FakeUser(guild=self.guild), self.channel, message
+            )
+            await view.claim_button.callback(interaction)
+
+        result = await run_concurrent(
+            "claim burst",
+            one,
+            len(spawns) * clickers,
+            len(spawns) * clickers,
+        )
+        result.notes = f"{len(spawns)} spawns x {clickers} clickers"
+        return result
+
+    async def bench_collection(self) -> Result:
+        cog = self.waifu
+        owner = FakeUser(guild=self.guild)
+        self.seed_collection(owner, self.args.collection_size)
+
+        async def one(i):
+            await cog.collection_cmd.callback(cog, self.ctx(owner), None, None)
+
+        result = await run_concurrent(
+            "/collection", one, self.args.ops, self.args.concurrency
+        )
+        result.notes = f"{self.args.collection_size} waifus"
+        return result
+
+    async def bench_leaderboard(self) -> Result:
+        cog = self.waifu
+        db = cog.db
+        for i in range(self.args.users):
+            user = FakeUser(guild=self.guild)
+            db.add_user(self.guild.id, user.id, str(user))
+            db.update_user_waifu_count(self.guild.id, user.id, random.randint(0, 500))
+
+        async def one(i):
+            await cog.leaderboard_cmd.callback(cog, self.ctx())
+
+        result = await run_concurrent(
+            "/leaderboard", one, self.args.ops, self.args.concurrency
+        )
+        result.notes = f"{self.args.users} users"
+        return result
+
+    async def bench_schedule(self) -> Result:
+        cog = self.schedule
+
+        async def one(i):
+            await cog.schedule_command.callback(cog, self.ctx(), str(i % 7))
+
+        return await run_concurrent(
+            "/schedule", one, self.args.ops, self.args.concurrency
+        )
+
+    async def bench_rss(self) -> Result:
+        cog = self.schedule
+        cog.config["rss_enabled"] = True
+        cog.config["rss_channel_id"] = [self.channel.id]
+
+        async def one(i):
+            # Bypass Each Feed's Own Interval So Every Cycle Fetches
+            await cog.poll_feeds(force=True)
+
+        result = await run_concurrent("rss cycle", one, self.args.rss_cycles, 1)
+        result.notes = f"{len(self.channel.sent)} posts"
+        return result
+
+    async def run(self) -> list[Result]:
+        await self.setup()
+        try:
+            results = []
+            for name in self.args.only or SCENARIOS:
+                results.append(await getattr(self, f"bench_{name}")())
+            return results
+        finally:
+            await self.teardown()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Offline Cog Benchmarks")
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.0, help="Upstream Delay (ms)")
+    parser.add_argument("--spawns", type=int, default=20)
+    parser.add_argument("--clickers", type=int, default=25)
+    parser.add_argument("--collection-size", type=int, default=500)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--rss-cycles", type=int, default=20)
+    parser.add_argument("--only", nargs="*", choices=SCENARIOS)
+    parser.add_argument("--verbose", action="store_true", help="Keep INFO Logging")
+    parser.add_argument(
+        "--discord-limits",
+        action="store_true",
+        help="Keep The Send Queue's Real Discord Rate Limits",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    if not args.verbose:
+        # Per-Command INFO Lines Would Dominate The Measurements
+        logging.disable(logging.INFO)
+
+    with Workspace():
+        results = await Bench(args).run()
+
+    print(HEADER)
+    for r in results:
+        print(r.row())
+
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
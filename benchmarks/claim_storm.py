@@ -0,0 +1,273 @@
+import os
+import sys
+import time
+import sqlite3
+import asyncio
+import logging
+import argparse
+import itertools
+import threading
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_cogs import Bench
+from benchmarks.harness import FakeInteraction, FakeUser, Workspace, percentile
+
+WIN_TEXT = "You Claimed This Waifu"
+
+
+class TimedCursor:
+    # Wraps The Cog's Cursor / Connection To Separate SQLite Waits From Work
+
+    def __init__(self, inner, stats, threshold: float):
+        self._inner = inner
+        self._stats = stats
+        self._threshold = threshold
+
+    def _timed(self, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        except Exception as e:
+            if "locked" in str(e).lower():
+                self._stats["locked_errors"] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stats["db_calls"] += 1
+            self._stats["db_time"] += elapsed
+            if elapsed >= self._threshold:
+                self._stats["lock_waits"] += 1
+                self._stats["lock_wait_time"] += elapsed
+
+    def execute(self, *args):
+        self._timed(self._inner.execute, *args)
+        return self
+
+    def executemany(self, *args):
+        self._timed(self._inner.executemany, *args)
+        return self
+
+    def commit(self):
+        return self._timed(self._inner.commit)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    def __iter__(self):
+        return iter(self._inner)
+
+
+class Storm:
+    def __init__(self, args):
+        self.args = args
+        self.bench = Bench(args)
+        self.stats = Counter()
+        self.contenders: list[threading.Thread] = []
+        self._stop = threading.Event()
+
+    def instrument(self):
+        db = self.bench.waifu.db
+        threshold = self.args.lock_threshold_ms / 1000
+        db.cursor = TimedCursor(db.cursor, self.stats, threshold)
+        db.connection = TimedCursor(db.connection, self.stats, threshold)
+
+    def _contend(self, path: str, stop: threading.Event):
+        # Another Writer On The Same File, Holding The Write Lock In Short Bursts.
+        # Runs In A Thread : The Cog's SQLite Calls Block The Loop While They Wait.
+        conn = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+        hold = self.args.contender_hold_ms / 1000
+        try:
+            while not stop.is_set():
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("UPDATE users SET user_name = user_name WHERE id = 0")
+                time.sleep(hold)
+                conn.execute("COMMIT")
+                time.sleep(0.001)
+        finally:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.close()
+
+    async def storm(self, label: str, spawns: int, clickers: int, users: list):
+        targets = [await self.bench.spawn() for _ in range(spawns)]
+        before = Counter(self.stats)
+
+        outcomes = Counter()
+        winners = Counter()
+        ack_latencies: list[float] = []
+        latencies: list[float] = []
+        user_cycle = itertools.cycle(users) if users else None
+
+        async def click(view, message, waifu_index):
+            user = next(user_cycle) if user_cycle else FakeUser(guild=self.bench.guild)
+            interaction = FakeInteraction(user, self.bench.channel, message)
+
+            start = time.perf_counter()
+            try:
+                await view.claim_button.callback(interaction)
+            except Exception as e:
+                outcomes[f"raised {type(e).__name__}"] += 1
+                return
+            finally:
+                latencies.append(time.perf_counter() - start)
+                if interaction.responded_at is not None:
+                    ack_latencies.append(interaction.responded_at - start)
+
+            text = next(
+                (str(r[1]) for r in interaction.replies if r[1] is not None), ""
+            )
+            if WIN_TEXT in text:
+                winners[waifu_index] += 1
+                outcomes["won"] += 1
+            elif "Already Claimed" in text:
+                outcomes["already claimed"] += 1
+            elif "Try Again" in text:
+                outcomes["cooldown"] += 1
+            elif "Internal Error" in text:
+                outcomes["internal error"] += 1
+            else:
+                outcomes[text[:40] or "no reply"] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                click(view, message, i)
+                for i, (view, message) in enumerate(targets)
+                for _ in range(clickers)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        delta = Counter(self.stats)
+        delta.subtract(before)
+        total = spawns * clickers
+
+        print(f"\n── {label} : {spawns} spawn(s) x {clickers} clickers ──")
+        print(f"claims/s        {total / elapsed:>10.1f}  ({total} in {elapsed:.3f}s)")
+        for name, samples in (("latency", latencies), ("ack", ack_latencies)):
+            ms = [x * 1000 for x in samples]
+            print(
+                f"{name + ' ms':<15} p50 {percentile(ms, 50):>8.2f}  "
+                f"p90 {percentile(ms, 90):>8.2f}  p99 {percentile(ms, 99):>8.2f}  "
+                f"max {max(ms, default=0):>8.2f}"
+            )
+        print(
+            f"db              {delta['db_calls']} calls, {delta['db_time'] * 1000:.1f}ms"
+        )
+        print(
+            f"lock waits      {delta['lock_waits']} "
+            f"({delta['lock_wait_time'] * 1000:.1f}ms), "
+            f"{delta['locked_errors']} 'database is locked' errors"
+        )
+        print("outcomes        " + ", ".join(f"{k}={v}" for k, v in outcomes.items()))
+
+        multi = sum(1 for n in winners.values() if n > 1)
+        unclaimed = sum(1 for i in range(spawns) if winners[i] == 0)
+        errors = sum(
+            n
+            for k, n in outcomes.items()
+            if k.startswith("raised ") or k == "internal error"
+        )
+        print(f"double winners  {multi} waifu(s) told more than one user they won")
+        print(f"unclaimed       {unclaimed} waifu(s) with no winner")
+        print(f"errors          {errors} click(s) raised or hit an internal error")
+
+        # A Claim Path That Fails Outright Must Fail The Run, Not Pass It Quietly
+        return multi + unclaimed + errors
+
+    def verify(self) -> int:
+        db = self.bench.waifu.db
+        db.cursor.execute(
+            """
+            SELECT waifu_id, COUNT(*) FROM claims
+            GROUP BY waifu_id HAVING COUNT(*) > 1
+            """
+        )
+        duplicates = db.cursor.fetchall()
+
+        db.cursor.execute(
+            """
+            SELECT u.discord_id, u.waifu_count, COUNT(c.id)
+            FROM users u LEFT JOIN claims c ON c.user_id = u.id
+            GROUP BY u.id
+            HAVING u.waifu_count != COUNT(c.id)
+            """
+        )
+        drift = db.cursor.fetchall()
+
+        print("\n── Correctness ──")
+        print(f"duplicate owners {len(duplicates)} waifu(s) with >1 claim row")
+        print(f"count drift      {len(drift)} user(s) whose waifu_count != claims")
+        for row in drift[:5]:
+            print(f"                 user {row[0]} : stored {row[1]}, actual {row[2]}")
+
+        return len(duplicates) + len(drift)
+
+    async def run(self) -> int:
+        await self.bench.setup()
+        self.instrument()
+
+        for _ in range(self.args.contenders):
+            thread = threading.Thread(
+                target=self._contend,
+                args=(os.path.abspath("astrumotaku.db"), self._stop),
+                daemon=True,
+            )
+            thread.start()
+            self.contenders.append(thread)
+
+        users = [FakeUser(guild=self.bench.guild) for _ in range(self.args.user_pool)]
+
+        try:
+            violations = 0
+            if self.args.mode in ("hot", "both"):
+                violations += await self.storm("hot spawn", 1, self.args.clickers, users)
+            if self.args.mode in ("spread", "both"):
+                violations += await self.storm(
+                    "spread", self.args.spawns, self.args.clickers, users
+                )
+
+            return violations + self.verify()
+        finally:
+            self._stop.set()
+            for thread in self.contenders:
+                thread.join()
+            await self.bench.teardown()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Claim-Storm Load Generator")
+    parser.add_argument("--mode", choices=["hot", "spread", "both"], default="both")
+    parser.add_argument("--clickers", type=int, default=200)
+    parser.add_argument("--spawns", type=int, default=50)
+    parser.add_argument(
+        "--user-pool",
+        type=int,
+        default=0,
+        help="Reuse This Many Users (0 = Fresh User Per Click)",
+    )
+    parser.add_argument("--contenders", type=int, default=0, help="Extra DB Writers")
+    parser.add_argument("--contender-hold-ms", type=float, default=2.0)
+    parser.add_argument("--lock-threshold-ms", type=float, default=2.0)
+    parser.add_argument("--delay", type=float, default=0.0, help="Upstream Delay (ms)")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--discord-limits", action="store_true")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    with Workspace():
+        violations = await Storm(args).run()
+
+    print(f"\n{'FAIL' if violations else 'OK'} : {violations} correctness violation(s)")
+    return violations
+
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(main()) else 0)
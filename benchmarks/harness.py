@@ -0,0 +1,499 @@
+import os
+import json
+import time
+import random
+import asyncio
+import tempfile
+import itertools
+import statistics
+from dataclasses import dataclass, field
+from aiohttp import web
+
+# Stand-Ins For The Discord Objects The Cogs Touch. They Only Implement What
+# The Cogs Actually Call, And Record Every Reply So Scenarios Can Assert On It.
+
+_ids = itertools.count(10_000)
+
+
+class FakeAsset:
+    def __init__(self, url: str):
+        self.url = url
+
+
+class FakePermissions:
+    def __init__(self, administrator: bool = False):
+        self.administrator = administrator
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int = None, name: str = "Bench Guild"):
+        self.id = guild_id or next(_ids)
+        self.name = name
+
+
+class FakeUser:
+    def __init__(self, user_id: int = None, name: str = None, guild=None):
+        self.id = user_id or next(_ids)
+        self.name = name or f"user{self.id}"
+        self.display_name = self.name
+        self.display_avatar = FakeAsset(f"https://cdn.invalid/avatars/{self.id}.png")
+        self.guild_permissions = FakePermissions(administrator=True)
+        self.guild = guild
+        self.bot = False
+        self.dms: list = []
+
+    def __str__(self):
+        return self.name
+
+    async def send(self, *args, **kwargs):
+        self.dms.append((args, kwargs))
+        return FakeMessage(None, *args, **kwargs)
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, view=None, **kwargs):
+        self.id = next(_ids)
+        self.channel = channel
+        self.content = content
+        self.embeds = [embed] if embed is not None else list(kwargs.get("embeds") or [])
+        self.view = view
+        self.edits = 0
+
+    async def edit(self, content=None, embed=None, view=None, **kwargs):
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+
+        self.view = view
+        self.edits += 1
+        return self
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int = None, guild=None, latency: float = 0.0):
+        self.id = channel_id or next(_ids)
+        self.guild = guild
+        self.latency = latency
+        self.sent: list[FakeMessage] = []
+
+    async def send(self, content=None, **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        msg = FakeMessage(self, content, **kwargs)
+        self.sent.append(msg)
+        return msg
+
+
+class FakeFollowup:
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def send(self, content=None, **kwargs):
+        msg = FakeMessage(self.owner.channel, content, **kwargs)
+        self.owner.replies.append(("followup", content, kwargs))
+        return msg
+
+
+class FakeResponse:
+    def __init__(self, owner):
+        self.owner = owner
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _mark(self):
+        if self._done:
+            raise RuntimeError("Interaction Already Responded")
+
+        self._done = True
+        self.owner.responded_at = time.perf_counter()
+
+    async def send_message(self, content=None, **kwargs):
+        self._mark()
+        self.owner.replies.append(("send_message", content, kwargs))
+
+    async def defer(self, ephemeral: bool = False, **kwargs):
+        self._mark()
+        self.owner.replies.append(("defer", None, {"ephemeral": ephemeral}))
+
+    async def edit_message(self, **kwargs):
+        self._mark()
+        if self.owner.message is not None:
+            await self.owner.message.edit(**kwargs)
+
+        self.owner.replies.append(("edit_message", None, kwargs))
+
+
+class FakeInteraction:
+    def __init__(self, user: FakeUser, channel: FakeChannel, message: FakeMessage = None):
+        self.id = next(_ids)
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id if channel.guild else None
+        self.message = message
+        self.created_at = time.perf_counter()
+        self.responded_at: float | None = None
+        self.replies: list = []
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+
+    async def edit_original_response(self, **kwargs):
+        if self.message is not None:
+            await self.message.edit(**kwargs)
+
+        self.replies.append(("edit_original_response", None, kwargs))
+
+
+class FakeContext:
+    def __init__(self, bot, user: FakeUser, channel: FakeChannel, command=None):
+        self.bot = bot
+        self.author = user
+        self.user = user
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild = channel.guild
+        self.guild_id = channel.guild.id if channel.guild else None
+        self.interaction = FakeInteraction(user, channel)
+        self.followup = self.interaction.followup
+        self.command = command
+
+    @property
+    def replies(self):
+        return self.interaction.replies
+
+    @property
+    def response(self):
+        return self.interaction.response
+
+    async def defer(self, ephemeral: bool = False, **kwargs):
+        if not self.interaction.response.is_done():
+            await self.interaction.response.defer(ephemeral=ephemeral)
+
+    async def respond(self, content=None, **kwargs):
+        if not self.interaction.response.is_done():
+            return await self.interaction.response.send_message(content, **kwargs)
+
+        return await self.followup.send(content, **kwargs)
+
+
+class FakeBot:
+    def __init__(self):
+        self.user = FakeUser(name="AstrumOtaku")
+        self.latency = 0.05
+        self.guilds: list[FakeGuild] = []
+        self.channels: dict[int, FakeChannel] = {}
+        self.cogs: dict = {}
+        self._never = asyncio.Event()
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    async def wait_until_ready(self):
+        # Background Loops Stay Parked - Scenarios Drive Them Explicitly
+        await self._never.wait()
+
+    def add_channel(self, channel: FakeChannel) -> FakeChannel:
+        self.channels[channel.id] = channel
+        if channel.guild is not None and channel.guild not in self.guilds:
+            self.guilds.append(channel.guild)
+        return channel
+
+    def get_channel(self, channel_id):
+        return self.channels.get(int(channel_id))
+
+    async def fetch_channel(self, channel_id):
+        return self.get_channel(channel_id)
+
+    def get_user(self, user_id):
+        return None
+
+    async def fetch_user(self, user_id):
+        return FakeUser(int(user_id))
+
+    def add_cog(self, cog):
+        self.cogs[type(cog).__name__] = cog
+
+    def add_listener(self, *args, **kwargs):
+        pass
+
+
+# ───── FAKE UPSTREAMS ─────
+
+WAIFU_TAGS = [
+    "maid",
+    "waifu",
+    "marin-kitagawa",
+    "mori-calliope",
+    "raiden-shogun",
+    "oppai",
+    "selfies",
+    "uniform",
+    "kamisato-ayaka",
+]
+SHOWS = ["Naruto", "One Piece", "Fullmetal Alchemist", "Bleach", "Steins;Gate"]
+CHARACTERS = ["Itachi Uchiha", "Monkey D. Luffy", "Edward Elric", "Ichigo", "Okabe"]
+
+
+@dataclass
+class UpstreamStats:
+    requests: dict = field(default_factory=dict)
+
+    def hit(self, route: str):
+        self.requests[route] = self.requests.get(route, 0) + 1
+
+
+class FakeUpstreams:
+    def __init__(self, delay: float = 0.0, image_pool: int = 0):
+        self.delay = delay
+        self.image_pool = image_pool
+        self.stats = UpstreamStats()
+        self.base_url = ""
+        self._runner: web.AppRunner | None = None
+        self._image_ids = itertools.count(1)
+        self._quotes = [
+            {
+                "quote": f"Quote {i} Of {CHARACTERS[i % len(CHARACTERS)]}",
+                "character": CHARACTERS[i % len(CHARACTERS)],
+                "show": SHOWS[i % len(SHOWS)],
+            }
+            for i in range(500)
+        ]
+        self._rss_generation = 0
+
+    def _image(self, tag: str, nsfw: bool) -> dict:
+        if self.image_pool:
+            image_id = random.randint(1, self.image_pool)
+        else:
+            image_id = next(self._image_ids)
+
+        return {
+            "image_id": image_id,
+            "signature": f"sig{image_id}",
+            "url": f"https://cdn.invalid/images/{image_id}.jpg",
+            "preview_url": f"https://cdn.invalid/preview/{image_id}.jpg",
+            "source": f"https://source.invalid/{image_id}",
+            "is_nsfw": nsfw,
+            "artist": {"name": f"artist{image_id % 50}", "twitter": None},
+            "tags": [{"name": tag}],
+        }
+
+    async def _pause(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+    async def waifu_search(self, request):
+        self.stats.hit("waifu.im")
+        await self._pause()
+
+        tag = request.query.get("included_tags", "waifu")
+        nsfw = request.query.get("is_nsfw") == "true"
+        count = 30 if request.query.get("many") == "true" else 1
+        return web.json_response(
+            {"images": [self._image(tag, nsfw) for _ in range(count)]}
+        )
+
+    async def meme(self, request):
+        self.stats.hit("meme-api")
+        await self._pause()
+
+        n = random.randint(1, 10_000)
+        return web.json_response(
+            {
+                "url": f"https://cdn.invalid/memes/{n}.jpg",
+                "title": f"Meme {n}",
+                "postLink": f"https://reddit.invalid/{n}",
+                "author": "bench",
+            }
+        )
+
+    async def quotes(self, request):
+        self.stats.hit("yurippe")
+        await self._pause()
+
+        character = (request.query.get("character") or "").lower()
+        show = (request.query.get("show") or "").lower()
+        data = [
+            q
+            for q in self._quotes
+            if character in q["character"].lower() and show in q["show"].lower()
+        ]
+
+        if request.query.get("random") and data:
+            data = [random.choice(data)]
+
+        return web.json_response(data)
+
+    async def timetables(self, request):
+        self.stats.hit("animeschedule")
+        await self._pause()
+
+        now = time.time()
+        data = []
+        for i in range(400):
+            ts = now + (i - 200) * 1800
+            data.append(
+                {
+                    "title": f"Show {i}",
+                    "route": f"show-{i}",
+                    "episode_number": i % 12 + 1,
+                    "episodes": 12,
+                    "air_type": ("sub", "dub", "raw")[i % 3],
+                    "episode_date": time.strftime(
+                        "%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts)
+                    ),
+                }
+            )
+        return web.json_response(data)
+
+    async def rss(self, request):
+        self.stats.hit("animeschedule-rss")
+        await self._pause()
+
+        # Every Poll Publishes A Few New Items So Dedupe Work Stays Realistic
+        self._rss_generation += 1
+        items = []
+        for i in range(self._rss_generation * 3, self._rss_generation * 3 + 50):
+            items.append(
+                f"<item><title>Show {i} Episode 1</title>"
+                f"<link>https://animeschedule.invalid/anime/show-{i}</link>"
+                f"<guid>show-{i}-1</guid>"
+                f"<pubDate>{time.strftime('%a, %d %b %Y %H:%M:%S +0000', time.gmtime())}</pubDate>"
+                f"</item>"
+            )
+        body = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>'
+            + "".join(items)
+            + "</channel></rss>"
+        )
+        return web.Response(text=body, content_type="application/rss+xml")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/search", self.waifu_search)
+        app.router.add_get("/gimme/animememes", self.meme)
+        app.router.add_get("/api/quotes", self.quotes)
+        app.router.add_get("/api/v3/timetables", self.timetables)
+        app.router.add_get("/subrss.xml", self.rss)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def point_cogs_here(self):
+        import cogs.memes
+        import cogs.quotes
+        import cogs.waifu
+        import cogs.schedule
+
+        cogs.waifu.API_URL = f"{self.base_url}/search"
+        cogs.memes.API_URL = f"{self.base_url}/gimme/animememes"
+        cogs.quotes.API_BASE = f"{self.base_url}/api/quotes"
+        cogs.schedule.TIMETABLE_ENDPOINT = f"{self.base_url}/api/v3/timetables"
+        cogs.schedule.DEFAULT_CONFIG["rss_url"] = f"{self.base_url}/subrss.xml"
+
+
+# ───── WORKSPACE ─────
+
+
+class Workspace:
+    # Cogs Use Relative Paths For Their DB And Configs, So Run Inside A Temp Dir
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="astrum-bench-")
+        self._cwd = os.getcwd()
+
+    def __enter__(self):
+        os.chdir(self._tmp.name)
+        for name, cfg in (
+            ("memesConfig.json", {"enabled": False, "channel_id": []}),
+            ("quotesConfig.json", {"enabled": False, "channel_id": []}),
+            ("scheduleConfig.json", {"enabled": False, "channel_id": []}),
+        ):
+            with open(name, "w", encoding="utf-8") as f:
+                json.dump(cfg, f)
+        return self._tmp.name
+
+    def __exit__(self, *exc):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+
+# ───── MEASUREMENT ─────
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+@dataclass
+class Result:
+    name: str
+    ops: int
+    elapsed: float
+    latencies: list[float]
+    errors: int = 0
+    notes: str = ""
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.elapsed if self.elapsed else 0.0
+
+    def row(self) -> str:
+        ms = [x * 1000 for x in self.latencies]
+        mean = statistics.fmean(ms) if ms else 0.0
+        return (
+            f"{self.name:<22} {self.ops:>7} {self.ops_per_sec:>10.1f} "
+            f"{percentile(ms, 50):>9.2f} {percentile(ms, 99):>9.2f} "
+            f"{mean:>9.2f} {self.errors:>6}  {self.notes}"
+        )
+
+
+HEADER = (
+    f"{'scenario':<22} {'ops':>7} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+    f"{'mean ms':>9} {'errors':>6}"
+)
+
+
+async def run_concurrent(name: str, factory, ops: int, concurrency: int) -> Result:
+    latencies: list[float] = []
+    errors = 0
+    counter = itertools.count()
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        nonlocal errors
+        i = next(counter)
+        async with sem:
+            start = time.perf_counter()
+            try:
+                await factory(i)
+            except Exception:
+                errors += 1
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(ops)))
+    return Result(name, ops, time.perf_counter() - start, latencies, errors)
@@ -4,6 +4,7 @@ import discord
 import datetime
 from dotenv import load_dotenv
 from discord.ext import commands
+from extensions import metrics, runtime, watchdog
 from extensions.database import database
 from extensions.logger import setup_logger
 
@@ -11,9 +12,9 @@ from extensions.logger import setup_logger
 load_dotenv()
 logger = setup_logger()
 
-intents = discord.Intents.default()
-
-bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+bot = commands.Bot(command_prefix="!", help_command=None, **runtime.bot_options())
+metrics.install(bot)
+runtime.install(bot)
 
 
 @bot.event
@@ -36,6 +37,9 @@ async def on_ready():
     logger.info("Database Setup Complete")
 
     logger.info("-------------------------------")
+    for line in runtime.format_report(bot).splitlines():
+        logger.info(line)
+    logger.info("-------------------------------")
 
     await bot.change_presence(activity=discord.Game("With Waifus ❤️"))
 
@@ -45,12 +49,15 @@ async def load_extensions():
     bot.load_extension("cogs.waifu")
     bot.load_extension("cogs.memes")
     bot.load_extension("cogs.quotes")
+    bot.load_extension("cogs.schedule")
     bot.load_extension("cogs.config")
 
 
 async def main():
     async with bot:
         await load_extensions()
+        watchdog.start()
+        await metrics.start(bot)
         await bot.start(os.getenv("TOKEN"))
 
 
@@ -4,31 +4,27 @@ import discord
 from discord import option
 from discord.ext import commands
 from extensions.logger import setup_logger
+from extensions.rarity import RARITY_NAMES
+from extensions.jobstore import CATCH_UP_POLICIES, SKIP
+from extensions.ratelimit import LIMITED_COMMANDS, SCOPES, get_rate_limiter
 
 logger = setup_logger(__name__)
 
 MEME_CONFIG_PATH = "memesConfig.json"
-WAIFU_CONFIG_PATH = "waifuConfig.json"
 QUOTES_CONFIG_PATH = "quotesConfig.json"
 
 MEME_DEFAULT_CONFIG = {
     "enabled": False,
     "channel_id": [],
     "interval_minutes": 60,
-}
-
-WAIFU_DEFAULT_CONFIG = {
-    "enabled": True,
-    "channel_id": [],
-    "interval_minutes": 60,
-    "only_spawner": False,
-    "owner_id": [727012870683885578],
+    "catch_up": SKIP,
 }
 
 DEFAULT_QUOTES_CONFIG = {
     "enabled": False,
     "channel_id": [],
     "interval_minutes": 60,
+    "catch_up": SKIP,
 }
 
 
@@ -61,13 +57,21 @@ class Config(commands.Cog):
     meme = config.create_subgroup("meme", "Configure Meme Posting")
     waifu = config.create_subgroup("waifu", "Configure Waifu Posting")
     quote = config.create_subgroup("quote", "Configure Quote Posting")
+    ratelimit = config.create_subgroup("ratelimit", "Configure Command Rate Limits")
 
     def __init__(self, bot):
         self.bot = bot
         self.meme_config = load_config(MEME_CONFIG_PATH, MEME_DEFAULT_CONFIG)
-        self.waifu_config = load_config(WAIFU_CONFIG_PATH, WAIFU_DEFAULT_CONFIG)
         self.quotes_config = load_config(QUOTES_CONFIG_PATH, DEFAULT_QUOTES_CONFIG)
 
+        # Per-Guild Rate Limit Overrides Share The Waifu Cog's guild_config Table
+        cog = self.waifu_cog()
+        if cog:
+            try:
+                get_rate_limiter(bot).load_guilds(cog.db.get_ratelimit_configs())
+            except Exception:
+                logger.exception("Failed Loading Guild Rate Limits")
+
     async def update_and_confirm_meme(self, ctx, updates: dict):
         self.meme_config.update(updates)
         save_config(self.meme_config, MEME_CONFIG_PATH)
@@ -96,9 +100,17 @@ class Config(commands.Cog):
             ephemeral=True,
         )
 
+    def waifu_cog(self):
+        # Waifu Spawn Settings Are Per Guild And Live In The Waifu Cog's Database
+        cog = self.bot.get_cog("Waifu")
+        return cog if cog and cog.db else None
+
     async def update_and_confirm_waifu(self, ctx, updates: dict):
-        self.waifu_config.update(updates)
-        save_config(self.waifu_config, WAIFU_CONFIG_PATH)
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        cog.update_spawn_config(ctx.guild_id, updates)
 
         desc = "\n".join([f"**{k}** -> **{v}**" for k, v in updates.items()])
         await ctx.respond(
@@ -132,12 +144,19 @@ class Config(commands.Cog):
     @option(
         "interval", int, description="Interval In Minutes (10 Minutes)", required=False
     )
+    @option(
+        "catch_up",
+        description="What To Do With Posts Missed While The Bot Was Down",
+        required=False,
+        choices=list(CATCH_UP_POLICIES),
+    )
     async def meme_set(
         self,
         ctx: discord.ApplicationContext,
         toggle: str = None,
         channel: discord.TextChannel = None,
         interval: int = None,
+        catch_up: str = None,
     ):
         if not ctx.user.guild_permissions.administrator:
             return await ctx.respond(
@@ -163,6 +182,9 @@ class Config(commands.Cog):
                 )
             updates["interval_minutes"] = interval
 
+        if catch_up is not None:
+            updates["catch_up"] = catch_up
+
         if updates:
             await self.update_and_confirm_meme(ctx, updates)
         else:
@@ -190,6 +212,7 @@ class Config(commands.Cog):
         embed.add_field(name="Enabled", value=str(cfg["enabled"]))
         embed.add_field(name="Channel", value=channel)
         embed.add_field(name="Interval", value=f"{cfg['interval_minutes']} minutes")
+        embed.add_field(name="Catch Up", value=cfg.get("catch_up") or SKIP)
 
         await ctx.respond(embed=embed, ephemeral=True)
 
@@ -210,12 +233,19 @@ class Config(commands.Cog):
     @option(
         "interval", int, description="Interval In Minutes (10 Minutes)", required=False
     )
+    @option(
+        "catch_up",
+        description="What To Do With Posts Missed While The Bot Was Down",
+        required=False,
+        choices=list(CATCH_UP_POLICIES),
+    )
     async def waifu_set(
         self,
         ctx: discord.ApplicationContext,
         toggle: str = None,
         channel: discord.TextChannel = None,
         interval: int = None,
+        catch_up: str = None,
     ):
         if not ctx.user.guild_permissions.administrator:
             return await ctx.respond(
@@ -227,7 +257,11 @@ class Config(commands.Cog):
             updates["enabled"] = toggle.lower() == "true"
 
         if channel is not None:
-            current = self.waifu_config.get("channel_id") or []
+            cog = self.waifu_cog()
+            if not cog:
+                return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+            current = list(cog.get_spawn_config(ctx.guild_id).get("channel_id") or [])
 
             if channel.id not in current:
                 current.append(channel.id)
@@ -241,6 +275,9 @@ class Config(commands.Cog):
                 )
             updates["interval_minutes"] = interval
 
+        if catch_up is not None:
+            updates["catch_up"] = catch_up
+
         if updates:
             await self.update_and_confirm_waifu(ctx, updates)
         else:
@@ -253,11 +290,84 @@ class Config(commands.Cog):
                 "❌ You Need **Admin** Permissions To Do This.", ephemeral=True
             )
 
-        await self.update_and_confirm_waifu(ctx, WAIFU_DEFAULT_CONFIG)
+        from cogs.waifu import DEFAULT_CONFIG
+
+        await self.update_and_confirm_waifu(ctx, dict(DEFAULT_CONFIG))
+
+    @waifu.command(name="repair", description="Recount Every User's Waifus From Claims")
+    async def waifu_repair(self, ctx):
+        if not ctx.user.guild_permissions.administrator:
+            return await ctx.respond(
+                "❌ You Need **Admin** Permissions To Do This.", ephemeral=True
+            )
+
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        try:
+            repaired = cog.db.reconcile_waifu_counts()
+        except Exception:
+            logger.exception("Failed Reconciling Waifu Counts")
+            return await ctx.respond("❌ Failed To Repair Waifu Counts.", ephemeral=True)
+
+        await ctx.respond(
+            embed=discord.Embed(
+                title="🛠️ Waifu Counts Repaired",
+                description=f"Fixed **{repaired}** User(s).",
+                color=discord.Color.green(),
+            ),
+            ephemeral=True,
+        )
+
+    @waifu.command(name="weight", description="Set Spawn Weight For A Tag Or Rarity")
+    @option("kind", description="What To Weight", choices=["tag", "rarity"])
+    @option("name", description="Tag Or Rarity Name")
+    @option("weight", float, description="Relative Weight (0 Disables)")
+    async def waifu_weight(
+        self, ctx: discord.ApplicationContext, kind: str, name: str, weight: float
+    ):
+        if not ctx.user.guild_permissions.administrator:
+            return await ctx.respond(
+                "❌ You Need **Admin** Permissions To Do This.", ephemeral=True
+            )
+
+        from cogs.waifu import NWAIFU_CATEGORIES, WAIFU_CATEGORIES
+
+        if kind == "rarity":
+            valid = RARITY_NAMES
+            name = name.strip().capitalize()
+        else:
+            valid = WAIFU_CATEGORIES + NWAIFU_CATEGORIES
+            name = name.strip().lower()
+
+        if name not in valid:
+            return await ctx.respond(
+                f"⚠️ Unknown {kind.capitalize()}. Choose From : {', '.join(valid)}",
+                ephemeral=True,
+            )
+
+        if weight < 0:
+            return await ctx.respond("⚠️ Weight Can't Be Negative.", ephemeral=True)
+
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        key = f"{kind}_weights"
+        # Copy Before Editing - Nested Defaults Are Shared Dicts
+        weights = dict(cog.get_spawn_config(ctx.guild_id).get(key) or {})
+        weights[name] = weight
+
+        await self.update_and_confirm_waifu(ctx, {key: weights})
 
     @waifu.command(name="show", description="Show Current Waifu Config")
     async def waifu_show(self, ctx):
-        cfg = self.waifu_config
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        cfg = cog.get_spawn_config(ctx.guild_id)
         chlist = cfg.get("channel_id") or []
         channel = ", ".join([f"<#{c}>" for c in chlist]) if chlist else "Not Set"
 
@@ -268,6 +378,17 @@ class Config(commands.Cog):
         embed.add_field(name="Enabled", value=str(cfg["enabled"]))
         embed.add_field(name="Channel", value=channel)
         embed.add_field(name="Interval", value=f"{cfg['interval_minutes']} minutes")
+        embed.add_field(name="Catch Up", value=cfg.get("catch_up") or SKIP)
+
+        for kind in ("tag", "rarity"):
+            weights = cfg.get(f"{kind}_weights") or {}
+            if weights:
+                embed.add_field(
+                    name=f"{kind.capitalize()} Weights",
+                    value=", ".join(f"{k} : {v:g}" for k, v in weights.items()),
+                    inline=False,
+                )
+
         await ctx.respond(embed=embed, ephemeral=True)
 
     # ───── QUOTES CONFIG ─────
@@ -287,12 +408,19 @@ class Config(commands.Cog):
     @option(
         "interval", int, description="Interval In Minutes (10 Minutes)", required=False
     )
+    @option(
+        "catch_up",
+        description="What To Do With Posts Missed While The Bot Was Down",
+        required=False,
+        choices=list(CATCH_UP_POLICIES),
+    )
     async def quote_set(
         self,
         ctx: discord.ApplicationContext,
         toggle: str = None,
         channel: discord.TextChannel = None,
         interval: int = None,
+        catch_up: str = None,
     ):
         if not ctx.user.guild_permissions.administrator:
             return await ctx.respond(
@@ -318,6 +446,9 @@ class Config(commands.Cog):
                 )
             updates["interval_minutes"] = interval
 
+        if catch_up is not None:
+            updates["catch_up"] = catch_up
+
         if updates:
             await self.update_and_confirm_quotes(ctx, updates)
         else:
@@ -345,6 +476,138 @@ class Config(commands.Cog):
         embed.add_field(name="Enabled", value=str(cfg["enabled"]))
         embed.add_field(name="Channel", value=channel)
         embed.add_field(name="Interval", value=f"{cfg['interval_minutes']} minutes")
+        embed.add_field(name="Catch Up", value=cfg.get("catch_up") or SKIP)
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    # ───── RATE LIMIT CONFIG ─────
+    async def update_and_confirm_ratelimit(self, ctx, updates: dict):
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        # Only This Guild's Overrides Change - Other Guilds Keep Their Own
+        limiter = get_rate_limiter(self.bot)
+        cfg = {**limiter.guild_config(ctx.guild_id), **updates}
+        cog.db.set_ratelimit_config(ctx.guild_id, cfg)
+        limiter.set_guild(ctx.guild_id, cfg)
+
+        desc = "\n".join([f"**{k}** → **{v}**" for k, v in updates.items()])
+        await ctx.respond(
+            embed=discord.Embed(
+                title="⚙️ Rate Limit Config Updated",
+                description=desc,
+                color=discord.Color.green(),
+            ),
+            ephemeral=True,
+        )
+
+    @ratelimit.command(name="set", description="Set Token Bucket Limits")
+    @option(
+        "toggle",
+        description="Enable/Disable Rate Limiting",
+        required=False,
+        choices=["true", "false"],
+    )
+    @option(
+        "command",
+        description="Command To Limit (default Covers The Rest)",
+        required=False,
+        choices=["default", *LIMITED_COMMANDS],
+        default="default",
+    )
+    @option(
+        "scope",
+        description="Limit Each User Or The Whole Server",
+        required=False,
+        choices=list(SCOPES),
+        default="user",
+    )
+    @option("per_minute", int, description="Tokens Refilled Per Minute", required=False)
+    @option(
+        "burst", int, description="Bucket Size (0 Removes The Limit)", required=False
+    )
+    async def ratelimit_set(
+        self,
+        ctx: discord.ApplicationContext,
+        toggle: str = None,
+        command: str = "default",
+        scope: str = "user",
+        per_minute: int = None,
+        burst: int = None,
+    ):
+        if not ctx.user.guild_permissions.administrator:
+            return await ctx.respond(
+                "❌ You Need **Admin** Permissions To Do This.", ephemeral=True
+            )
+
+        limiter = get_rate_limiter(self.bot)
+        updates = {}
+        if toggle is not None:
+            updates["enabled"] = toggle.lower() == "true"
+
+        if per_minute is not None or burst is not None:
+            if (per_minute or 0) < 0 or (burst or 0) < 0:
+                return await ctx.respond("⚠️ Limits Can't Be Negative.", ephemeral=True)
+
+            rate, size = limiter.limit(command, scope, ctx.guild_id)
+            rule = [
+                per_minute if per_minute is not None else round(rate * 60, 2),
+                burst if burst is not None else int(size),
+            ]
+
+            # Copy Before Editing - The Limiter Still Holds The Current Dicts
+            own = limiter.guild_config(ctx.guild_id).get("limits") or {}
+            limits = {k: dict(v) for k, v in own.items()}
+            limits.setdefault(command, {})[scope] = rule
+            updates["limits"] = limits
+
+        if updates:
+            await self.update_and_confirm_ratelimit(ctx, updates)
+        else:
+            await ctx.respond("⚠️ No Changes Provided.", ephemeral=True)
+
+    @ratelimit.command(name="clear", description="Reset Rate Limits To Defaults")
+    async def ratelimit_clear(self, ctx):
+        if not ctx.user.guild_permissions.administrator:
+            return await ctx.respond(
+                "❌ You Need **Admin** Permissions To Do This.", ephemeral=True
+            )
+
+        cog = self.waifu_cog()
+        if not cog:
+            return await ctx.respond("❌ Database Unavailable.", ephemeral=True)
+
+        cog.db.set_ratelimit_config(ctx.guild_id, None)
+        get_rate_limiter(self.bot).set_guild(ctx.guild_id, None)
+
+        await ctx.respond(
+            embed=discord.Embed(
+                title="⚙️ Rate Limit Config Reset",
+                description="This Server Uses The Bot's Default Limits Again.",
+                color=discord.Color.green(),
+            ),
+            ephemeral=True,
+        )
+
+    @ratelimit.command(name="show", description="Show Current Rate Limits")
+    async def ratelimit_show(self, ctx):
+        limiter = get_rate_limiter(self.bot)
+
+        embed = discord.Embed(
+            title="⚙️ Rate Limit Config",
+            color=discord.Color.blurple(),
+        )
+        embed.add_field(name="Enabled", value=str(limiter.enabled(ctx.guild_id)))
+
+        for command in ("default", *LIMITED_COMMANDS):
+            lines = []
+            for scope in SCOPES:
+                rate, burst = limiter.limit(command, scope, ctx.guild_id)
+                value = f"{rate * 60:g}/min, Burst {burst:g}" if burst else "Unlimited"
+                lines.append(f"{scope.capitalize()} : {value}")
+
+            embed.add_field(name=f"/{command}", value="\n".join(lines), inline=False)
+
         await ctx.respond(embed=embed, ephemeral=True)
 
 
@@ -1,14 +1,20 @@
 import json
 import random
-import asyncio
 import discord
 import aiohttp
 from discord.ext import commands, tasks
 from extensions.logger import setup_logger
+from extensions.sendqueue import get_send_queue
+from extensions.jobstore import SKIP, get_job_store
+from extensions.ratelimit import rate_limited
+from extensions.interactions import ack_budget, respond
+from extensions import resilience
+from extensions.resilience import UpstreamError
 
 logger = setup_logger(__name__)
 
 API_URL = "https://meme-api.com/gimme/animememes"
+API_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3)
 
 CONFIG_PATH = "memesConfig.json"
 
@@ -16,8 +22,13 @@ DEFAULT_CONFIG = {
     "enabled": False,
     "channel_id": [],
     "interval_minutes": 60,
+    # Missed Posts After A Restart : skip / run-once / run-all
+    "catch_up": SKIP,
 }
 
+# How Often The Auto-Post Loop Checks Which Channels Are Due
+JOB_TICK = 30
+
 
 def load_config():
     try:
@@ -54,15 +65,20 @@ class AnimeMemes(commands.Cog):
     def cog_unload(self):
         self.auto_task.cancel()
 
+    async def _request_meme(self):
+        async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
+            async with session.get(API_URL) as resp:
+                if resp.status != 200:
+                    raise UpstreamError("meme-api", resp.status)
+
+                return await resp.json()
+
     async def fetch_meme(self):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(API_URL, timeout=10) as resp:
-                    if resp.status != 200:
-                        raise ValueError(f"API Returned {resp.status}")
-
-                    data = await resp.json()
-                    return data["url"], data["title"], data["postLink"], data["author"]
+            data = await resilience.call(
+                "meme-api", self._request_meme, timeout=API_TIMEOUT.total
+            )
+            return data["url"], data["title"], data["postLink"], data["author"]
 
         except Exception as e:
             logger.warning("Meme API Failed, Falling Back : %s", e)
@@ -110,32 +126,38 @@ class AnimeMemes(commands.Cog):
         return embed
 
     @discord.slash_command(name="meme", description="Get A Random Anime Meme")
+    @ack_budget("meme")
+    @rate_limited("meme")
     async def animeme_cmd(self, ctx: discord.ApplicationContext):
         try:
-            await ctx.defer()
             img_url, title, post_url, author = await self.fetch_meme()
             embed = await self.make_embed(ctx, img_url, title, post_url, author)
 
-            await ctx.respond(embed=embed)
+            await respond(ctx, embed=embed)
             logger.info(f"Sent Meme To {ctx.author.name}")
 
         except Exception as e:
             logger.exception("Error In Meme Command : %s", e)
-            await ctx.respond(
+            await respond(
+                ctx,
                 embed=discord.Embed(
                     title="❌ Error",
                     description=f"An Error Occurred While Fetching A Meme.\n```{e}```",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
-    @tasks.loop(hours=1)
+    @tasks.loop(seconds=JOB_TICK)
     async def auto_task(self):
         try:
             cfg = self.config
             if not cfg.get("enabled") or not cfg.get("channel_id", []):
                 return
 
+            jobs = get_job_store(self.bot)
+            interval = max(10, int(cfg.get("interval_minutes", 180))) * 60
+            policy = cfg.get("catch_up") or SKIP
+
             for channel_id in cfg.get("channel_id", []):
                 channel = self.bot.get_channel(channel_id)
                 if not channel:
@@ -144,16 +166,15 @@ class AnimeMemes(commands.Cog):
                     save_config(cfg)
                     return
 
-                img_url, title, post_url, author = await self.fetch_meme()
-                embed = await self.make_embed(channel, img_url, title, post_url, author)
-
-                await channel.send(embed=embed)
-                logger.info(f"Auto Posted Meme To {channel.id}")
+                # Due Times Survive Restarts - No Burst Of Posts On Startup
+                for _ in range(jobs.take("memes", channel_id, interval, policy)):
+                    img_url, title, post_url, author = await self.fetch_meme()
+                    embed = await self.make_embed(
+                        channel, img_url, title, post_url, author
+                    )
 
-                interval = max(10, int(cfg.get("interval_minutes", 180)))
-                extra = interval - 5
-                if extra > 0:
-                    await asyncio.sleep(extra * 60)
+                    await get_send_queue(self.bot).send(channel, embed=embed)
+                    logger.info(f"Auto Posted Meme To {channel.id}")
 
         except Exception:
             logger.exception("Error In Auto Meme Task")
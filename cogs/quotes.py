@@ -1,24 +1,76 @@
 import json
 import random
 import asyncio
+import itertools
 import discord
 import aiohttp
 from discord import option
 from discord.ext import commands, tasks
 from extensions.logger import setup_logger
+from extensions.quotestore import QuoteStore, split_filters
+from extensions.sendqueue import get_send_queue
+from extensions.jobstore import SKIP, get_job_store
+from extensions.ratelimit import rate_limited
+from extensions.interactions import ack_budget, respond
+from extensions.metrics import CACHE_REQUESTS
+from extensions import resilience, runtime
+from extensions.resilience import UpstreamError
 
 logger = setup_logger(__name__)
 
 API_BASE = "https://yurippe.vercel.app/api/quotes"
+API_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
 
 CONFIG_PATH = "quotesConfig.json"
+CORPUS_PATH = "quotesCorpus.json"
+
+# Upper Bound On Upstream Calls For One Multi-Filter Lookup
+MAX_FILTER_QUERIES = 4
+
+FALLBACK_QUOTES = [
+    (
+        "People’s lives don’t end when they die, it ends when they lose faith.",
+        "Itachi Uchiha",
+        "Naruto",
+    ),
+    (
+        "Whatever you lose, you’ll find it again. But what you throw away you’ll never get back.",
+        "Kenshin Himura",
+        "Rurouni Kenshin",
+    ),
+    (
+        "A lesson without pain is meaningless.",
+        "Edward Elric",
+        "Fullmetal Alchemist",
+    ),
+    (
+        "When you hit the point of no return, that’s the moment it truly becomes a journey.",
+        "Hinata Miyake",
+        "A Place Further Than The Universe",
+    ),
+    (
+        "If you don’t take risks, you can’t create a future.",
+        "Monkey D. Luffy",
+        "One Piece",
+    ),
+    (
+        "The world isn’t perfect. But it’s there for us, doing the best it can. That’s what makes it so damn beautiful.",
+        "Roy Mustang",
+        "Fullmetal Alchemist",
+    ),
+]
 
 DEFAULT_CONFIG = {
     "enabled": False,
     "channel_id": [],
     "interval_minutes": 60,
+    # Missed Posts After A Restart : skip / run-once / run-all
+    "catch_up": SKIP,
 }
 
+# How Often The Auto-Post Loop Checks Which Channels Are Due
+JOB_TICK = 30
+
 
 def load_config():
     try:
@@ -47,70 +99,104 @@ class Quotes(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config = load_config()
+        self.store = QuoteStore(CORPUS_PATH, seed=FALLBACK_QUOTES)
+        runtime.register_cache(
+            "quote_store", lambda: runtime.estimate(self.store.quotes)
+        )
+        runtime.register_cache("quote_characters_trie", self.store.characters.sizes)
+        runtime.register_cache("quote_shows_trie", self.store.shows.sizes)
         self.auto_task.start()
+        self.sync_task.start()
 
     def cog_unload(self):
         self.auto_task.cancel()
+        self.sync_task.cancel()
+        for name in ("quote_store", "quote_characters_trie", "quote_shows_trie"):
+            runtime.unregister_cache(name)
+
+    async def _request_quotes(self, params: dict, retries: int = 0) -> list:
+        async def _request():
+            async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
+                async with session.get(API_BASE, params=params) as resp:
+                    if resp.status != 200:
+                        raise UpstreamError("yurippe", resp.status)
+
+                    return await resp.json()
+
+        data = await resilience.call(
+            "yurippe", _request, timeout=API_TIMEOUT.total, retries=retries
+        )
+
+        return data if isinstance(data, list) else []
 
     async def fetch_quote(self, character=None, show=None, random_one=True):
-        params = {}
-        if character:
-            params["character"] = character
-        if show:
-            params["show"] = show
-        if random_one:
-            params["random"] = "1"
+        characters = split_filters(character)
+        shows = split_filters(show)
+
+        # Serve From The Local Corpus Whenever It Can Answer
+        if characters or shows or self.store.synced:
+            local = self.store.random_quote(characters, shows)
+            if local:
+                CACHE_REQUESTS.inc(cache="quotes", result="hit")
+                return local
+
+        CACHE_REQUESTS.inc(cache="quotes", result="miss")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(API_BASE, params=params, timeout=10) as resp:
-                    if resp.status != 200:
-                        raise ValueError(f"API Returned {resp.status}")
+            data = []
+            joined = False
+            for c, s in itertools.islice(
+                itertools.product(characters or [None], shows or [None]),
+                MAX_FILTER_QUERIES,
+            ):
+                params = {}
+                if c:
+                    params["character"] = c
+                if s:
+                    params["show"] = s
+                if random_one and not (c or s):
+                    params["random"] = "1"
 
-                    data = await resp.json()
+                try:
+                    # Identical Concurrent Queries Share One Request
+                    rows, leader = await resilience.coalesce(
+                        "yurippe", params, lambda: self._request_quotes(params)
+                    )
+                    data.extend(rows)
+                    joined = joined or not leader
+                except UpstreamError as e:
+                    # A 404 For One Filter Shouldn't Sink The Others
+                    if e.transient or not (c or s):
+                        raise
 
-                    if not isinstance(data, list) or not data:
-                        raise ValueError("Unexpected API Response")
+            # Saved By The Next Full Sync - The File Only Ever Holds A Synced Corpus
+            self.store.merge(data)
 
-                    chosen = random.choice(data)
-                    return chosen["quote"], chosen["character"], chosen["show"]
+            if characters or shows:
+                local = self.store.random_quote(characters, shows)
+                if local:
+                    return local
+
+            if not data:
+                raise ValueError("No Quotes Returned")
+
+            # Joiners Of A Shared Random Fetch Take Another Quote From The Corpus
+            if joined and not (characters or shows):
+                local = self.store.random_quote()
+                if local:
+                    return local
+
+            chosen = random.choice(data)
+            return chosen["quote"], chosen["character"], chosen["show"]
         except Exception as e:
             logger.warning("Quote API Failed, Falling Back : %s", e)
-            fallback = random.choice(
-                [
-                    (
-                        "People’s lives don’t end when they die, it ends when they lose faith.",
-                        "Itachi Uchiha",
-                        "Naruto",
-                    ),
-                    (
-                        "Whatever you lose, you’ll find it again. But what you throw away you’ll never get back.",
-                        "Kenshin Himura",
-                        "Rurouni Kenshin",
-                    ),
-                    (
-                        "A lesson without pain is meaningless.",
-                        "Edward Elric",
-                        "Fullmetal Alchemist",
-                    ),
-                    (
-                        "When you hit the point of no return, that’s the moment it truly becomes a journey.",
-                        "Hinata Miyake",
-                        "A Place Further Than The Universe",
-                    ),
-                    (
-                        "If you don’t take risks, you can’t create a future.",
-                        "Monkey D. Luffy",
-                        "One Piece",
-                    ),
-                    (
-                        "The world isn’t perfect. But it’s there for us, doing the best it can. That’s what makes it so damn beautiful.",
-                        "Roy Mustang",
-                        "Fullmetal Alchemist",
-                    ),
-                ]
-            )
-            return fallback
+            return self.store.random_quote() or random.choice(FALLBACK_QUOTES)
+
+    async def _save_store(self):
+        try:
+            await asyncio.to_thread(self.store.save, list(self.store.quotes))
+        except Exception:
+            logger.exception("Failed Persisting Quote Corpus")
 
     async def make_embed(self, ctx_or_channel, quote, author, show=None):
         requester = getattr(ctx_or_channel, "author", None)
@@ -132,68 +218,78 @@ class Quotes(commands.Cog):
             embed.set_footer(text="Daily Dose Of Senpai Wisdom ✨")
         return embed
 
+    # Autocomplete Reads The Store's In-Memory Tries Only - No Upstream Or Disk
+    async def character_autocomplete(self, ctx: discord.AutocompleteContext):
+        return self.store.complete("character", ctx.value)
+
+    async def show_autocomplete(self, ctx: discord.AutocompleteContext):
+        return self.store.complete("show", ctx.value)
+
     @discord.slash_command(name="quote", description="Get A Random Anime Quote")
     @option(
         "character",
         description="Filter By Character ( Supports Multiple, Comma-Separated )",
         required=False,
+        autocomplete=character_autocomplete,
     )
     @option(
         "show",
         description="Filter By Anime / Show ( Supports Multiple, Comma-Separated )",
         required=False,
+        autocomplete=show_autocomplete,
     )
+    @ack_budget("quote")
+    @rate_limited("quote")
     async def quote_cmd(
         self, ctx: discord.ApplicationContext, character: str = None, show: str = None
     ):
         try:
-            await ctx.defer()
             quote, author, show_name = await self.fetch_quote(
                 character=character, show=show
             )
             embed = await self.make_embed(ctx, quote, author, show_name)
 
-            await ctx.respond(embed=embed)
+            await respond(ctx, embed=embed)
             logger.info(f"Sent Quote To {ctx.author.name}")
 
         except Exception as e:
             logger.exception("Error In Quote Command : %s", e)
-            await ctx.respond(
+            await respond(
+                ctx,
                 embed=discord.Embed(
                     title="❌ Error",
                     description=f"An Error Occurred While Fetching A Quote.\n```{e}```",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
-    @tasks.loop(hours=1)
+    @tasks.loop(seconds=JOB_TICK)
     async def auto_task(self):
         try:
             cfg = self.config
             if not cfg.get("enabled") or not cfg.get("channel_id", []):
                 return
-            
+
+            jobs = get_job_store(self.bot)
+            interval = max(10, int(cfg.get("interval_minutes", 180))) * 60
+            policy = cfg.get("catch_up") or SKIP
+
             for channel_id in cfg.get("channel_id", []):
                 channel = self.bot.get_channel(channel_id)
-
                 if not channel:
                     logger.warning("Configured Quotes Channel Not Found - Disabling")
                     cfg["enabled"] = False
                     save_config(cfg)
                     return
-                
-                quote, author, show = await self.fetch_quote()
-                embed = await self.make_embed(channel, quote, author, show)
-                
-                await channel.send(embed=embed)
-                
-                logger.info(f"Auto Posted Quote To {channel.id}")
-                interval = max(10, int(cfg.get("interval_minutes", 180)))
-                extra = interval - 5
-                
-                if extra > 0:
-                    await asyncio.sleep(extra * 60)
-        
+
+                # Due Times Survive Restarts - No Burst Of Posts On Startup
+                for _ in range(jobs.take("quotes", channel_id, interval, policy)):
+                    quote, author, show = await self.fetch_quote()
+                    embed = await self.make_embed(channel, quote, author, show)
+
+                    await get_send_queue(self.bot).send(channel, embed=embed)
+                    logger.info(f"Auto Posted Quote To {channel.id}")
+
         except Exception:
             logger.exception("Error In Auto Quote Task")
 
@@ -201,6 +297,24 @@ class Quotes(commands.Cog):
     async def before_auto(self):
         await self.bot.wait_until_ready()
 
+    @tasks.loop(hours=6)
+    async def sync_task(self):
+        try:
+            data = await self._request_quotes({}, retries=2)
+            added = self.store.merge(data)
+            if data:
+                # Also Persists Whatever Filtered Lookups Merged Since The Last Sync
+                self.store.synced = True
+                await self._save_store()
+
+            logger.info(f"Quote Corpus Synced : {added} New, {len(self.store)} Total")
+        except Exception as e:
+            logger.warning("Quote Corpus Sync Failed : %s", e)
+
+    @sync_task.before_loop
+    async def before_sync(self):
+        await self.bot.wait_until_ready()
+
 
 def setup(bot):
     logger.info("Loaded : Quotes Cog")
@@ -1,27 +1,70 @@
 import os
 import json
+import time
+import asyncio
 import aiohttp
 import discord
 import datetime
 from dotenv import load_dotenv
 import feedparser
+from discord import option
 from discord.ext import commands, tasks
 from typing import Any, Dict, List, Optional, Tuple
 
 from extensions.logger import setup_logger
+from extensions import resilience
+from extensions.resilience import CircuitOpenError, UpstreamError
+from extensions.sendqueue import get_send_queue
+from extensions.jobstore import RUN_ONCE, get_job_store
+from extensions.interactions import ack_budget, respond
+from extensions.metrics import CACHE_REQUESTS
+from extensions.timerwheel import TimerWheel
+from extensions.watchlist import WatchStore
+from extensions.feeds import (
+    DEFAULT_FEED,
+    FEED_POLLS,
+    FeedState,
+    SeenStore,
+    entry_guid,
+    feed_config,
+    matches,
+)
 
 load_dotenv()
 logger = setup_logger(__name__)
 
 API_BASE = "https://animeschedule.net/api/v3/"
 TIMETABLE_ENDPOINT = API_BASE + "timetables"
+TIMETABLE_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3)
+RSS_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3)
 
 CONFIG_PATH = "scheduleConfig.json"
 
+DAY_SECONDS = 24 * 60 * 60
+
+# Timetable Responses Are Reused This Long By /schedule And The Watch Notifier
+TIMETABLE_TTL = 15 * 60
+
+# Watch Notifier Wheel : 30s Ticks x 2880 Slots = One Day Per Turn
+WATCH_TICK = 30
+WATCH_SLOTS = 2880
+
+MAX_WATCHES = 50
+MENTIONS_PER_MESSAGE = 80
+
+AIR_RANK = {"sub": 3, "dub": 2, "raw": 1}
+
+# RSS : The Loop Ticks Often, Feeds Are Only Fetched Once Their Own Interval Is Up
+RSS_TICK = 30
+RSS_CONCURRENCY = 4
+LEGACY_FEED = "animeschedule"
+
 DEFAULT_CONFIG = {
     "enabled": False,
     "channel_id": [],
     "post_time": "01:00",
+    # A Daily Post Missed While Down : skip / run-once / run-all
+    "catch_up": RUN_ONCE,
     "api_key": os.getenv("SCHEDULE"),
     # RSS related
     "rss_enabled": False,
@@ -29,7 +72,9 @@ DEFAULT_CONFIG = {
     "rss_interval_minutes": 5,
     "rss_channel_id": [],  # fallback to channel_id if empty
     "rss_post_limit": 5,
-    "rss_seen_guids": [],
+    # [{name, url, label, interval_minutes, channel_id, include, exclude,
+    #   namespace, post_limit, enabled}] - Overrides The rss_* Keys Above
+    "rss_feeds": [],
 }
 
 
@@ -140,27 +185,57 @@ def _weekday_name(weekday_int: int) -> str:
         return "Unknown"
 
 
+def _log_failed_ping(future: asyncio.Future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Watch Ping Failed : %s", future.exception())
+
+
 class Schedule(commands.Cog):
+    watch = discord.SlashCommandGroup("watch", "Get Pinged When Shows Air")
+
     def __init__(self, bot):
         self.bot = bot
         self.config = load_config()
-        self._last_post_date: Optional[datetime.date] = None
+        self._timetable: Optional[Tuple[float, List[Dict[str, Any]]]] = None
         self.auto_task.start()
-        # RSS runtime cache
-        self._rss_seen = set(self.config.get("rss_seen_guids", []) or [])
-        # Apply configured interval and start RSS polling
-        try:
-            interval_min = max(1, int(self.config.get("rss_interval_minutes", 5) or 5))
-        except Exception:
-            interval_min = 5
-        self.rss_task.change_interval(minutes=interval_min)
+
+        # Watchlists : Route -> Subscribers In SQLite, One Wheel Timer Per Airing
+        self.watches = WatchStore()
+        self.wheel = TimerWheel(WATCH_TICK, WATCH_SLOTS)
+        self._route_timers: Dict[str, set] = {}
+        self.watch_refresh_task.start()
+        self.watch_tick_task.start()
+
+        # RSS : Each Feed Keeps Its Own Interval, The Loop Just Checks Who's Due
+        self.rss_seen = SeenStore()
+        self._rss_state: Dict[str, FeedState] = {}
+        self._migrate_rss_seen()
         self.rss_task.start()
 
     def cog_unload(self):
         self.auto_task.cancel()
         self.rss_task.cancel()
-
-    async def fetch_timetable(self) -> Optional[List[Dict[str, Any]]]:
+        self.watch_refresh_task.cancel()
+        self.watch_tick_task.cancel()
+        self.watches.close()
+        self.rss_seen.close()
+
+    async def fetch_timetable(
+        self, max_age: float = TIMETABLE_TTL
+    ) -> Optional[List[Dict[str, Any]]]:
+        cached = self._timetable
+        if cached and time.monotonic() - cached[0] < max_age:
+            CACHE_REQUESTS.inc(cache="timetable", result="hit")
+            return cached[1]
+
+        CACHE_REQUESTS.inc(cache="timetable", result="miss")
+        data = await self._request_timetable()
+        if data:
+            self._timetable = (time.monotonic(), data)
+
+        return data
+
+    async def _request_timetable(self) -> Optional[List[Dict[str, Any]]]:
         headers = {"User-Agent": "AstrumOtaku"}
         api_key = self.config.get("api_key") or ""
 
@@ -169,26 +244,33 @@ class Schedule(commands.Cog):
             headers["Authorization"] = f"Bearer {api_key}"
             headers["X-API-Key"] = api_key
 
-        try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+        async def _request():
+            async with aiohttp.ClientSession(timeout=TIMETABLE_TIMEOUT) as session:
                 async with session.get(TIMETABLE_ENDPOINT, headers=headers) as resp:
                     if resp.status != 200:
                         logger.warning("AnimeSchedule Returned %s", resp.status)
-                        raise RuntimeError(f"HTTP {resp.status}")
+                        raise UpstreamError("animeschedule", resp.status)
 
-                    data = await resp.json()
-                    if isinstance(data, list):
-                        return data
+                    return await resp.json()
 
-                    if isinstance(data, dict):
-                        for k in ("timetables", "data", "results"):
-                            if k in data and isinstance(data[k], list):
-                                return data[k]
+        try:
+            data = await resilience.call(
+                "animeschedule", _request, timeout=TIMETABLE_TIMEOUT.total
+            )
+            if isinstance(data, list):
+                return data
 
-                    return None
-        except Exception:
-            logger.exception("Failed To Fetch Timetables")
+            if isinstance(data, dict):
+                for k in ("timetables", "data", "results"):
+                    if k in data and isinstance(data[k], list):
+                        return data[k]
+
+            return None
+        except Exception as e:
+            if isinstance(e, (CircuitOpenError, UpstreamError)):
+                logger.warning("Failed To Fetch Timetables : %s", e)
+            else:
+                logger.exception("Failed To Fetch Timetables")
             # Fallback to local snapshot if available
             try:
                 with open("schedule.json", "r", encoding="utf-8") as f:
@@ -238,7 +320,6 @@ class Schedule(commands.Cog):
         if not data:
             return "Could Not Fetch Schedule Right Now!"
 
-        air_rank = {"sub": 3, "dub": 2, "raw": 1}
         best_by_key: Dict[Tuple[str, int], Dict[str, Any]] = {}
 
         for a in data:
@@ -276,13 +357,13 @@ class Schedule(commands.Cog):
             key = (route, day_key)
 
             air_type = _get_field(a, "air_type", "airType", default="").lower()
-            rank = air_rank.get(air_type, 0)
+            rank = AIR_RANK.get(air_type, 0)
 
             cur_best = best_by_key.get(key)
             if cur_best is None:
                 best_by_key[key] = a
             else:
-                cur_rank = air_rank.get(
+                cur_rank = AIR_RANK.get(
                     _get_field(cur_best, "air_type", "airType", default="").lower(), 0
                 )
                 if rank > cur_rank:
@@ -374,66 +455,95 @@ class Schedule(commands.Cog):
         except Exception:
             return None
 
-    async def _fetch_rss(self) -> Optional[bytes]:
-        url = str(self.config.get("rss_url") or "https://animeschedule.net/subrss.xml")
+    def _rss_feeds(self) -> List[dict]:
+        # rss_feeds Wins; Otherwise The Legacy rss_* Keys Describe A Single Feed
+        feeds = self.config.get("rss_feeds") or [
+            {
+                "name": LEGACY_FEED,
+                "url": self.config.get("rss_url") or DEFAULT_FEED["url"],
+                "interval_minutes": self.config.get("rss_interval_minutes", 5),
+                "channel_id": self.config.get("rss_channel_id") or [],
+                "post_limit": self.config.get("rss_post_limit", 5),
+            }
+        ]
+        return [feed_config(f) for f in feeds if isinstance(f, dict) and f.get("url")]
+
+    def _migrate_rss_seen(self):
+        # GUIDs From The Old Single-Feed Config Move Into The Legacy Namespace
+        legacy = self.config.pop("rss_seen_guids", None)
+        if legacy is None:
+            return
+
+        self.rss_seen.add(LEGACY_FEED, [str(g) for g in legacy])
+        save_config(self.config)
+
+    async def _fetch_rss(
+        self, session: aiohttp.ClientSession, feed: dict, state: FeedState
+    ) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+        # (body, etag, last_modified), None On 304 Or Failure. The Validators Are
+        # Only Stored Once The Caller Has Handled The Body - Conditional Headers
+        # Keep Unchanged Feeds Cheap
+        service = f"rss:{feed['name']}"
         headers = {"User-Agent": "AstrumOtaku RSS"}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.modified:
+            headers["If-Modified-Since"] = state.modified
+
+        async def _request():
+            async with session.get(feed["url"], headers=headers) as resp:
+                if resp.status == 304:
+                    return None
+                if resp.status != 200:
+                    raise UpstreamError(service, resp.status)
+
+                return (
+                    await resp.read(),
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                )
+
         try:
-            timeout = aiohttp.ClientTimeout(total=20)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, headers=headers) as resp:
-                    if resp.status != 200:
-                        logger.warning("RSS Returned %s", resp.status)
-                        return None
-                    return await resp.read()
+            return await resilience.call(
+                service, _request, timeout=RSS_TIMEOUT.total, retries=1
+            )
+        except (CircuitOpenError, UpstreamError) as e:
+            logger.warning("RSS Unavailable : %s", e)
+            return None
         except Exception:
-            logger.exception("Failed Fetching RSS")
+            logger.exception("Failed Fetching RSS Feed %s", feed["name"])
             return None
 
-    def _format_rss_message(self, entry: dict) -> str:
+    def _format_rss_message(self, feed: dict, entry: dict) -> str:
         title = entry.get("title") or "New episode"
         link = entry.get("link") or "https://AnimeSchedule.net"
         pub = entry.get("published") or entry.get("pubDate") or ""
         dt = self._parse_rfc822(pub)
         when = f" <t:{int(dt.timestamp())}:t>" if dt else ""
-        return f"[SUB] {title}{when}\n{link}"
+        label = f"[{feed['label']}] " if feed.get("label") else ""
+        return f"{label}{title}{when}\n{link}"
 
-    def _persist_rss_seen(self):
-        try:
-            # Keep last N guids to cap file growth
-            max_keep = 500
-            self.config["rss_seen_guids"] = list(self._rss_seen)[-max_keep:]
-            save_config(self.config)
-        except Exception:
-            logger.exception("Failed to persist RSS seen GUIDs")
+    async def _poll_feed(self, session: aiohttp.ClientSession, feed: dict) -> int:
+        # Posts Up To post_limit New Items, Oldest First. Returns How Many
+        state = self._rss_state.setdefault(feed["name"], FeedState())
+        posted = 0
 
-    @tasks.loop(minutes=5.0)
-    async def rss_task(self):
         try:
-            if not (self.config.get("rss_enabled") or self.config.get("enabled")):
-                return
+            fetched = await self._fetch_rss(session, feed, state)
+            if not fetched or not fetched[0]:
+                FEED_POLLS.inc(feed=feed["name"], result="unchanged")
+                return 0
 
-            raw = await self._fetch_rss()
-            if not raw:
-                return
-
-            parsed = feedparser.parse(raw)
+            raw, etag, modified = fetched
+            parsed = await asyncio.to_thread(feedparser.parse, raw)
             entries = parsed.get("entries", []) if isinstance(parsed, dict) else []
-            if not entries:
-                return
 
-            # Identify new entries by GUID (fallback to link+title)
-            new_items = []
-            for e in entries:
-                guid = (
-                    e.get("guid")
-                    or e.get("id")
-                    or f"{e.get('link', '')}|{e.get('title', '')}"
-                )
-                if guid not in self._rss_seen:
-                    new_items.append((guid, e))
-
-            if not new_items:
-                return
+            candidates = {entry_guid(e): e for e in entries if matches(feed, e)}
+            fresh = self.rss_seen.unseen(feed["namespace"], list(candidates))
+            if not fresh:
+                state.etag, state.modified = etag, modified
+                FEED_POLLS.inc(feed=feed["name"], result="unchanged")
+                return 0
 
             # Oldest first to maintain order; use published date when available
             def _dt(e):
@@ -441,22 +551,20 @@ class Schedule(commands.Cog):
                     e.get("published") or e.get("pubDate") or ""
                 ) or datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc)
 
-            new_items.sort(key=lambda ge: _dt(ge[1]))
-
-            # Limit per cycle
-            limit = max(1, int(self.config.get("rss_post_limit", 5) or 5))
-            to_post = new_items[:limit]
-
-            # Determine channels
-            channels = (
-                self.config.get("rss_channel_id") or self.config.get("channel_id") or []
+            new_items = sorted(
+                ((g, candidates[g]) for g in fresh), key=lambda ge: _dt(ge[1])
             )
+            limit = max(1, int(feed.get("post_limit") or 5))
+
+            channels = feed.get("channel_id") or self.config.get("channel_id") or []
             if not channels:
-                logger.info("RSS enabled but no channels configured")
+                logger.info("RSS Feed %s Has No Channels Configured", feed["name"])
 
-            # Post
-            for guid, e in to_post:
-                msg = self._format_rss_message(e)
+            queue = get_send_queue(self.bot)
+            complete = len(new_items) <= limit
+            for guid, e in new_items[:limit]:
+                msg = self._format_rss_message(feed, e)
+                delivered = not channels
                 for cid in channels:
                     try:
                         cid_int = int(cid) if not isinstance(cid, int) else cid
@@ -464,14 +572,62 @@ class Schedule(commands.Cog):
                             cid_int
                         ) or await self.bot.fetch_channel(cid_int)
                         if channel:
-                            await channel.send(msg)
+                            await queue.send(channel, msg)
+                            delivered = True
                     except Exception:
                         logger.exception("Failed posting RSS to channel %s", cid)
 
-                self._rss_seen.add(guid)
+                if not delivered:
+                    # Left Unseen For The Next Full Fetch
+                    complete = False
+                    continue
+
+                self.rss_seen.add(feed["namespace"], [guid])
+                posted += 1
 
-            # Persist seen list after posting batch
-            self._persist_rss_seen()
+            self.rss_seen.prune(feed["namespace"])
+
+            # A 304 Next Time Would Hide Anything Still Unposted
+            if complete:
+                state.etag, state.modified = etag, modified
+            FEED_POLLS.inc(feed=feed["name"], result="posted")
+            return posted
+        except Exception:
+            FEED_POLLS.inc(feed=feed["name"], result="error")
+            logger.exception("Error Polling RSS Feed %s", feed["name"])
+            return posted
+        finally:
+            state.polled(feed, posted > 0)
+
+    async def poll_feeds(self, force: bool = False) -> int:
+        # Every Due Feed At Once, At Most RSS_CONCURRENCY In Flight
+        feeds = [
+            f
+            for f in self._rss_feeds()
+            if f.get("enabled", True)
+            and (force or self._rss_state.setdefault(f["name"], FeedState()).due())
+        ]
+        if not feeds:
+            return 0
+
+        gate = asyncio.Semaphore(RSS_CONCURRENCY)
+
+        async def _bounded(session, feed):
+            async with gate:
+                return await self._poll_feed(session, feed)
+
+        async with aiohttp.ClientSession(timeout=RSS_TIMEOUT) as session:
+            posted = await asyncio.gather(*(_bounded(session, f) for f in feeds))
+
+        return sum(posted)
+
+    @tasks.loop(seconds=RSS_TICK)
+    async def rss_task(self):
+        try:
+            if not (self.config.get("rss_enabled") or self.config.get("enabled")):
+                return
+
+            await self.poll_feeds()
         except Exception:
             logger.exception("Error in RSS task loop")
 
@@ -493,52 +649,309 @@ class Schedule(commands.Cog):
                 hour, minute = 1, 0
 
             now_utc = datetime.datetime.now(datetime.timezone.utc)
-            today_date = now_utc.date()
 
-            if self._last_post_date == today_date:
-                return
+            # Today's post_time - Slots Are Every 24h On This Grid
+            anchor = now_utc.replace(
+                hour=hour, minute=minute, second=0, microsecond=0
+            ).timestamp()
+            policy = self.config.get("catch_up") or RUN_ONCE
+            jobs = get_job_store(self.bot)
+
+            channel_ids = self.config.get("channel_id", []) or []
+            if not channel_ids:
+                logger.info("Schedule Auto Post Enabled But No Channel Configured!")
+
+            # Sunday-Based Weekday -> Message, Built Once And Shared By Every Channel
+            messages: Dict[int, str] = {}
+            py_weekday = now_utc.weekday()  # Mon=0..Sun=6
+            today = (py_weekday + 1) % 7
+
+            for cid in channel_ids:
+                try:
+                    if isinstance(cid, str) and cid.isdigit():
+                        cid = int(cid)
+
+                    # Persisted, So A Restart Near post_time Can't Post Twice
+                    runs = jobs.take(
+                        "schedule",
+                        int(cid),
+                        DAY_SECONDS,
+                        policy,
+                        anchor=anchor,
+                        now=now_utc.timestamp(),
+                    )
+                    if not runs:
+                        continue
+
+                    channel = self.bot.get_channel(int(cid))
 
-            if now_utc.hour == hour and now_utc.minute == minute:
-                py_weekday = now_utc.weekday()  # Mon=0..Sun=6
-                sunday_based = (py_weekday + 1) % 7
+                    if channel is None:
+                        channel = await self.bot.fetch_channel(int(cid))
 
-                message = await self.build_day_schedule_message(sunday_based)
+                    if channel is None:
+                        logger.warning(
+                            "Could Not Find Channel %s To Post Schedule", cid
+                        )
+                        continue
+
+                    # One Post Per Missed Day, Oldest First - A Week Back At Most,
+                    # Since The Timetable Only Covers The Current Week
+                    for back in range(min(runs, 7) - 1, -1, -1):
+                        weekday = (today - back) % 7
+                        if weekday not in messages:
+                            messages[weekday] = await self.build_day_schedule_message(
+                                weekday
+                            )
+                        await get_send_queue(self.bot).send(channel, messages[weekday])
+                    logger.info("Posted Daily Schedule To %s", cid)
 
-                channel_ids = self.config.get("channel_id", []) or []
-                if not channel_ids:
-                    logger.info("Schedule Auto Post Enabled But No Channel Configured!")
+                except Exception:
+                    logger.exception("Failed To Post Schedule To Channel %s", cid)
 
-                for cid in channel_ids:
-                    try:
-                        if isinstance(cid, str) and cid.isdigit():
-                            cid = int(cid)
+        except Exception:
+            logger.exception("Error In Schedule Auto Task")
 
-                        channel = self.bot.get_channel(int(cid))
+    @auto_task.before_loop
+    async def before_auto_task(self):
+        await self.bot.wait_until_ready()
 
-                        if channel is None:
-                            channel = await self.bot.fetch_channel(int(cid))
+    # --- Watchlists ---
+    def _airings(self, data) -> Dict[tuple, Tuple[int, float, Dict[str, Any]]]:
+        # (route, episode) -> (rank, airs_at, payload), Best Air Type Per Episode
+        now = time.time()
+        best: Dict[tuple, Tuple[int, float, Dict[str, Any]]] = {}
 
-                        if channel is None:
-                            logger.warning(
-                                "Could Not Find Channel %s To Post Schedule", cid
-                            )
-                            continue
-                        await channel.send(message)
-                        logger.info("Posted Daily Schedule To %s", cid)
+        for a in data or []:
+            route = _get_field(a, "route", "Route", default="")
+            raw = _get_field(
+                a, "episode_date", "episodeDate", "EpisodeDate", default=None
+            )
+            dt = _parse_iso_datetime(str(raw)) if raw else None
+            if not route or dt is None or dt.timestamp() <= now:
+                continue
 
-                    except Exception:
-                        logger.exception("Failed To Post Schedule To Channel %s", cid)
+            episode = _get_field(a, "episode_number", "episodeNumber", default=None)
+            key = (route, episode if episode is not None else int(dt.timestamp()))
+
+            air_type = (_get_field(a, "air_type", "airType", default="") or "").lower()
+            rank = AIR_RANK.get(air_type, 0)
+
+            current = best.get(key)
+            if current is None or rank > current[0]:
+                title, ep_str, _ = self._format_show_line(a, dt)
+                best[key] = (
+                    rank,
+                    dt.timestamp(),
+                    {
+                        "route": route,
+                        "title": title,
+                        "episode": ep_str,
+                        "air_type": air_type,
+                        "airs_at": int(dt.timestamp()),
+                    },
+                )
+
+        return best
+
+    def _schedule_airings(self, data, routes: Optional[set] = None):
+        # Timers Only For Watched Routes. routes=None Re-Syncs Every One.
+        full = routes is None
+        if full:
+            routes = self.watches.routes()
+
+        fresh: Dict[str, Dict[tuple, tuple]] = {}
+        for key, (_, airs_at, payload) in self._airings(data).items():
+            if key[0] in routes:
+                fresh.setdefault(key[0], {})[key] = (airs_at, payload)
+
+        stale_routes = set(self._route_timers) - routes if full else set()
+        for route in stale_routes:
+            for key in self._route_timers.pop(route):
+                self.wheel.cancel(key)
+
+        for route in routes:
+            timers = fresh.get(route, {})
+            for key in self._route_timers.get(route, set()) - timers.keys():
+                # Rescheduled Or Dropped From The Timetable
+                self.wheel.cancel(key)
+
+            for key, (airs_at, payload) in timers.items():
+                self.wheel.schedule(key, airs_at, payload)
+
+            self._route_timers[route] = set(timers)
+
+    async def _dm(self, user_id: int, text: str):
+        user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+        return await user.send(text)
+
+    def _notify(self, airing: Dict[str, Any]):
+        # One Indexed Lookup Per Airing, Then One Message Per Channel (Or DM)
+        subscribers = self.watches.subscribers(airing["route"])
+        if not subscribers:
+            return
+
+        text = (
+            f"📺 **{airing['title']}** - {airing['episode']} "
+            f"Is Airing Now ( <t:{airing['airs_at']}:t> )"
+        )
+
+        by_channel: Dict[Optional[int], List[int]] = {}
+        for user_id, channel_id in subscribers:
+            by_channel.setdefault(channel_id, []).append(user_id)
+
+        queue = get_send_queue(self.bot)
+        futures = []
+
+        for channel_id, users in by_channel.items():
+            if channel_id is None:
+                for user_id in users:
+                    futures.append(
+                        queue.submit(user_id, lambda u=user_id: self._dm(u, text))
+                    )
+                continue
+
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                logger.warning("Watch Channel %s Not Found - Skipped", channel_id)
+                continue
+
+            for i in range(0, len(users), MENTIONS_PER_MESSAGE):
+                mentions = " ".join(
+                    f"<@{u}>" for u in users[i : i + MENTIONS_PER_MESSAGE]
+                )
+                futures.append(
+                    queue.submit(
+                        channel_id,
+                        lambda c=channel, m=mentions: c.send(f"{m}\n{text}"),
+                    )
+                )
 
-                self._last_post_date = today_date
+        # Delivered In The Background - The Wheel Keeps Ticking Meanwhile
+        for future in futures:
+            future.add_done_callback(_log_failed_ping)
 
+    @tasks.loop(seconds=TIMETABLE_TTL)
+    async def watch_refresh_task(self):
+        try:
+            data = await self.fetch_timetable()
+            if data:
+                self._schedule_airings(data)
         except Exception:
-            logger.exception("Error In Schedule Auto Task")
+            logger.exception("Error Refreshing Watch Timers")
 
-    @auto_task.before_loop
-    async def before_auto_task(self):
+    @watch_refresh_task.before_loop
+    async def before_watch_refresh(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=WATCH_TICK)
+    async def watch_tick_task(self):
+        try:
+            for key, airing in self.wheel.advance():
+                self._route_timers.get(key[0], set()).discard(key)
+                self._notify(airing)
+        except Exception:
+            logger.exception("Error In Watch Notifier")
+
+    @watch_tick_task.before_loop
+    async def before_watch_tick(self):
         await self.bot.wait_until_ready()
 
+    def _find_show(self, data, query: str) -> Optional[Tuple[str, str]]:
+        # (route, title) - Exact Route / Title First, Then Substring
+        q = query.strip().casefold()
+        partial = None
+
+        for a in data or []:
+            route = _get_field(a, "route", "Route", default="")
+            title = _get_field(a, "title", "Title", "name", default="") or route
+            if not route:
+                continue
+
+            if q in (route.casefold(), title.casefold()):
+                return route, title
+
+            if partial is None and (q in title.casefold() or q in route.casefold()):
+                partial = (route, title)
+
+        return partial
+
+    @watch.command(name="add", description="Get Pinged When A Show Airs")
+    @option("show", description="Show Title Or AnimeSchedule Route")
+    @option(
+        "where",
+        description="Ping By DM Or In This Channel",
+        choices=["dm", "channel"],
+        required=False,
+        default="dm",
+    )
+    @ack_budget("watch_add", ephemeral=True)
+    async def watch_add(
+        self, ctx: discord.ApplicationContext, show: str, where: str = "dm"
+    ):
+        if self.watches.count_for_user(ctx.author.id) >= MAX_WATCHES:
+            return await respond(
+                ctx, f"⚠️ You Can Watch Up To **{MAX_WATCHES}** Shows.", ephemeral=True
+            )
+
+        data = await self.fetch_timetable()
+        match = self._find_show(data, show)
+        if not match:
+            return await respond(
+                ctx,
+                f"❌ Couldn't Find **{show}** In This Week's Timetable.",
+                ephemeral=True,
+            )
+
+        route, title = match
+        channel_id = ctx.channel_id if where == "channel" and ctx.guild_id else None
+        self.watches.add(route, ctx.author.id, title, ctx.guild_id, channel_id)
+        self._schedule_airings(data, {route})
+
+        target = f"<#{channel_id}>" if channel_id else "Your DMs"
+        await respond(
+            ctx, f"📺 Watching **{title}** - Pings Go To {target}.", ephemeral=True
+        )
+
+    @watch.command(name="remove", description="Stop Pings For A Show")
+    @option("show", description="Show Title Or Route From /watch list")
+    async def watch_remove(self, ctx: discord.ApplicationContext, show: str):
+        q = show.strip().casefold()
+        watched = self.watches.for_user(ctx.author.id)
+
+        match = next(
+            (r for r in watched if q in (r[0].casefold(), r[1].casefold())), None
+        ) or next((r for r in watched if q in r[1].casefold()), None)
+
+        if not match or not self.watches.remove(match[0], ctx.author.id):
+            return await ctx.respond(
+                f"❌ You're Not Watching **{show}**.", ephemeral=True
+            )
+
+        await ctx.respond(f"🗑️ Stopped Watching **{match[1]}**.", ephemeral=True)
+
+    @watch.command(name="list", description="Show Your Watchlist")
+    async def watch_list(self, ctx: discord.ApplicationContext):
+        watched = self.watches.for_user(ctx.author.id)
+        if not watched:
+            return await ctx.respond(
+                "You're Not Watching Anything Yet - Try `/watch add`.", ephemeral=True
+            )
+
+        lines = [
+            f"• **{title}** → {f'<#{channel_id}>' if channel_id else 'DM'}"
+            for _, title, channel_id in watched
+        ]
+        await ctx.respond(
+            embed=discord.Embed(
+                title="📺 Your Watchlist",
+                description="\n".join(lines),
+                color=discord.Color.blurple(),
+            ),
+            ephemeral=True,
+        )
+
     @discord.slash_command(name="schedule", description="Test")
+    @ack_budget("schedule")
     async def schedule_command(
         self, ctx: discord.ApplicationContext, day: Optional[str] = None
     ):
@@ -572,15 +985,17 @@ class Schedule(commands.Cog):
                 if 0 <= v <= 6:
                     target = v
                 else:
-                    await ctx.respond(
-                        "Please Provide A Day Between 0 ( Sunday ) And 6 ( Saturday )."
+                    await respond(
+                        ctx,
+                        "Please Provide A Day Between 0 ( Sunday ) And 6 ( Saturday ).",
                     )
                     return
             elif d in mapping:
                 target = mapping[d]
             else:
-                await ctx.respond(
-                    "Unknown Day. Please Use Names Like Monday Or Numbers 0..6 ( Sunday = 0 )."
+                await respond(
+                    ctx,
+                    "Unknown Day. Please Use Names Like Monday Or Numbers 0..6 ( Sunday = 0 ).",
                 )
                 return
 
@@ -605,9 +1020,9 @@ class Schedule(commands.Cog):
                 parts.append("".join(current))
 
             for p in parts:
-                await ctx.respond(p)
+                await respond(ctx, p)
         else:
-            await ctx.respond(msg)
+            await respond(ctx, msg)
 
 
 def setup(bot: commands.Bot):
@@ -1,14 +1,30 @@
+import io
+import os
 import json
 import time
 import random
+import sqlite3
 import discord
 import aiohttp
 import asyncio
 import datetime
+from collections import deque
 from discord import option
 from discord.ext import commands
 from extensions.logger import setup_logger
-from extensions.database import database
+from extensions.database import StaleClaimError, database
+from extensions import resilience
+from extensions.resilience import CircuitOpenError, UpstreamError
+from extensions.rarity import RarityEngine, rarity
+from extensions.spawnindex import SpawnIndex
+from extensions.prefixindex import CollectionTags, parse_tags
+from extensions import collage
+from extensions import runtime
+from extensions.interactions import ack_budget, edit_message, respond
+from extensions.ratelimit import rate_limited
+from extensions.jobstore import SKIP, get_job_store
+from extensions.sendqueue import get_send_queue
+from extensions.metrics import COMPONENT_LATENCY, counter
 
 logger = setup_logger(__name__)
 
@@ -26,43 +42,51 @@ WAIFU_CATEGORIES = [
 NWAIFU_CATEGORIES = ["ass", "hentai", "milf", "oral", "paizuri", "ecchi", "ero"]
 
 API_URL = "https://api.waifu.im/search"
+API_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3)
 
+# Old Global Config - Imported Into guild_config Once, Then Renamed Aside
 CONFIG_PATH = "waifuConfig.json"
 NSFW_CHANCE = 0.005
 
+# Recently Claimed Waifu IDs Kept In The Latch - Older Ones Fall Back To The DB Index
+CLAIM_LATCH_SIZE = 50_000
+
+CLAIM_LATCH_REJECTS = counter(
+    "claim_latch_rejections_total", "Claims rejected in memory by the first-winner latch"
+)
+
+# Unused Candidates Kept Per (tags, nsfw) From Each many=true Response
+SPARE_POOL_SIZE = 60
+
+# Rows Listed By /search
+SEARCH_RESULTS = 10
+
+SPAWN_DEDUPE_SKIPS = counter(
+    "spawn_dedupe_skips_total", "Spawn candidates skipped as claimed or recently posted"
+)
+
+# Per-Guild Spawn Settings, Stored In The guild_config Table
 DEFAULT_CONFIG = {
-    "enabled": True,
-    "channel_id": [1401985460808712293],
+    "enabled": False,
+    "channel_id": [],
     "interval_minutes": 60,
-    "only_spawner": False,
-    "owner_id": [727012870683885578],
+    "nsfw_chance": NSFW_CHANCE,
+    "tag_weights": {},
+    "rarity_weights": {},
+    # Missed Spawns After A Restart : skip / run-once / run-all
+    "catch_up": SKIP,
 }
 
+# How Often The Spawn Loop Checks Which Channels Are Due
+SPAWN_TICK = 30
 
-def load_config():
-    try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
-            for k, v in DEFAULT_CONFIG.items():
-                data.setdefault(k, v)
+def _api_id(image):
+    return image.get("image_id") or image.get("signature")
 
-            return data
-    except FileNotFoundError:
-        save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG.copy()
 
-    except Exception:
-        logger.exception("Failed Loading Waifu Config - Using Defaults")
-        return DEFAULT_CONFIG.copy()
-
-
-def save_config(cfg):
-    try:
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
-    except Exception:
-        logger.exception("Failed Saving Waifu Config")
+def _spawn_interval(cfg) -> float:
+    return max(30, cfg.get("interval_minutes", 60) * 60)
 
 
 class Waifu(commands.Cog):
@@ -76,6 +100,36 @@ class Waifu(commands.Cog):
             self.db = None
 
         self.claim_cooldown = 60 * 60
+        self._claim_latch: dict[tuple[int, int], None] = {}
+
+        self.rarity = RarityEngine()
+
+        self.spawns = SpawnIndex()
+        self._spares: dict[tuple, deque] = {}
+        if self.db:
+            try:
+                self.spawns.load_claimed(self.db.get_claimed_api_ids())
+            except Exception:
+                logger.exception("Failed Loading Claimed Waifus Into Spawn Index")
+
+        # /collection tag Autocomplete - Loaded Once, Then Updated By Claim Changes
+        self.collection_tags = CollectionTags()
+        if self.db:
+            try:
+                self.collection_tags.load(self.db.get_collection_tags())
+            except Exception:
+                logger.exception("Failed Loading Collection Tags")
+
+        runtime.register_cache(
+            "waifu_claim_latch", lambda: runtime.estimate(self._claim_latch.keys())
+        )
+        runtime.register_cache("waifu_spares", self._spare_sizes)
+        runtime.register_cache("waifu_collection_tags", self.collection_tags.sizes)
+        runtime.register_cache(
+            "collection_collages", collage.get_collage_renderer(bot).sizes
+        )
+        for name in self.spawns.sizes():
+            runtime.register_cache(name, lambda name=name: self.spawns.sizes()[name])
 
         self._spawn_task = bot.loop.create_task(self._auto_spawn_loop())
 
@@ -85,18 +139,214 @@ class Waifu(commands.Cog):
         except Exception:
             pass
 
+        for name in (
+            "waifu_claim_latch",
+            "waifu_spares",
+            "waifu_collection_tags",
+            "collection_collages",
+            *self.spawns.sizes(),
+        ):
+            runtime.unregister_cache(name)
+
+        collage.close_collage_renderer(self.bot)
+
+    def _spare_sizes(self):
+        entries = size = 0
+        for pool in self._spares.values():
+            n, pool_size = runtime.estimate(pool)
+            entries += n
+            size += pool_size
+
+        return entries, size
+
+    def _latch_claim(self, key: tuple[int, int]) -> bool:
+        # key : (guild_id, waifu_id)
+        if key in self._claim_latch:
+            return False
+
+        self._claim_latch[key] = None
+        if len(self._claim_latch) > CLAIM_LATCH_SIZE:
+            self._claim_latch.pop(next(iter(self._claim_latch)))
+
+        return True
+
+    def _release_claim(self, key: tuple[int, int]):
+        self._claim_latch.pop(key, None)
+
+    def _move_tags(self, waifu_id, from_user=None, to_user=None):
+        # Mirrors A Claim Change Into collection_tags - users.id On Both Sides
+        try:
+            tags = parse_tags(self.db.get_waifu_tags(waifu_id))
+        except Exception:
+            logger.exception(f"Failed Reading Tags Of Waifu {waifu_id}")
+            return
+
+        if from_user is not None:
+            self.collection_tags.remove(from_user, tags)
+        if to_user is not None:
+            self.collection_tags.add(to_user, tags)
+
+    def get_spawn_config(self, guild_id):
+        cfg = dict(DEFAULT_CONFIG)
+        if self.db:
+            cfg.update(self.db.get_spawn_config(guild_id) or {})
+
+        return cfg
+
+    def update_spawn_config(self, guild_id, updates: dict):
+        old = self.get_spawn_config(guild_id)
+        cfg = {**old, **updates}
+        self.db.set_spawn_config(guild_id, cfg)
+
+        # A New Interval Or Channel Starts Counting From Now - Weight, NSFW Or
+        # catch_up Changes Leave Every Timer Alone
+        jobs = get_job_store(self.bot)
+        before = {int(ch) for ch in old.get("channel_id") or []}
+        after = {int(ch) for ch in cfg.get("channel_id") or []}
+        retimed = _spawn_interval(old) != _spawn_interval(cfg)
+
+        next_due = time.time() + _spawn_interval(cfg)
+        for ch in after:
+            if retimed or ch not in before:
+                jobs.reschedule("spawn", ch, next_due)
+        for ch in before - after:
+            jobs.reset("spawn", ch)
+
+        return cfg
+
+    def _roll_rarity(self, guild_id):
+        cfg = self.get_spawn_config(guild_id)
+        return self.rarity.pick_rarity(guild_id, cfg.get("rarity_weights") or {})
+
+    @staticmethod
+    def _rarity_field(embed, tier):
+        embed.add_field(name="Rarity", value=f"{tier.stars} {tier.name}", inline=True)
+
+    def _save_waifu(self, image, guild_id):
+        # (waifu_db_id, Rarity) - Prefetched Images Were Already Saved With Their Batch.
+        # The Tier Is This Guild's Roll; The Claim Stores It, Not The Shared Row
+        if "_rarity" not in image:
+            image["_rarity"] = self._roll_rarity(guild_id).tier
+        if "_waifu_id" not in image and self.db:
+            try:
+                image["_waifu_id"], _ = self.db.upsert_waifu(image, image["_rarity"])
+            except Exception:
+                logger.exception("Failed Saving Waifu To Database")
+
+        return image.get("_waifu_id"), rarity(image.get("_rarity"))
+
+    def _save_batch(self, images, guild_id):
+        if not self.db:
+            return
+
+        weights = self.get_spawn_config(guild_id).get("rarity_weights") or {}
+        tiers = [self.rarity.pick_rarity(guild_id, weights).tier for _ in images]
+
+        try:
+            saved = self.db.upsert_waifus(images, tiers)
+        except Exception:
+            logger.exception("Failed Saving Prefetched Waifus")
+            return
+
+        for image, tier in zip(images, tiers):
+            row = saved.get(_api_id(image))
+            if row:
+                image["_waifu_id"], image["_rarity"] = row[0], tier
+
+    def _import_legacy_config(self):
+        # One-Off : Split The Old Global waifuConfig.json Into Per-Guild Rows
+        if not self.db or not os.path.exists(CONFIG_PATH):
+            return
+
+        try:
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except Exception:
+            logger.exception("Failed Reading Legacy Waifu Config")
+            return
+
+        ch_ids = legacy.get("channel_id") or []
+        if not isinstance(ch_ids, list):
+            ch_ids = [ch_ids]
+
+        per_guild: dict[int, list[int]] = {}
+        skipped = 0
+        for ch in ch_ids:
+            try:
+                channel = self.bot.get_channel(int(ch))
+            except (TypeError, ValueError):
+                channel = None
+            if not channel or not getattr(channel, "guild", None):
+                logger.warning(f"Legacy Waifu Channel {ch} Not Found - Skipped")
+                skipped += 1
+                continue
+            per_guild.setdefault(channel.guild.id, []).append(channel.id)
+
+        overrides = legacy.get("guild_weights") or {}
+        for guild_id, channels in per_guild.items():
+            existing = self.db.get_spawn_config(guild_id)
+            if existing:
+                # Imported On An Earlier Start - Only Add Channels Resolved Since
+                known = existing.get("channel_id") or []
+                missing = [c for c in channels if c not in known]
+                if not missing:
+                    continue
+                config = {**existing, "channel_id": known + missing}
+            else:
+                own = overrides.get(str(guild_id)) or {}
+                config = {
+                    **DEFAULT_CONFIG,
+                    "enabled": bool(legacy.get("enabled")),
+                    "channel_id": channels,
+                    "interval_minutes": legacy.get("interval_minutes", 60),
+                    "nsfw_chance": legacy.get("nsfw_chance", NSFW_CHANCE),
+                    "tag_weights": {
+                        **(legacy.get("tag_weights") or {}),
+                        **(own.get("tag_weights") or {}),
+                    },
+                    "rarity_weights": {
+                        **(legacy.get("rarity_weights") or {}),
+                        **(own.get("rarity_weights") or {}),
+                    },
+                }
+
+            try:
+                self.db.set_spawn_config(guild_id, config)
+            except Exception:
+                logger.exception(f"Failed Importing Legacy Waifu Config For {guild_id}")
+                skipped += 1
+
+        if skipped:
+            # Left In Place So The Next Start Retries The Rest
+            logger.warning(
+                f"Kept Legacy Waifu Config - {skipped} Entries Not Migrated Yet"
+            )
+            return
+
+        os.replace(CONFIG_PATH, CONFIG_PATH + ".migrated")
+        logger.info(f"Imported Legacy Waifu Config For {len(per_guild)} Guild(s)")
+
     async def _auto_spawn_loop(self):
         await self.bot.wait_until_ready()
+        try:
+            self._import_legacy_config()
+        except Exception:
+            logger.exception("Failed Importing Legacy Waifu Config")
+
         while True:
             try:
-                cfg = load_config()
-                if cfg.get("enabled") and cfg.get("channel_id"):
+                configs = self.db.get_spawn_configs() if self.db else {}
+                jobs = get_job_store(self.bot)
 
-                    ch_ids = cfg.get("channel_id")
-                    if not isinstance(ch_ids, list):
-                        ch_ids = [ch_ids]
+                for guild_id, stored in configs.items():
+                    cfg = {**DEFAULT_CONFIG, **stored}
+                    if not cfg.get("enabled") or not cfg.get("channel_id"):
+                        continue
 
-                    for ch in ch_ids:
+                    interval = _spawn_interval(cfg)
+                    policy = cfg.get("catch_up") or SKIP
+
+                    for ch in cfg["channel_id"]:
                         try:
                             ch_id = int(ch)
                         except Exception:
@@ -104,82 +354,14 @@ class Waifu(commands.Cog):
 
                         channel = self.bot.get_channel(ch_id)
                         if not channel:
-                            logger.warning("Configured Waifu Channel Not Found - Disabling")
-
-                        do_nsfw = random.random() < NSFW_CHANCE
-                        tag_list = NWAIFU_CATEGORIES if do_nsfw else WAIFU_CATEGORIES
-                        tag = random.choice(tag_list) if tag_list else "waifu"
-
-                        image = await self.fetch_waifu([tag], nsfw=do_nsfw)
-                        if not image:
+                            logger.warning(f"Waifu Channel {ch_id} Not Found - Skipped")
                             continue
 
-                        try:
-                            if self.db:
-                                waifu_api_id = image.get("image_id") or image.get(
-                                    "signature"
-                                )
-                                artist = image.get("artist") or {}
-                                tags = [t.get("name") for t in image.get("tags", [])]
-
-                                self.db.add_waifu(
-                                    waifu_api_id,
-                                    image.get("url"),
-                                    image.get("preview_url"),
-                                    image.get("source"),
-                                    (
-                                        artist.get("name")
-                                        if isinstance(artist, dict)
-                                        else None
-                                    ),
-                                    (
-                                        artist.get("twitter")
-                                        if isinstance(artist, dict)
-                                        else None
-                                    ),
-                                    bool(image.get("is_nsfw", False)),
-                                    json.dumps(tags),
-                                )
-
-                                waifu_row = self.db.get_waifu_by_api_id(waifu_api_id)
-                                waifu_db_id = waifu_row[0] if waifu_row else None
-                            else:
-                                waifu_db_id = None
-                        except Exception:
-                            logger.exception("Failed Saving Waifu To Database")
-                            waifu_db_id = None
-
-                        embed = discord.Embed(
-                            title=f"✨ Spawned Waifu ~ {tag}",
-                            color=discord.Color.random(),
-                        )
-                        embed.set_image(url=image.get("url"))
-                        artist = image.get("artist") or {}
-
-                        if artist:
-                            embed.add_field(
-                                name="Artist",
-                                value=artist.get("name") or "Unknown",
-                                inline=True,
-                            )
-
-                        view = ClaimView(self, waifu_db_id)
-
-                        try:
-                            await channel.send(embed=embed, view=view)
-                            logger.info(f"Auto Posted Waifu To {channel.id}")
-                        except Exception:
-                            logger.exception("Failed Sending Waifu To %s", channel)
+                        # Per-Channel Due Times Persist, So A Restart Keeps Each Timer
+                        for _ in range(jobs.take("spawn", ch_id, interval, policy)):
+                            await self._spawn_in(channel, guild_id, cfg)
 
-                        try:
-                            await asyncio.sleep(random.uniform(0.5, 2.0))
-                        except Exception:
-                            pass
-
-                interval = (
-                    cfg.get("interval_minutes", 60) if isinstance(cfg, dict) else 60
-                )
-                await asyncio.sleep(max(30, interval * 60))
+                await asyncio.sleep(SPAWN_TICK)
 
             except asyncio.CancelledError:
                 break
@@ -188,6 +370,45 @@ class Waifu(commands.Cog):
                 logger.exception("Error In Auto Spawn")
                 await asyncio.sleep(60)
 
+    async def _spawn_in(self, channel, guild_id, cfg):
+        do_nsfw = random.random() < cfg.get("nsfw_chance", NSFW_CHANCE)
+        tag_list = NWAIFU_CATEGORIES if do_nsfw else WAIFU_CATEGORIES
+        tag = self.rarity.pick_tag(
+            guild_id,
+            tag_list,
+            cfg.get("tag_weights") or {},
+            scope="nsfw" if do_nsfw else "sfw",
+        ) or "waifu"
+
+        image = await self.fetch_waifu(
+            [tag], nsfw=do_nsfw, guild_id=guild_id, channel_id=channel.id
+        )
+        if not image:
+            return
+
+        waifu_db_id, tier = self._save_waifu(image, guild_id)
+
+        embed = discord.Embed(
+            title=f"✨ Spawned Waifu ~ {tag}",
+            color=discord.Color.random(),
+        )
+        embed.set_image(url=image.get("url"))
+        artist = image.get("artist") or {}
+
+        if artist:
+            embed.add_field(
+                name="Artist", value=artist.get("name") or "Unknown", inline=True
+            )
+        self._rarity_field(embed, tier)
+
+        view = ClaimView(self, waifu_db_id, _api_id(image), tier.tier)
+
+        try:
+            await get_send_queue(self.bot).send(channel, embed=embed, view=view)
+            logger.info(f"Auto Posted Waifu To {channel.id}")
+        except Exception:
+            logger.exception("Failed Sending Waifu To %s", channel)
+
     def _format_last_claim(self, last_row):
         if not last_row:
             return "Never"
@@ -206,27 +427,30 @@ class Waifu(commands.Cog):
             return str(ts)
 
     @discord.slash_command(name="profile", description="Show Your Waifu Profile")
+    @ack_budget("profile")
     async def profile_cmd(
         self, ctx: discord.ApplicationContext, member: discord.Member = None
     ):
         member = member or ctx.author
         if not self.db:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Error",
                     description="Database Unavailable.",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
-        row = self.db.get_user(member.id)
+        row = self.db.get_user(ctx.guild_id or 0, member.id)
         if not row:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Profile",
                     description=f"{member.display_name} Has No Waifus Yet!",
                     color=discord.Color.blue(),
-                )
+                ),
             )
 
         username = row[2]
@@ -238,38 +462,69 @@ class Waifu(commands.Cog):
         )
         embed.add_field(name="Username", value=username, inline=False)
         embed.add_field(name="Total Waifus", value=str(waifu_count), inline=False)
+        embed.add_field(name="Rarity Score", value=str(row[5] or 0), inline=False)
         embed.add_field(name="Last Claim", value=last_claim, inline=False)
 
         if member.display_avatar:
             embed.set_thumbnail(url=member.display_avatar.url)
 
-        await ctx.respond(embed=embed)
+        await respond(ctx, embed=embed)
+
+    async def tag_autocomplete(self, ctx: discord.AutocompleteContext):
+        # Tags In The Chosen Member's Collection, From Memory Only
+        member = ctx.options.get("member")
+        try:
+            discord_id = int(getattr(member, "id", member) or ctx.interaction.user.id)
+        except (TypeError, ValueError):
+            discord_id = ctx.interaction.user.id
+
+        return self.collection_tags.complete(
+            ctx.interaction.guild_id or 0, discord_id, ctx.value
+        )
 
     @discord.slash_command(name="collection", description="Show Your Waifu Collection")
+    @option(
+        "tag",
+        str,
+        description="Only Waifus With This Tag",
+        required=False,
+        autocomplete=tag_autocomplete,
+    )
+    @option(
+        "layout",
+        description="One Waifu Per Page, Or A Thumbnail Grid",
+        choices=["pages", "grid"],
+        required=False,
+        default="pages",
+    )
+    @ack_budget("collection")
     async def collection_cmd(
         self,
         ctx: discord.ApplicationContext,
         member: discord.Member = None,
         tag: str = None,
+        layout: str = "pages",
     ):
         member = member or ctx.author
         if not self.db:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Error",
                     description="Database Unavailable.",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
-        user_row = self.db.get_user(member.id)
+        user_row = self.db.get_user(ctx.guild_id or 0, member.id)
         if not user_row:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Collection",
                     description=f"{member.display_name} Has No Waifus Yet!",
                     color=discord.Color.blue(),
-                )
+                ),
             )
 
         waifus = self.db.get_user_collection(user_row[0])
@@ -278,14 +533,20 @@ class Waifu(commands.Cog):
             waifus = [w for w in waifus if tag in (w[8] or "")]
 
         if not waifus:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Collection",
                     description="No Waifus Found",
                     color=discord.Color.blue(),
-                )
+                ),
             )
 
+        if layout == "grid" and collage.available():
+            view = GridView(self, waifus, user_row[0], member, ctx.author.id)
+            embed, file = await view.render()
+            return await respond(ctx, embed=embed, file=file, view=view)
+
         pages = []
         for w in waifus:
             embed = discord.Embed(title=f"Waifu {w[0]}", color=discord.Color.random())
@@ -297,6 +558,8 @@ class Waifu(commands.Cog):
                 name="Source", value=f"[Link]({w[4]})" or "Unknown", inline=True
             )
 
+            self._rarity_field(embed, rarity(w[9]))
+
             if w[7] == 1:
                 embed.add_field(name="NSFW", value=str(bool(w[7])), inline=False)
 
@@ -308,54 +571,402 @@ class Waifu(commands.Cog):
             pages.append(embed)
 
         view = PagesView(pages, ctx.author.id)
-        await ctx.respond(embed=pages[0], view=view)
+        await respond(ctx, embed=pages[0], view=view)
 
-    @discord.slash_command(name="leaderboard", description="Top Waifu Collectors")
-    async def leaderboard_cmd(self, ctx: discord.ApplicationContext):
+    @discord.slash_command(
+        name="search", description="Search Waifus By Artist, Source Or Tag"
+    )
+    @option("query", str, description="Words Or Word Starts, e.g. 'kant maid'")
+    @option(
+        "member",
+        discord.Member,
+        description="Only Search This Member's Collection",
+        required=False,
+    )
+    @ack_budget("search")
+    async def search_cmd(
+        self,
+        ctx: discord.ApplicationContext,
+        query: str,
+        member: discord.Member = None,
+    ):
         if not self.db:
-            return await ctx.respond(
+            return await respond(
+                ctx,
                 embed=discord.Embed(
                     title="Error",
                     description="Database Unavailable.",
                     color=discord.Color.red(),
+                ),
+            )
+
+        user_id = None
+        if member:
+            user_row = self.db.get_user(ctx.guild_id or 0, member.id)
+            if not user_row:
+                return await respond(
+                    ctx,
+                    embed=discord.Embed(
+                        title="Search",
+                        description=f"{member.display_name} Has No Waifus Yet!",
+                        color=discord.Color.blue(),
+                    ),
                 )
+            user_id = user_row[0]
+
+        is_nsfw = getattr(ctx.channel, "is_nsfw", None)
+        rows = self.db.search_waifus(
+            query,
+            guild_id=ctx.guild_id or 0,
+            user_id=user_id,
+            include_nsfw=bool(is_nsfw and is_nsfw()),
+            limit=SEARCH_RESULTS,
+        )
+
+        scope = f" In {member.display_name}'s Collection" if member else ""
+        embed = discord.Embed(title=f"🔎 {query}{scope}", color=discord.Color.random())
+
+        text = ""
+        for w in rows:
+            tags = ", ".join(json.loads(w[8])) if w[8] else "None"
+            text += (
+                f"`{w[0]}` {rarity(w[9]).stars} **{w[5] or 'Unknown'}**"
+                f" — {tags} — [Image]({w[2]})\n"
+            )
+
+        embed.description = text or "No Waifus Found"
+        if rows:
+            embed.set_thumbnail(url=rows[0][3] or rows[0][2])
+
+        await respond(ctx, embed=embed)
+
+    @discord.slash_command(name="leaderboard", description="Top Waifu Collectors")
+    @option(
+        "by",
+        description="Rank By Waifu Count Or Rarity Score",
+        choices=["count", "rarity"],
+        required=False,
+        default="count",
+    )
+    @ack_budget("leaderboard")
+    async def leaderboard_cmd(self, ctx: discord.ApplicationContext, by: str = "count"):
+        if not self.db:
+            return await respond(
+                ctx,
+                embed=discord.Embed(
+                    title="Error",
+                    description="Database Unavailable.",
+                    color=discord.Color.red(),
+                ),
             )
 
-        rows = self.db.get_leaderboard(10)
+        by_rarity = by == "rarity"
+        rows = self.db.get_leaderboard(ctx.guild_id or 0, 10, by_rarity=by_rarity)
         embed = discord.Embed(title="💖 Waifu Leaderboard ~", color=discord.Color.gold())
 
         text = ""
 
         for i, r in enumerate(rows, start=1):
-            text += f"{i}. {r[0]} — {r[1]}\n"
+            if by_rarity:
+                text += f"{i}. {r[0]} — {r[2]} ✦ ({r[1]} Waifus)\n"
+            else:
+                text += f"{i}. {r[0]} — {r[1]}\n"
 
         embed.description = text or "No Data!"
-        await ctx.respond(embed=embed)
+        await respond(ctx, embed=embed)
+
+    def _owned_claim(self, guild_id, member, waifu_id):
+        # The Claim Row If member Owns waifu_id In This Guild, Else None
+        claim = self.db.get_claim(guild_id, waifu_id)
+        if not claim or claim[3] != member.id:
+            return None
+
+        return claim
+
+    async def _notice(self, ctx, title, description, color, ephemeral=True):
+        await respond(
+            ctx,
+            embed=discord.Embed(title=title, description=description, color=color),
+            ephemeral=ephemeral,
+        )
+
+    @discord.slash_command(name="gift", description="Gift One Of Your Waifus")
+    @option("member", discord.Member, description="Who Receives The Waifu")
+    @option("waifu_id", int, description="Waifu ID From /collection")
+    @ack_budget("gift")
+    async def gift_cmd(
+        self, ctx: discord.ApplicationContext, member: discord.Member, waifu_id: int
+    ):
+        if not self.db:
+            return await self._notice(
+                ctx, "Error", "Database Unavailable.", discord.Color.red()
+            )
+
+        if member.bot or member.id == ctx.author.id:
+            return await self._notice(
+                ctx, "Gift", "Pick Someone Else To Gift To!", discord.Color.red()
+            )
+
+        claim = self._owned_claim(ctx.guild_id or 0, ctx.author, waifu_id)
+        if not claim:
+            return await self._notice(
+                ctx, "Gift", f"You Don't Own Waifu {waifu_id}!", discord.Color.red()
+            )
+
+        try:
+            to_user_id = await self.db.writer.submit(
+                self.db.transfer_waifu,
+                ctx.guild_id or 0,
+                waifu_id,
+                claim[1],
+                claim[2],
+                member.id,
+                str(member),
+            )
+        except StaleClaimError:
+            return await self._notice(
+                ctx,
+                "Gift",
+                f"Waifu {waifu_id} Changed Hands Meanwhile - Nothing Was Sent.",
+                discord.Color.red(),
+            )
+
+        self.collection_tags.link(ctx.guild_id or 0, member.id, to_user_id)
+        self._move_tags(waifu_id, from_user=claim[1], to_user=to_user_id)
+
+        await self._notice(
+            ctx,
+            "Gift Sent 🎁",
+            f"{ctx.author.mention} Gifted Waifu {waifu_id} To {member.mention}!",
+            discord.Color.green(),
+            ephemeral=False,
+        )
+
+    @discord.slash_command(name="release", description="Release One Of Your Waifus")
+    @option("waifu_id", int, description="Waifu ID From /collection")
+    @ack_budget("release", ephemeral=True)
+    async def release_cmd(self, ctx: discord.ApplicationContext, waifu_id: int):
+        if not self.db:
+            return await self._notice(
+                ctx, "Error", "Database Unavailable.", discord.Color.red()
+            )
+
+        claim = self._owned_claim(ctx.guild_id or 0, ctx.author, waifu_id)
+        if not claim:
+            return await self._notice(
+                ctx, "Release", f"You Don't Own Waifu {waifu_id}!", discord.Color.red()
+            )
+
+        try:
+            await self.db.writer.submit(
+                self.db.release_waifu,
+                ctx.guild_id or 0,
+                waifu_id,
+                claim[1],
+                claim[2],
+            )
+        except StaleClaimError:
+            return await self._notice(
+                ctx,
+                "Release",
+                f"Waifu {waifu_id} Changed Hands Meanwhile.",
+                discord.Color.red(),
+            )
+
+        # Frees The Claim Latch Only - SpawnIndex's Bloom Filter Can't Forget Her, So
+        # She Isn't Spawned In This Guild Again Until The Next Restart Rebuilds It
+        self._release_claim((ctx.guild_id or 0, waifu_id))
+        self._move_tags(waifu_id, from_user=claim[1])
+
+        await self._notice(
+            ctx,
+            "Released",
+            f"Waifu {waifu_id} Was Set Free. 🕊️",
+            discord.Color.blue(),
+        )
+
+    @discord.slash_command(name="trade", description="Offer A Waifu Swap")
+    @option("member", discord.Member, description="Who To Trade With")
+    @option("your_waifu", int, description="Your Waifu ID")
+    @option("their_waifu", int, description="Their Waifu ID")
+    @ack_budget("trade")
+    async def trade_cmd(
+        self,
+        ctx: discord.ApplicationContext,
+        member: discord.Member,
+        your_waifu: int,
+        their_waifu: int,
+    ):
+        if not self.db:
+            return await self._notice(
+                ctx, "Error", "Database Unavailable.", discord.Color.red()
+            )
+
+        if member.bot or member.id == ctx.author.id:
+            return await self._notice(
+                ctx, "Trade", "Pick Someone Else To Trade With!", discord.Color.red()
+            )
+
+        guild_id = ctx.guild_id or 0
+        offer = self._owned_claim(guild_id, ctx.author, your_waifu)
+        if not offer:
+            return await self._notice(
+                ctx, "Trade", f"You Don't Own Waifu {your_waifu}!", discord.Color.red()
+            )
 
-    async def fetch_waifu(self, tags, nsfw=False):
+        request = self._owned_claim(guild_id, member, their_waifu)
+        if not request:
+            return await self._notice(
+                ctx,
+                "Trade",
+                f"{member.display_name} Doesn't Own Waifu {their_waifu}!",
+                discord.Color.red(),
+            )
+
+        # Versions Are Pinned Now - Any Change Before Accept Voids The Trade
+        view = TradeView(
+            self,
+            guild_id,
+            member.id,
+            (your_waifu, offer[1], offer[2]),
+            (their_waifu, request[1], request[2]),
+        )
+        await respond(
+            ctx,
+            content=member.mention,
+            embed=discord.Embed(
+                title="Trade Offer 🔁",
+                description=(
+                    f"{ctx.author.mention} Offers Waifu {your_waifu} "
+                    f"For Your Waifu {their_waifu}."
+                ),
+                color=discord.Color.gold(),
+            ),
+            view=view,
+        )
+
+    async def _request_waifus(self, tags, nsfw=False):
+        # many=true : One Call Yields A Batch, The Rest Become Spares
         params = {
             "included_tags": tags,
             "is_nsfw": "true" if nsfw else "false",
+            "many": "true",
         }
-        try:
-            async with aiohttp.ClientSession() as session:
+
+        async def _request():
+            async with aiohttp.ClientSession(timeout=API_TIMEOUT) as session:
                 async with session.get(API_URL, params=params) as resp:
                     if resp.status != 200:
                         logger.error(f"API Request Failed : {resp.status}")
                         logger.error(f"Response : {await resp.text()}")
-                        return None
+                        raise UpstreamError("waifu.im", resp.status)
+
+                    return await resp.json()
+
+        data = await resilience.call("waifu.im", _request, timeout=API_TIMEOUT.total)
+        return (data or {}).get("images") or []
 
-                    data = await resp.json()
+    def _take_spare(self, key, guild_id, channel_id):
+        spares = self._spares.get(key)
+        if not spares:
+            return None
+
+        for image in spares:
+            reason = self.spawns.reject_reason(guild_id, channel_id, _api_id(image))
+            if reason is None:
+                spares.remove(image)
+                return image
+
+            SPAWN_DEDUPE_SKIPS.inc(reason=reason)
+
+        return None
+
+    async def _refill(self, key, tags, nsfw, guild_id) -> int:
+        # One many=true Batch Into The Spare Pool, Saved Up Front In One Statement
+        images = await self._request_waifus(tags, nsfw)
+        if images:
+            self._save_batch(images, guild_id)
+            pool = self._spares.setdefault(key, deque(maxlen=SPARE_POOL_SIZE))
+            pool.extend(images)
+
+        return len(images)
+
+    async def fetch_waifu(self, tags, nsfw=False, guild_id=0, channel_id=None):
+        # Spares Are Saved With A Rarity Rolled From The Refilling Guild's Weights,
+        # So Pools Are Shared Only Between Guilds With The Same Weight Profile
+        weights = self.get_spawn_config(guild_id).get("rarity_weights") or {}
+        profile = json.dumps(weights, sort_keys=True)
+
+        # Spares First - Only Call The API When None Of Them Fit This Channel
+        key = (tuple(sorted(tags)), bool(nsfw), profile)
+        image = self._take_spare(key, guild_id, channel_id)
+
+        if image is None:
+            # Concurrent Misses For The Same Query And Profile Share One Refill,
+            # Then Each Takes Its Own Image Out Of The Pool
+            params = {"included_tags": tags, "is_nsfw": bool(nsfw), "weights": profile}
+            try:
+                fetched, _ = await resilience.coalesce(
+                    "waifu.im",
+                    params,
+                    lambda: self._refill(key, tags, nsfw, guild_id),
+                )
+            except CircuitOpenError as e:
+                logger.warning("Waifu.im Unavailable, Falling Back : %s", e)
+                fetched = None
+            except UpstreamError as e:
+                if not e.transient:
+                    return None
+                fetched = None
+            except Exception:
+                logger.exception("Error Fetching From Waifu.im API")
+                fetched = None
+
+            if fetched is not None:
+                if not fetched:
+                    return None
+
+                image = self._take_spare(key, guild_id, channel_id)
 
-                    if not data or "images" not in data or not data["images"]:
-                        return None
+            if image is None:
+                image = self._local_waifu(tags, nsfw, guild_id)
 
-                    return data["images"][0]
+        if image is not None:
+            self.spawns.mark_spawned(channel_id, _api_id(image))
+
+        return image
+
+    def _local_waifu(self, tags, nsfw=False, guild_id=0):
+        # Re-Serve A Stored, Unclaimed Waifu While The API Is Down
+        if not self.db:
+            return None
 
+        try:
+            tag = tags[0] if tags else "waifu"
+            row = self.db.get_random_waifu(guild_id, tag, nsfw)
         except Exception:
-            logger.exception("Error Fetching From Waifu.im API")
+            logger.exception("Failed Loading Fallback Waifu")
             return None
 
+        if not row:
+            return None
+
+        try:
+            tag_names = json.loads(row[8]) if row[8] else []
+        except Exception:
+            tag_names = []
+
+        return {
+            "image_id": row[1],
+            "url": row[2],
+            "preview_url": row[3],
+            "source": row[4],
+            "artist": {"name": row[5], "twitter": row[6]} if row[5] else None,
+            "is_nsfw": bool(row[7]),
+            "tags": [{"name": t} for t in tag_names],
+            "_waifu_id": row[0],
+        }
+
     @discord.slash_command(name="waifu", description="Get A Random Waifu Image")
     @option(
         "tag",
@@ -364,58 +975,39 @@ class Waifu(commands.Cog):
         required=False,
         default="waifu",
     )
+    @ack_budget("waifu")
+    @rate_limited("waifu")
     async def waifu_cmd(self, ctx: discord.ApplicationContext, tag: str = "waifu"):
         try:
-            await ctx.defer()
-
             if tag not in WAIFU_CATEGORIES:
                 logger.error(f"Invalid Category : {tag}")
-                return await ctx.respond(
+                return await respond(
+                    ctx,
                     embed=discord.Embed(
                         title="❌ Error",
                         description=f"Invalid Category.\n### Please Choose From:\n\n{' | '.join(WAIFU_CATEGORIES)}",
                         color=discord.Color.red(),
-                    )
+                    ),
                 )
 
-            image = await self.fetch_waifu([tag], nsfw=False)
+            image = await self.fetch_waifu(
+                [tag],
+                nsfw=False,
+                guild_id=ctx.guild_id or 0,
+                channel_id=ctx.channel_id,
+            )
             if not image:
                 logger.error(f"Invalid Category Or API Error : {tag}")
-                return await ctx.respond(
+                return await respond(
+                    ctx,
                     embed=discord.Embed(
                         title="❌ Error",
                         description="Invalid Category Or API Error.\n### Please Try Again Later.",
                         color=discord.Color.red(),
-                    )
+                    ),
                 )
 
-            try:
-                if self.db:
-                    waifu_api_id = (
-                        image.get("image_id")
-                        or image.get("image_id")
-                        or image.get("signature")
-                    )
-                    artist = image.get("artist") or {}
-                    tags = [t.get("name") for t in image.get("tags", [])]
-                    self.db.add_waifu(
-                        waifu_api_id,
-                        image.get("url"),
-                        image.get("preview_url"),
-                        image.get("source"),
-                        artist.get("name") if isinstance(artist, dict) else None,
-                        artist.get("twitter") if isinstance(artist, dict) else None,
-                        bool(image.get("is_nsfw", False)),
-                        json.dumps(tags),
-                    )
-                    waifu_row = self.db.get_waifu_by_api_id(waifu_api_id)
-                    waifu_db_id = waifu_row[0] if waifu_row else None
-                else:
-                    waifu_db_id = None
-
-            except Exception:
-                logger.exception("Failed saving waifu to DB")
-                waifu_db_id = None
+            waifu_db_id, tier = self._save_waifu(image, ctx.guild_id or 0)
 
             embed = discord.Embed(
                 title=f"✨ Oni Chann ~ {tag.capitalize()}!",
@@ -432,24 +1024,26 @@ class Waifu(commands.Cog):
                 ", ".join([t.get("name") for t in image.get("tags", [])]) or "None"
             )
             embed.add_field(name="Tags", value=tags_list, inline=True)
+            self._rarity_field(embed, tier)
             embed.set_footer(
                 text=f"Requested By {ctx.author.name}",
                 icon_url=ctx.author.display_avatar.url,
             )
 
-            view = ClaimView(self, waifu_db_id)
+            view = ClaimView(self, waifu_db_id, _api_id(image), tier.tier)
 
-            await ctx.respond(embed=embed, view=view)
+            await respond(ctx, embed=embed, view=view)
             logger.info(f"Sent Waifu Image ( {tag.capitalize()} ) To {ctx.author.name}")
 
         except Exception as e:
             logger.exception("Error In Waifu Command Execution : %s", e)
-            await ctx.respond(
-                discord.Embed(
+            await respond(
+                ctx,
+                embed=discord.Embed(
                     title="❌ Error",
                     description=f"An Error Occurred While Fetching The Waifu Image.\n```{e}```",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
     @discord.slash_command(name="nwaifu", description="Get A Random NSFW Waifu Image")
@@ -460,55 +1054,41 @@ class Waifu(commands.Cog):
         required=False,
         default="hentai",
     )
+    @ack_budget("nwaifu")
+    @rate_limited("nwaifu")
     async def nsfw_waifu_cmd(
         self, ctx: discord.ApplicationContext, tag: str = "hentai"
     ):
         try:
-            await ctx.defer()
-
             if tag not in NWAIFU_CATEGORIES:
                 logger.error(f"Invalid Category : {tag}")
-                return await ctx.respond(
+                return await respond(
+                    ctx,
                     embed=discord.Embed(
                         title="❌ Error",
                         description=f"Invalid Category.\n### Please Choose From:\n\n{' | '.join(NWAIFU_CATEGORIES)}",
                         color=discord.Color.red(),
-                    )
+                    ),
                 )
 
-            image = await self.fetch_waifu([tag], nsfw=True)
+            image = await self.fetch_waifu(
+                [tag],
+                nsfw=True,
+                guild_id=ctx.guild_id or 0,
+                channel_id=ctx.channel_id,
+            )
             if not image:
                 logger.error(f"Invalid Category Or API Error : {tag}")
-                return await ctx.respond(
+                return await respond(
+                    ctx,
                     embed=discord.Embed(
                         title="❌ Error",
                         description="Invalid Category Or API Error.\n### Please Try Again Later.",
                         color=discord.Color.red(),
-                    )
+                    ),
                 )
-            # save to DB
-            try:
-                if self.db:
-                    waifu_api_id = image.get("image_id") or image.get("signature")
-                    artist = image.get("artist") or {}
-                    tags = [t.get("name") for t in image.get("tags", [])]
-                    self.db.add_waifu(
-                        waifu_api_id,
-                        image.get("url"),
-                        image.get("preview_url"),
-                        image.get("source"),
-                        artist.get("name") if isinstance(artist, dict) else None,
-                        artist.get("twitter") if isinstance(artist, dict) else None,
-                        bool(image.get("is_nsfw", False)),
-                        json.dumps(tags),
-                    )
-                    waifu_row = self.db.get_waifu_by_api_id(waifu_api_id)
-                    waifu_db_id = waifu_row[0] if waifu_row else None
-                else:
-                    waifu_db_id = None
-            except Exception:
-                logger.exception("Failed saving waifu to DB")
-                waifu_db_id = None
+
+            waifu_db_id, tier = self._save_waifu(image, ctx.guild_id or 0)
 
             embed = discord.Embed(
                 title=f"✨ Oni Chann ~ {tag.capitalize()}!",
@@ -524,56 +1104,74 @@ class Waifu(commands.Cog):
                 ", ".join([t.get("name") for t in image.get("tags", [])]) or "None"
             )
             embed.add_field(name="Tags", value=tags_list, inline=True)
+            self._rarity_field(embed, tier)
             embed.set_footer(
                 text=f"Requested By {ctx.author.name}",
                 icon_url=ctx.author.display_avatar.url,
             )
 
-            view = ClaimView(self, waifu_db_id)
+            view = ClaimView(self, waifu_db_id, _api_id(image), tier.tier)
 
-            await ctx.respond(embed=embed, view=view)
+            await respond(ctx, embed=embed, view=view)
             logger.info(
                 f"Sent NSFW Waifu Image ( {tag.capitalize()} ) To {ctx.author.name}"
             )
 
         except Exception as e:
             logger.exception("Error In NSFW Waifu Command Execution : %s", e)
-            await ctx.respond(
-                discord.Embed(
+            await respond(
+                ctx,
+                embed=discord.Embed(
                     title="❌ Error",
                     description=f"An Error Occurred While Fetching The Waifu Image.\n```{e}```",
                     color=discord.Color.red(),
-                )
+                ),
             )
 
 
 class ClaimView(discord.ui.View):
-    def __init__(self, cog: Waifu, waifu_db_id: int | None):
+    def __init__(self, cog: Waifu, waifu_db_id: int | None, api_id=None, tier=0):
         super().__init__(timeout=None)
         self.cog = cog
         self.waifu_db_id = waifu_db_id
+        self.api_id = api_id
+        self.tier = tier
 
     @discord.ui.button(
         label="", style=discord.ButtonStyle.secondary, custom_id="claim_waifu", emoji="♥️"
     )
+    @ack_budget("claim", ephemeral=True)
     async def claim_button(
         self, button: discord.ui.Button, interaction: discord.Interaction
     ):
+        with COMPONENT_LATENCY.time(component="claim"):
+            await self._claim(button, interaction)
+
+    async def _claim(self, button: discord.ui.Button, interaction: discord.Interaction):
         # Basic Checks
         user = interaction.user
         if not self.cog.db:
-            return await interaction.response.send_message(
-                "Database Unavailable.", ephemeral=True
-            )
+            return await respond(interaction, "Database Unavailable.", ephemeral=True)
 
         # Check If Waifu Exsist In DB
         if not self.waifu_db_id:
-            return await interaction.response.send_message(
-                "This Waifu Cannot Be Claimed!", ephemeral=True
+            return await respond(
+                interaction, "This Waifu Cannot Be Claimed!", ephemeral=True
+            )
+
+        # Claims Are Per Guild - The Same Waifu Can Have One Owner In Each
+        guild_id = interaction.guild_id or 0
+        latch_key = (guild_id, self.waifu_db_id)
+
+        # First-Winner Latch - Losers Are Turned Away Here Without Touching The DB
+        if not self.cog._latch_claim(latch_key):
+            CLAIM_LATCH_REJECTS.inc()
+            return await respond(
+                interaction, "This Waifu Is Already Claimed!", ephemeral=True
             )
 
         # Cooldown Check
-        last = self.cog.db.get_last_claim_time(user.id)
+        last = self.cog.db.get_last_claim_time(guild_id, user.id)
         if last and last[0]:
             try:
                 last_time = datetime.datetime.strptime(last[0], "%Y-%m-%d %H:%M:%S")
@@ -583,7 +1181,9 @@ class ClaimView(discord.ui.View):
                 cooldown_end = int(time.time() + (self.cog.claim_cooldown - elapsed))
 
                 if elapsed < self.cog.claim_cooldown:
-                    return await interaction.response.send_message(
+                    self.cog._release_claim(latch_key)
+                    return await respond(
+                        interaction,
                         f"You Can Claim Every 2 Hours."
                         f"Try Again At <t:{cooldown_end}:R>.",
                         ephemeral=True,
@@ -591,34 +1191,43 @@ class ClaimView(discord.ui.View):
             except Exception:
                 pass
 
-        # Check If Waifu Already Claimed
-        if self.cog.db.is_waifu_claimed(self.waifu_db_id):
-            return await interaction.response.send_message(
-                "This Waifu Is Already Claimed!", ephemeral=True
-            )
-
         try:
-            self.cog.db.add_user(user.id, str(user))
-
-            user_row = self.cog.db.get_user(user.id)
-            internal_user_id = user_row[0] if user_row else None
-            current_count = user_row[3] if user_row and len(user_row) > 3 else 0
-            new_count = (current_count or 0) + 1
-
-            self.cog.db.update_user_waifu_count(user.id, new_count)
+            db = self.cog.db
+            new_count = await db.writer.submit(
+                db.claim_waifu,
+                guild_id,
+                user.id,
+                str(user),
+                self.waifu_db_id,
+                self.tier,
+            )
+        except sqlite3.IntegrityError:
+            new_count = None
+        except Exception:
+            self.cog._release_claim(latch_key)
+            logger.exception("Error While Processing Claim")
+            return await respond(
+                interaction,
+                "Failed To Claim Waifu Due To Internal Error!",
+                ephemeral=True,
+            )
 
-            waifu_internal_id = self.waifu_db_id
+        if new_count is None:
+            return await respond(
+                interaction, "This Waifu Is Already Claimed!", ephemeral=True
+            )
 
-            if internal_user_id is None or waifu_internal_id is None:
-                raise RuntimeError("Invalid User Or Waifu ID")
+        self.cog.spawns.mark_claimed(guild_id, self.api_id)
 
-            self.cog.db.add_claim(internal_user_id, waifu_internal_id)
-            self.cog.db.update_last_claim(user.id)
+        try:
+            user_id = db.get_user(guild_id, user.id)[0]
+            self.cog.collection_tags.link(guild_id, user.id, user_id)
+            self.cog._move_tags(self.waifu_db_id, to_user=user_id)
         except Exception:
-            logger.exception("Error While Processing Claim")
-            return await interaction.response.send_message(
-                "Failed To Claim Waifu Due To Internal Error!", ephemeral=True
-            )
+            logger.exception("Failed Updating Collection Tags After Claim")
+
+        button.disabled = True
+        self.stop()
 
         try:
             msg = interaction.message
@@ -629,14 +1238,74 @@ class ClaimView(discord.ui.View):
                 text=f"Claimed By {user.display_name} 🫶",
                 icon_url=user.display_avatar.url,
             )
-            await msg.edit(embed=embed, view=None)
+            # Ack And Edit In One Call, Showing The Disabled Button
+            await edit_message(interaction, embed=embed, view=self)
         except Exception:
             logger.exception("Failed to edit message after claim")
 
-        await interaction.response.send_message(
-            "You Claimed This Waifu! 🫶", ephemeral=True
+        await respond(interaction, "You Claimed This Waifu! 🫶", ephemeral=True)
+
+
+class TradeView(discord.ui.View):
+    def __init__(
+        self, cog: Waifu, guild_id: int, target_id: int, offer: tuple, request: tuple
+    ):
+        super().__init__(timeout=120)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.target_id = target_id
+        self.offer = offer
+        self.request = request
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.target_id:
+            return True
+
+        await respond(interaction, "This Trade Isn't For You!", ephemeral=True)
+        return False
+
+    async def _close(self, interaction: discord.Interaction, text: str, color):
+        for item in self.children:
+            item.disabled = True
+        self.stop()
+
+        embed = discord.Embed(title="Trade", description=text, color=color)
+        await edit_message(interaction, embed=embed, view=self)
+
+    @discord.ui.button(label="Accept", style=discord.ButtonStyle.success, emoji="✅")
+    @ack_budget("trade_accept", ephemeral=True)
+    async def accept(self, button: discord.ui.Button, interaction: discord.Interaction):
+        db = self.cog.db
+        try:
+            await db.writer.submit(
+                db.trade_waifus, self.guild_id, self.offer, self.request
+            )
+        except StaleClaimError:
+            return await self._close(
+                interaction,
+                "Trade Expired - One Of The Waifus Changed Hands.",
+                discord.Color.red(),
+            )
+        except Exception:
+            logger.exception("Error While Processing Trade")
+            return await self._close(
+                interaction, "Trade Failed Due To Internal Error!", discord.Color.red()
+            )
+
+        self.cog._move_tags(self.offer[0], self.offer[1], self.request[1])
+        self.cog._move_tags(self.request[0], self.request[1], self.offer[1])
+
+        await self._close(
+            interaction,
+            f"Traded Waifu {self.offer[0]} ⇄ Waifu {self.request[0]}! 🤝",
+            discord.Color.green(),
         )
 
+    @discord.ui.button(label="Decline", style=discord.ButtonStyle.danger, emoji="✖️")
+    @ack_budget("trade_decline", ephemeral=True)
+    async def decline(self, button: discord.ui.Button, interaction: discord.Interaction):
+        await self._close(interaction, "Trade Declined.", discord.Color.red())
+
 
 class PagesView(discord.ui.View):
     def __init__(self, pages: list[discord.Embed], author_id: int):
@@ -649,14 +1318,92 @@ class PagesView(discord.ui.View):
         return interaction.user.id == self.author_id
 
     @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary, emoji="⬅️")
+    @ack_budget("collection_pages", ephemeral=True)
     async def prev(self, button: discord.ui.Button, interaction: discord.Interaction):
         self.page = (self.page - 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+        await edit_message(interaction, embed=self.pages[self.page], view=self)
 
     @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="➡️")
+    @ack_budget("collection_pages", ephemeral=True)
     async def next(self, button: discord.ui.Button, interaction: discord.Interaction):
         self.page = (self.page + 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+        await edit_message(interaction, embed=self.pages[self.page], view=self)
+
+
+class GridView(discord.ui.View):
+    # GRID x GRID Thumbnails Per Page - Collages Are Cached Per Collection Version
+    def __init__(self, cog: Waifu, waifus: list, user_id: int, member, author_id: int):
+        super().__init__(timeout=300)
+        self.cog = cog
+        self.waifus = waifus
+        self.user_id = user_id
+        self.member = member
+        self.author_id = author_id
+        self.page = 0
+        self.per_page = collage.GRID * collage.GRID
+        self.pages = (len(waifus) + self.per_page - 1) // self.per_page
+        self.version = collage.collection_version(waifus)
+        self._prefetch = None
+
+    def _cells(self, page: int) -> list:
+        return self.waifus[page * self.per_page : (page + 1) * self.per_page]
+
+    async def _collage(self, page: int) -> bytes:
+        urls = [w[3] or w[2] for w in self._cells(page)]
+        renderer = collage.get_collage_renderer(self.cog.bot)
+        return await renderer.render((self.user_id, page, self.version), urls)
+
+    async def render(self) -> tuple[discord.Embed, discord.File]:
+        data = await self._collage(self.page)
+
+        lines = [
+            f"`{i}.` **{w[0]}** {rarity(w[9]).stars} {w[5] or 'Unknown'}"
+            for i, w in enumerate(self._cells(self.page), start=1)
+        ]
+        embed = discord.Embed(
+            title=f"{self.member.display_name}'s Collection",
+            description="\n".join(lines),
+            color=discord.Color.random(),
+        )
+        embed.set_image(url="attachment://collection.jpg")
+        embed.set_footer(
+            text=f"Page {self.page + 1}/{self.pages} • {len(self.waifus)} Waifus"
+        )
+
+        # Warm The Next Page While This One Is Being Looked At
+        if self.pages > 1:
+            self._prefetch = asyncio.ensure_future(
+                self._collage((self.page + 1) % self.pages)
+            )
+            self._prefetch.add_done_callback(
+                lambda t: t.cancelled() or t.exception()
+            )
+
+        return embed, discord.File(io.BytesIO(data), filename="collection.jpg")
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    async def _show(self, interaction: discord.Interaction, step: int):
+        self.page = (self.page + step) % self.pages
+        embed, file = await self.render()
+        await edit_message(
+            interaction, embed=embed, file=file, attachments=[], view=self
+        )
+
+    @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary, emoji="⬅️")
+    @ack_budget("collection_grid", ephemeral=True)
+    async def prev(self, button: discord.ui.Button, interaction: discord.Interaction):
+        await self._show(interaction, -1)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="➡️")
+    @ack_budget("collection_grid", ephemeral=True)
+    async def next(self, button: discord.ui.Button, interaction: discord.Interaction):
+        await self._show(interaction, 1)
+
+    async def on_timeout(self):
+        if self._prefetch is not None:
+            self._prefetch.cancel()
 
 
 def setup(bot):
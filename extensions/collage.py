@@ -0,0 +1,185 @@
+import io
+import os
+import time
+import asyncio
+import aiohttp
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from extensions.logger import setup_logger
+from extensions.metrics import CACHE_REQUESTS, histogram
+from extensions.resilience import SingleFlight
+
+try:
+    from PIL import Image, ImageDraw, ImageOps
+except ImportError:
+    # Optional : pip install "astrumotaku[collage]" - /collection Falls Back To Pages
+    Image = None
+
+logger = setup_logger(__name__)
+
+# N x N Thumbnails Per Collage Page
+GRID = 3
+THUMB_SIZE = 256
+
+COLLAGE_WORKERS = int(os.getenv("COLLAGE_WORKERS") or 2)
+COLLAGE_CACHE_SIZE = 64
+
+# Thumbnail Downloads In Flight Across Every Render
+MAX_DOWNLOADS = 16
+MAX_THUMB_BYTES = 8 * 1024 * 1024
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+COLLAGE_RENDER = histogram("collage_seconds", "Collage build time by stage")
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def render_grid(images: list, grid: int = GRID, size: int = THUMB_SIZE) -> bytes:
+    # Runs In A Worker Process : Raw Image Bytes (None = Missing) -> JPEG Bytes
+    canvas = Image.new("RGB", (grid * size, grid * size), (32, 34, 37))
+    draw = ImageDraw.Draw(canvas)
+
+    for i, raw in enumerate(images[: grid * grid]):
+        x, y = (i % grid) * size, (i // grid) * size
+
+        if raw:
+            try:
+                with Image.open(io.BytesIO(raw)) as img:
+                    img.draft("RGB", (size, size))
+                    thumb = ImageOps.fit(img.convert("RGB"), (size, size))
+                canvas.paste(thumb, (x, y))
+            except Exception:
+                draw.text((x + size // 2, y + size // 2), "?", anchor="mm")
+
+        # Cell Number Matches The Numbered List In The Embed
+        draw.rectangle((x, y, x + 28, y + 22), fill=(0, 0, 0))
+        draw.text((x + 14, y + 11), str(i + 1), fill=(255, 255, 255), anchor="mm")
+
+    out = io.BytesIO()
+    canvas.save(out, "JPEG", quality=85, optimize=True)
+    return out.getvalue()
+
+
+def collection_version(waifus) -> int:
+    # Changes Whenever The Collection's Members Or Their Order Do
+    return hash(tuple(w[0] for w in waifus))
+
+
+class CollageRenderer:
+    # Downloads Thumbnails Concurrently Over One Session, Renders In A Process
+    # Pool, And Keeps The Last COLLAGE_CACHE_SIZE Collages By
+    # (user_id, page, collection_version)
+
+    def __init__(self, workers: int = COLLAGE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._session = None
+        self._downloads = asyncio.Semaphore(MAX_DOWNLOADS)
+        self._flights = SingleFlight()
+        self.cache: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _http(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=DOWNLOAD_TIMEOUT)
+        return self._session
+
+    async def _download(self, url):
+        if not url:
+            return None
+
+        async with self._downloads:
+            try:
+                async with self._http().get(url) as resp:
+                    if resp.status != 200:
+                        return None
+                    if (resp.content_length or 0) > MAX_THUMB_BYTES:
+                        return None
+
+                    # Chunked Responses Have No Length Up Front - Cap While Reading
+                    data = bytearray()
+                    async for chunk in resp.content.iter_chunked(64 * 1024):
+                        data += chunk
+                        if len(data) > MAX_THUMB_BYTES:
+                            return None
+
+                    return bytes(data)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return None
+
+    async def _render(self, urls: list) -> bytes:
+        start = time.perf_counter()
+        images = await asyncio.gather(*(self._download(u) for u in urls))
+        COLLAGE_RENDER.observe(time.perf_counter() - start, stage="download")
+
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(self._pool(), render_grid, list(images))
+        COLLAGE_RENDER.observe(time.perf_counter() - start, stage="render")
+        return data
+
+    async def render(self, key: tuple, urls: list) -> bytes:
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache.move_to_end(key)
+            CACHE_REQUESTS.inc(cache="collage", result="hit")
+            return cached
+
+        CACHE_REQUESTS.inc(cache="collage", result="miss")
+
+        # A Double-Click Joins The Render Already Running For This Page
+        data, _ = await self._flights.do(
+            ("collage", *key), lambda: self._build(key, urls)
+        )
+        return data
+
+    async def _build(self, key: tuple, urls: list) -> bytes:
+        # Cached By The Shared Task Itself, So It Lands Even If Every Caller Left
+        data = await self._render(urls)
+        self.cache[key] = data
+        while len(self.cache) > COLLAGE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        return data
+
+    def sizes(self) -> tuple[int, int]:
+        return len(self.cache), sum(len(v) for v in self.cache.values())
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+        if self._executor is not None:
+            # Waits For Workers To Exit, Off The Loop
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+
+def get_collage_renderer(bot) -> CollageRenderer:
+    renderer = getattr(bot, "collage_renderer", None)
+    if renderer is None:
+        renderer = bot.collage_renderer = CollageRenderer()
+
+    return renderer
+
+
+def close_collage_renderer(bot):
+    # Detached So A Reload Starts A Fresh Renderer - Its Pool Shuts Down Off The Loop
+    renderer = getattr(bot, "collage_renderer", None)
+    if renderer is None:
+        return None
+
+    bot.collage_renderer = None
+    task = bot.loop.create_task(renderer.close())
+    task.add_done_callback(_log_failed_close)
+    return task
+
+
+def _log_failed_close(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Collage Renderer Close Failed : %s", task.exception())
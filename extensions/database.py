@@ -1,27 +1,263 @@
+import os
+import re
+import json
 import sqlite3
+import asyncio
+from extensions.logger import setup_logger
+from extensions.rarity import RARITIES
+from extensions.metrics import DB_LATENCY, histogram, timed
+
+logger = setup_logger(__name__)
+
+# Group Commit : Gather Writes For Up To WINDOW Seconds Or MAX_BATCH Ops
+GROUP_COMMIT_WINDOW = 0.005
+GROUP_COMMIT_MAX_BATCH = 64
+
+# Guild That Pre-Partitioning Users / Claims Are Filed Under
+LEGACY_GUILD_ID = int(os.getenv("LEGACY_GUILD_ID") or 0)
+
+TRIGGERS = (
+    "trg_claims_insert",
+    "trg_claims_delete",
+    "trg_claims_owner",
+    # Retired - Dropped On Start, No Longer Created
+    "trg_waifus_rarity",
+    "trg_waifus_fts_insert",
+    "trg_waifus_fts_delete",
+    "trg_waifus_fts_update",
+)
+
+# Search Columns In waifus_fts Order, With Their bm25 Weights
+FTS_COLUMNS = ("artist_name", "source", "tags")
+FTS_WEIGHTS = (10.0, 2.0, 5.0)
+
+BATCH_SIZE = histogram(
+    "db_group_commit_batch_size",
+    "Write operations per group commit",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+
+# SELECT w.* Shape, But rarity Comes From The Guild's Claim When There Is One.
+# waifus.rarity Is Only The Catalogue Default For Unclaimed Rows
+WAIFU_CLAIM_COLUMNS = (
+    "w.id, w.waifu_api_id, w.url, w.preview_url, w.source, w.artist_name, "
+    "w.artist_url, w.is_nsfw, w.tags, COALESCE(c.rarity, w.rarity) AS rarity"
+)
+
+# Rows Per Multi-Row Upsert - Keeps Parameters Well Under SQLite's Limit
+UPSERT_CHUNK = 100
+
+UPSERT_WAIFUS = """
+    INSERT INTO waifus (waifu_api_id, url, preview_url, source, artist_name, artist_url, is_nsfw, tags, rarity)
+    VALUES {rows}
+    ON CONFLICT (waifu_api_id) DO UPDATE SET
+        url = excluded.url,
+        preview_url = excluded.preview_url,
+        source = excluded.source,
+        artist_name = excluded.artist_name,
+        artist_url = excluded.artist_url,
+        tags = excluded.tags
+    RETURNING id, waifu_api_id, rarity
+"""
+
+
+def _waifu_values(image, rarity):
+    # waifu.im Image Dict -> waifus Column Values
+    artist = image.get("artist")
+    if not isinstance(artist, dict):
+        artist = {}
+
+    return (
+        image.get("image_id") or image.get("signature"),
+        image.get("url"),
+        image.get("preview_url"),
+        image.get("source"),
+        artist.get("name"),
+        artist.get("twitter"),
+        bool(image.get("is_nsfw", False)),
+        json.dumps([t.get("name") for t in image.get("tags", [])]),
+        rarity,
+    )
+
+
+class StaleClaimError(Exception):
+    # A Claim Changed Owner Or Version Between Read And Write
+    pass
+
+
+class GroupCommitWriter:
+    def __init__(
+        self,
+        db,
+        window: float = GROUP_COMMIT_WINDOW,
+        max_batch: int = GROUP_COMMIT_MAX_BATCH,
+    ):
+        self.db = db
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((fn, args, kwargs, future))
+
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return await future
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        cursor = self.db.cursor
+        results = []
+
+        with DB_LATENCY.time(method="group_commit"):
+            try:
+                if self.db.connection.in_transaction:
+                    self.db.connection.commit()
+
+                cursor.execute("BEGIN")
+                self.db._batching = True
+
+                # Each Op Gets A Savepoint So One Failure Doesn't Sink The Batch
+                for fn, args, kwargs, future in batch:
+                    cursor.execute("SAVEPOINT op")
+                    try:
+                        results.append((future, fn(*args, **kwargs), None))
+                        cursor.execute("RELEASE op")
+                    except Exception as e:
+                        cursor.execute("ROLLBACK TO op")
+                        cursor.execute("RELEASE op")
+                        results.append((future, None, e))
+
+                self.db._batching = False
+                self.db.connection.commit()
+            except Exception as e:
+                self.db._batching = False
+                logger.exception("Group Commit Failed")
+                try:
+                    self.db.connection.rollback()
+                except Exception:
+                    pass
+
+                results = [(future, None, e) for _, _, _, future in batch]
+
+        BATCH_SIZE.observe(len(batch))
+
+        for future, result, error in results:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
 
 
 class database:
     def __init__(self, db_path):
         self.connection = sqlite3.connect(db_path)
         self.cursor = self.connection.cursor()
+        self._batching = False
         self._create_table()
 
+        self.writer = GroupCommitWriter(self)
+
+    def _columns(self, table):
+        self.cursor.execute(f"PRAGMA table_info({table})")
+        return {row[1] for row in self.cursor.fetchall()}
+
+    def _ensure_column(self, table, column, definition):
+        if column not in self._columns(table):
+            self.cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def _commit(self):
+        # Inside A Group Commit The Writer Commits Once For The Whole Batch
+        if not self._batching:
+            self.connection.commit()
+
+    def _partition_users(self):
+        # users.discord_id Was Globally UNIQUE - Rebuild Keyed By (guild_id, discord_id).
+        # Row ids Are Kept So claims.user_id Still Points At The Same Users.
+        self._ensure_column("users", "rarity_score", "INTEGER NOT NULL DEFAULT 0")
+
+        self.cursor.execute("DROP TABLE IF EXISTS users_partitioned")
+        self.cursor.execute(
+            """
+            CREATE TABLE users_partitioned (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                discord_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                waifu_count INTEGER DEFAULT 0,
+                last_claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                rarity_score INTEGER NOT NULL DEFAULT 0,
+                guild_id INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (guild_id, discord_id)
+            )
+            """
+        )
+        self.cursor.execute(
+            """
+            INSERT INTO users_partitioned
+                (id, discord_id, user_name, waifu_count, last_claimed_at, rarity_score, guild_id)
+            SELECT id, discord_id, user_name, waifu_count, last_claimed_at, rarity_score, ?
+            FROM users
+            """,
+            (LEGACY_GUILD_ID,),
+        )
+        moved = self.cursor.rowcount
+
+        self.cursor.execute("DROP TABLE users")
+        self.cursor.execute("ALTER TABLE users_partitioned RENAME TO users")
+        self.cursor.execute(
+            """
+            UPDATE claims SET guild_id = ?
+            """,
+            (LEGACY_GUILD_ID,),
+        )
+        self.connection.commit()
+
+        if moved:
+            logger.warning(f"Moved {moved} Existing Users Into Guild {LEGACY_GUILD_ID}")
+
     def _create_table(self):
-        # Users
+        # Rebuilt / Recreated Below - Drop First So No Trigger Points At A Missing Table
+        for name in TRIGGERS:
+            self.cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+        # Users - One Row Per Member Per Guild; Columns Kept In Their Original Order
         self.cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                discord_id INTEGER NOT NULL UNIQUE,
+                discord_id INTEGER NOT NULL,
                 user_name TEXT NOT NULL,
                 waifu_count INTEGER DEFAULT 0,
-                last_claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                last_claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                rarity_score INTEGER NOT NULL DEFAULT 0,
+                guild_id INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (guild_id, discord_id)
             )
             """
         )
 
-        # Waifus
+        # Waifus - Shared Image Catalogue Across Guilds
         self.cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS waifus (
@@ -33,7 +269,8 @@ class database:
                 artist_name TEXT,
                 artist_url TEXT,
                 is_nsfw BOOLEAN,
-                tags TEXT
+                tags TEXT,
+                rarity INTEGER NOT NULL DEFAULT 0
             )
             """
         )
@@ -46,42 +283,256 @@ class database:
                 user_id INTEGER NOT NULL,
                 waifu_id INTEGER NOT NULL,
                 claimed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                version INTEGER NOT NULL DEFAULT 0,
+                guild_id INTEGER NOT NULL DEFAULT 0,
                 FOREIGN KEY (user_id) REFERENCES users (id),
                 FOREIGN KEY (waifu_id) REFERENCES waifus (id)
             )
             """
         )
 
-        self.connection.commit()
+        # Per-Guild Spawn And Rate Limit Settings, Each A JSON Object Per Guild
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS guild_config (
+                guild_id INTEGER PRIMARY KEY,
+                spawn TEXT NOT NULL
+            )
+            """
+        )
 
-    def add_user(self, discord_id, user_name):
+        self._ensure_column("claims", "version", "INTEGER NOT NULL DEFAULT 0")
+        self._ensure_column("claims", "guild_id", "INTEGER NOT NULL DEFAULT 0")
+        self._ensure_column("waifus", "rarity", "INTEGER NOT NULL DEFAULT 0")
+
+        # Each Guild Rolls Its Own Tier - Existing Claims Keep The Catalogue's
+        if "rarity" not in self._columns("claims"):
+            self._ensure_column("claims", "rarity", "INTEGER NOT NULL DEFAULT 0")
+            self.cursor.execute(
+                """
+                UPDATE claims SET rarity = COALESCE(
+                    (SELECT w.rarity FROM waifus w WHERE w.id = claims.waifu_id), 0
+                )
+                """
+            )
+        self._ensure_column("guild_config", "ratelimit", "TEXT")
+
+        if "guild_id" not in self._columns("users"):
+            self._partition_users()
+
+        # Rarity Tiers - Points Are Mirrored Here So Triggers Can Use Them
         self.cursor.execute(
             """
-            INSERT OR IGNORE INTO users (discord_id, user_name)
-            VALUES (?, ?)
+            CREATE TABLE IF NOT EXISTS rarity_tiers (
+                tier INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                points INTEGER NOT NULL
+            )
+            """
+        )
+        self.cursor.executemany(
+            """
+            INSERT OR REPLACE INTO rarity_tiers (tier, name, points) VALUES (?, ?, ?)
             """,
-            (discord_id, user_name),
+            [(r.tier, r.name, r.points) for r in RARITIES],
+        )
+
+        # One Owner Per Waifu Per Guild - Drop Racing Duplicates Before Enforcing It
+        self.cursor.execute(
+            """
+            DELETE FROM claims
+            WHERE id NOT IN (SELECT MIN(id) FROM claims GROUP BY guild_id, waifu_id)
+            """
+        )
+        if self.cursor.rowcount > 0:
+            logger.warning(f"Removed {self.cursor.rowcount} Duplicate Claim Rows")
+
+        # Global Indexes Superseded By Their Per-Guild Versions
+        for name in (
+            "idx_claims_waifu",
+            "idx_users_waifu_count",
+            "idx_users_rarity_score",
+        ):
+            self.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+        self.cursor.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_claims_guild_waifu
+            ON claims (guild_id, waifu_id)
+            """
+        )
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_claims_user ON claims (user_id)
+            """
+        )
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_users_guild_waifu_count
+            ON users (guild_id, waifu_count DESC)
+            """
+        )
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_users_guild_rarity_score
+            ON users (guild_id, rarity_score DESC)
+            """
+        )
+
+        # users.waifu_count / rarity_score Are Derived From claims - Never Written By Hand
+        points = "COALESCE((SELECT points FROM rarity_tiers WHERE tier = {}.rarity), 0)"
+
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_claims_insert
+            AFTER INSERT ON claims
+            BEGIN
+                UPDATE users SET
+                    waifu_count = COALESCE(waifu_count, 0) + 1,
+                    rarity_score = rarity_score + {points.format("NEW")}
+                WHERE id = NEW.user_id;
+            END
+            """
+        )
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_claims_delete
+            AFTER DELETE ON claims
+            BEGIN
+                UPDATE users SET
+                    waifu_count = COALESCE(waifu_count, 0) - 1,
+                    rarity_score = rarity_score - {points.format("OLD")}
+                WHERE id = OLD.user_id;
+            END
+            """
         )
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_claims_owner
+            AFTER UPDATE OF user_id ON claims
+            WHEN OLD.user_id != NEW.user_id
+            BEGIN
+                UPDATE users SET
+                    waifu_count = COALESCE(waifu_count, 0) - 1,
+                    rarity_score = rarity_score - {points.format("OLD")}
+                WHERE id = OLD.user_id;
+                UPDATE users SET
+                    waifu_count = COALESCE(waifu_count, 0) + 1,
+                    rarity_score = rarity_score + {points.format("NEW")}
+                WHERE id = NEW.user_id;
+            END
+            """
+        )
+        self._create_search_index()
+
         self.connection.commit()
 
-    def get_user(self, discord_id):
+        repaired = self.reconcile_waifu_counts()
+        if repaired:
+            logger.warning(f"Reconciled Waifu Counts For {repaired} Users")
+
+    def _create_search_index(self):
+        # External-Content FTS5 Over waifus - Rows Are Stored Once, Only The Index Here
         self.cursor.execute(
             """
-            SELECT * FROM users WHERE discord_id = ?
+            SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'waifus_fts'
+            """
+        )
+        exists = self.cursor.fetchone() is not None
+
+        columns = ", ".join(FTS_COLUMNS)
+        self.cursor.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS waifus_fts USING fts5(
+                {columns},
+                content = 'waifus',
+                content_rowid = 'id',
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """
+        )
+
+        new_values = ", ".join(f"NEW.{c}" for c in FTS_COLUMNS)
+        old_values = ", ".join(f"OLD.{c}" for c in FTS_COLUMNS)
+        delete_old = f"""
+            INSERT INTO waifus_fts (waifus_fts, rowid, {columns})
+            VALUES ('delete', OLD.id, {old_values});
+        """
+        insert_new = f"""
+            INSERT INTO waifus_fts (rowid, {columns}) VALUES (NEW.id, {new_values});
+        """
+
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_waifus_fts_insert
+            AFTER INSERT ON waifus
+            BEGIN
+                {insert_new}
+            END
+            """
+        )
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_waifus_fts_delete
+            AFTER DELETE ON waifus
+            BEGIN
+                {delete_old}
+            END
+            """
+        )
+        self.cursor.execute(
+            f"""
+            CREATE TRIGGER trg_waifus_fts_update
+            AFTER UPDATE OF {columns} ON waifus
+            BEGIN
+                {delete_old}
+                {insert_new}
+            END
+            """
+        )
+
+        if not exists:
+            # First Run Against An Existing Catalogue - Index What's Already There
+            self.cursor.execute(
+                """
+                INSERT INTO waifus_fts (waifus_fts) VALUES ('rebuild')
+                """
+            )
+            logger.info("Built Waifu Search Index")
+
+    @timed(DB_LATENCY)
+    def add_user(self, guild_id, discord_id, user_name):
+        self.cursor.execute(
+            """
+            INSERT OR IGNORE INTO users (guild_id, discord_id, user_name)
+            VALUES (?, ?, ?)
+            """,
+            (guild_id, discord_id, user_name),
+        )
+        self._commit()
+
+    @timed(DB_LATENCY)
+    def get_user(self, guild_id, discord_id):
+        self.cursor.execute(
+            """
+            SELECT * FROM users WHERE guild_id = ? AND discord_id = ?
             """,
-            (discord_id,),
+            (guild_id, discord_id),
         )
         return self.cursor.fetchone()
 
-    def update_user_waifu_count(self, discord_id, count):
+    @timed(DB_LATENCY)
+    def update_user_waifu_count(self, guild_id, discord_id, count):
         self.cursor.execute(
             """
-            UPDATE users SET waifu_count = ? WHERE discord_id = ?
+            UPDATE users SET waifu_count = ? WHERE guild_id = ? AND discord_id = ?
             """,
-            (count, discord_id),
+            (count, guild_id, discord_id),
         )
-        self.connection.commit()
+        self._commit()
 
+    @timed(DB_LATENCY)
     def add_waifu(
         self,
         waifu_api_id,
@@ -92,11 +543,12 @@ class database:
         artist_url,
         is_nsfw,
         tags,
+        rarity=0,
     ):
         self.cursor.execute(
             """
-            INSERT OR IGNORE INTO waifus (waifu_api_id, url, preview_url, source, artist_name, artist_url, is_nsfw, tags)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT OR IGNORE INTO waifus (waifu_api_id, url, preview_url, source, artist_name, artist_url, is_nsfw, tags, rarity)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 waifu_api_id,
@@ -107,10 +559,48 @@ class database:
                 artist_url,
                 is_nsfw,
                 tags,
+                rarity,
             ),
         )
-        self.connection.commit()
+        self._commit()
+
+    @timed(DB_LATENCY)
+    def upsert_waifu(self, image, rarity=0):
+        # One Statement, One Commit : Returns (id, stored rarity) - Rarity Is Only
+        # Set On First Insert, So A Re-Spawned Waifu Keeps Hers
+        self.cursor.execute(
+            UPSERT_WAIFUS.format(rows="(?, ?, ?, ?, ?, ?, ?, ?, ?)"),
+            _waifu_values(image, rarity),
+        )
+        row = self.cursor.fetchone()
+        self._commit()
+        return row[0], row[2]
 
+    @timed(DB_LATENCY)
+    def upsert_waifus(self, images, rarities):
+        # Batched upsert_waifu : {waifu_api_id: (id, stored rarity)}
+        values = {}
+        for image, rarity in zip(images, rarities):
+            row = _waifu_values(image, rarity)
+            if row[0] is not None:
+                values.setdefault(row[0], row)
+
+        saved = {}
+        rows = list(values.values())
+        for i in range(0, len(rows), UPSERT_CHUNK):
+            chunk = rows[i : i + UPSERT_CHUNK]
+            placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(chunk))
+            self.cursor.execute(
+                UPSERT_WAIFUS.format(rows=placeholders),
+                [value for row in chunk for value in row],
+            )
+            for waifu_id, api_id, rarity in self.cursor.fetchall():
+                saved[api_id] = (waifu_id, rarity)
+
+        self._commit()
+        return saved
+
+    @timed(DB_LATENCY)
     def get_waifu_by_api_id(self, waifu_api_id):
         self.cursor.execute(
             """
@@ -120,16 +610,79 @@ class database:
         )
         return self.cursor.fetchone()
 
-    def add_claim(self, user_id, waifu_id):
+    @timed(DB_LATENCY)
+    def get_random_waifu(self, guild_id, tag, is_nsfw=False):
+        # Unclaimed In This Guild - Other Guilds' Claims Don't Count
         self.cursor.execute(
             """
-            INSERT INTO claims (user_id, waifu_id)
-            VALUES (?, ?)
+            SELECT * FROM waifus
+            WHERE is_nsfw = ?
+              AND tags LIKE ?
+              AND id NOT IN (SELECT waifu_id FROM claims WHERE guild_id = ?)
+            ORDER BY RANDOM()
+            LIMIT 1
             """,
-            (user_id, waifu_id),
+            (bool(is_nsfw), f'%"{tag}"%', guild_id),
         )
-        self.connection.commit()
+        return self.cursor.fetchone()
+
+    @timed(DB_LATENCY)
+    def add_claim(self, guild_id, user_id, waifu_id, rarity=0):
+        self.cursor.execute(
+            """
+            INSERT INTO claims (guild_id, user_id, waifu_id, rarity)
+            VALUES (?, ?, ?, ?)
+            """,
+            (guild_id, user_id, waifu_id, rarity),
+        )
+        self._commit()
+        return self.cursor.lastrowid
 
+    @timed(DB_LATENCY)
+    def claim_waifu(self, guild_id, discord_id, user_name, waifu_id, rarity=0):
+        # Whole Claim As One Write Op - Returns The New Count, None If Already Taken
+        if self.is_waifu_claimed(guild_id, waifu_id):
+            return None
+
+        self.add_user(guild_id, discord_id, user_name)
+        user_row = self.get_user(guild_id, discord_id)
+
+        # Raises IntegrityError On idx_claims_guild_waifu; trg_claims_insert Bumps The Count
+        self.add_claim(guild_id, user_row[0], waifu_id, rarity)
+        self.update_last_claim(guild_id, discord_id)
+        return (user_row[3] or 0) + 1
+
+    @timed(DB_LATENCY)
+    def reconcile_waifu_counts(self):
+        # Repairs Any Drift Left From Before The Triggers Existed
+        self.cursor.execute(
+            """
+            UPDATE users
+            SET waifu_count = (
+                    SELECT COUNT(*) FROM claims c WHERE c.user_id = users.id
+                ),
+                rarity_score = (
+                    SELECT COALESCE(SUM(t.points), 0)
+                    FROM claims c
+                    JOIN rarity_tiers t ON t.tier = c.rarity
+                    WHERE c.user_id = users.id
+                )
+            WHERE waifu_count IS NOT (
+                    SELECT COUNT(*) FROM claims c WHERE c.user_id = users.id
+                )
+               OR rarity_score IS NOT (
+                    SELECT COALESCE(SUM(t.points), 0)
+                    FROM claims c
+                    JOIN rarity_tiers t ON t.tier = c.rarity
+                    WHERE c.user_id = users.id
+                )
+            """
+        )
+        repaired = self.cursor.rowcount
+        self._commit()
+        return repaired
+
+    @timed(DB_LATENCY)
     def get_claims_by_user(self, user_id):
         self.cursor.execute(
             """
@@ -139,68 +692,268 @@ class database:
         )
         return self.cursor.fetchall()
 
+    @timed(DB_LATENCY)
     def get_user_collection(self, user_id):
         self.cursor.execute(
-            """
-            SELECT w.*
+            f"""
+            SELECT {WAIFU_CLAIM_COLUMNS}
             FROM waifus w
             JOIN claims c ON w.id = c.waifu_id
             WHERE c.user_id = ?
+            ORDER BY c.rarity DESC, c.id
             """,
             (user_id,),
         )
         return self.cursor.fetchall()
 
-    def is_waifu_claimed(self, waifu_id):
+    @timed(DB_LATENCY)
+    def search_waifus(
+        self, query, guild_id=0, user_id=None, include_nsfw=False, limit=10
+    ):
+        # Every Word Must Match The Start Of A Token In artist / source / tags,
+        # Best bm25 First. user_id Limits It To That User's Collection
+        words = re.findall(r"\w+", query or "")
+        if not words:
+            return []
+
+        match = " ".join(f'"{w}"*' for w in words)
+        owned = "AND c.user_id = ?" if user_id else ""
+        weights = ", ".join(map(str, FTS_WEIGHTS))
+
+        self.cursor.execute(
+            f"""
+            SELECT {WAIFU_CLAIM_COLUMNS}
+            FROM waifus_fts
+            JOIN waifus w ON w.id = waifus_fts.rowid
+            LEFT JOIN claims c ON c.waifu_id = w.id AND c.guild_id = ?
+            WHERE waifus_fts MATCH ?
+              AND (? OR NOT w.is_nsfw)
+              {owned}
+            ORDER BY bm25(waifus_fts, {weights})
+            LIMIT ?
+            """,
+            (
+                guild_id,
+                match,
+                bool(include_nsfw),
+                *((user_id,) if user_id else ()),
+                limit,
+            ),
+        )
+        return self.cursor.fetchall()
+
+    @timed(DB_LATENCY)
+    def get_claimed_api_ids(self):
+        # (guild_id, waifu_api_id) For Every Claim - Seeds The Spawn Dedupe Filter
+        self.cursor.execute(
+            """
+            SELECT c.guild_id, w.waifu_api_id
+            FROM claims c
+            JOIN waifus w ON w.id = c.waifu_id
+            """
+        )
+        return self.cursor.fetchall()
+
+    @timed(DB_LATENCY)
+    def get_collection_tags(self):
+        # (guild_id, discord_id, user_id, tags) For Every Claim - Seeds Tag Autocomplete
         self.cursor.execute(
             """
-            SELECT 1 FROM claims WHERE waifu_id = ? LIMIT 1
+            SELECT u.guild_id, u.discord_id, c.user_id, w.tags
+            FROM claims c
+            JOIN users u ON u.id = c.user_id
+            JOIN waifus w ON w.id = c.waifu_id
+            """
+        )
+        return self.cursor.fetchall()
+
+    @timed(DB_LATENCY)
+    def get_waifu_tags(self, waifu_id):
+        self.cursor.execute(
+            """
+            SELECT tags FROM waifus WHERE id = ?
             """,
             (waifu_id,),
         )
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    @timed(DB_LATENCY)
+    def is_waifu_claimed(self, guild_id, waifu_id):
+        self.cursor.execute(
+            """
+            SELECT 1 FROM claims WHERE guild_id = ? AND waifu_id = ? LIMIT 1
+            """,
+            (guild_id, waifu_id),
+        )
         return self.cursor.fetchone() is not None
 
-    def get_waifu_owner(self, waifu_id):
+    @timed(DB_LATENCY)
+    def get_waifu_owner(self, guild_id, waifu_id):
         self.cursor.execute(
             """
             SELECT u.*
             FROM users u
             JOIN claims c ON u.id = c.user_id
-            WHERE c.waifu_id = ?
+            WHERE c.guild_id = ? AND c.waifu_id = ?
             """,
-            (waifu_id,),
+            (guild_id, waifu_id),
+        )
+        return self.cursor.fetchone()
+
+    @timed(DB_LATENCY)
+    def get_claim(self, guild_id, waifu_id):
+        # (claim_id, user_id, version, owner discord_id) Or None
+        self.cursor.execute(
+            """
+            SELECT c.id, c.user_id, c.version, u.discord_id
+            FROM claims c
+            JOIN users u ON u.id = c.user_id
+            WHERE c.guild_id = ? AND c.waifu_id = ?
+            """,
+            (guild_id, waifu_id),
         )
         return self.cursor.fetchone()
 
-    def get_leaderboard(self, limit=10):
+    def _move_claim(self, guild_id, waifu_id, from_user_id, to_user_id, version):
         self.cursor.execute(
             """
-            SELECT user_name, waifu_count
+            UPDATE claims
+            SET user_id = ?, version = version + 1, claimed_at = CURRENT_TIMESTAMP
+            WHERE guild_id = ? AND waifu_id = ? AND user_id = ? AND version = ?
+            """,
+            (to_user_id, guild_id, waifu_id, from_user_id, version),
+        )
+        if self.cursor.rowcount != 1:
+            raise StaleClaimError(f"Claim On Waifu {waifu_id} Changed")
+
+    @timed(DB_LATENCY)
+    def transfer_waifu(
+        self, guild_id, waifu_id, from_user_id, version, to_discord_id, to_name
+    ):
+        # Optimistic : Only Moves The Claim If Owner And Version Are Unchanged
+        self.add_user(guild_id, to_discord_id, to_name)
+        to_user_id = self.get_user(guild_id, to_discord_id)[0]
+
+        self._move_claim(guild_id, waifu_id, from_user_id, to_user_id, version)
+        self._commit()
+        return to_user_id
+
+    @timed(DB_LATENCY)
+    def trade_waifus(self, guild_id, offer, request):
+        # offer / request : (waifu_id, owner_user_id, version) - Swapped Atomically
+        offer_waifu, offer_user, offer_version = offer
+        request_waifu, request_user, request_version = request
+
+        self._move_claim(guild_id, offer_waifu, offer_user, request_user, offer_version)
+        self._move_claim(
+            guild_id, request_waifu, request_user, offer_user, request_version
+        )
+        self._commit()
+
+    @timed(DB_LATENCY)
+    def release_waifu(self, guild_id, waifu_id, user_id, version):
+        self.cursor.execute(
+            """
+            DELETE FROM claims
+            WHERE guild_id = ? AND waifu_id = ? AND user_id = ? AND version = ?
+            """,
+            (guild_id, waifu_id, user_id, version),
+        )
+        if self.cursor.rowcount != 1:
+            raise StaleClaimError(f"Claim On Waifu {waifu_id} Changed")
+
+        self._commit()
+
+    @timed(DB_LATENCY)
+    def get_leaderboard(self, guild_id, limit=10, by_rarity=False):
+        # Both Orders Are Served Straight From Their (guild_id, ... DESC) Index
+        order = "rarity_score" if by_rarity else "waifu_count"
+        self.cursor.execute(
+            f"""
+            SELECT user_name, waifu_count, rarity_score
             FROM users
-            ORDER BY waifu_count DESC
+            WHERE guild_id = ?
+            ORDER BY {order} DESC
             LIMIT ?
             """,
-            (limit,),
+            (guild_id, limit),
         )
         return self.cursor.fetchall()
 
-    def update_last_claim(self, discord_id):
+    @timed(DB_LATENCY)
+    def update_last_claim(self, guild_id, discord_id):
         self.cursor.execute(
             """
-            UPDATE users SET last_claimed_at = CURRENT_TIMESTAMP WHERE discord_id = ?
+            UPDATE users SET last_claimed_at = CURRENT_TIMESTAMP
+            WHERE guild_id = ? AND discord_id = ?
             """,
-            (discord_id,),
+            (guild_id, discord_id),
         )
-        self.connection.commit()
+        self._commit()
 
-    def get_last_claim_time(self, discord_id):
+    @timed(DB_LATENCY)
+    def get_last_claim_time(self, guild_id, discord_id):
         self.cursor.execute(
             """
-            SELECT last_claimed_at FROM users WHERE discord_id = ?
+            SELECT last_claimed_at FROM users WHERE guild_id = ? AND discord_id = ?
             """,
-            (discord_id,),
+            (guild_id, discord_id),
         )
         return self.cursor.fetchone()
 
+    @timed(DB_LATENCY)
+    def get_spawn_config(self, guild_id):
+        self.cursor.execute(
+            """
+            SELECT spawn FROM guild_config WHERE guild_id = ?
+            """,
+            (guild_id,),
+        )
+        row = self.cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    @timed(DB_LATENCY)
+    def get_spawn_configs(self):
+        self.cursor.execute(
+            """
+            SELECT guild_id, spawn FROM guild_config
+            """
+        )
+        return {guild_id: json.loads(spawn) for guild_id, spawn in self.cursor.fetchall()}
+
+    @timed(DB_LATENCY)
+    def set_spawn_config(self, guild_id, cfg):
+        self.cursor.execute(
+            """
+            INSERT INTO guild_config (guild_id, spawn) VALUES (?, ?)
+            ON CONFLICT (guild_id) DO UPDATE SET spawn = excluded.spawn
+            """,
+            (guild_id, json.dumps(cfg)),
+        )
+        self._commit()
+
+    @timed(DB_LATENCY)
+    def get_ratelimit_configs(self):
+        self.cursor.execute(
+            """
+            SELECT guild_id, ratelimit FROM guild_config WHERE ratelimit IS NOT NULL
+            """
+        )
+        return {guild_id: json.loads(cfg) for guild_id, cfg in self.cursor.fetchall()}
+
+    @timed(DB_LATENCY)
+    def set_ratelimit_config(self, guild_id, cfg):
+        # None Clears The Guild's Overrides - An Empty spawn Keeps The Defaults
+        self.cursor.execute(
+            """
+            INSERT INTO guild_config (guild_id, spawn, ratelimit) VALUES (?, '{}', ?)
+            ON CONFLICT (guild_id) DO UPDATE SET ratelimit = excluded.ratelimit
+            """,
+            (guild_id, json.dumps(cfg) if cfg else None),
+        )
+        self._commit()
+
+    @timed(DB_LATENCY)
     def close(self):
         self.connection.close()
@@ -0,0 +1,159 @@
+import time
+import sqlite3
+from extensions.logger import setup_logger
+from extensions.metrics import DB_LATENCY, counter, timed
+
+logger = setup_logger(__name__)
+
+FEEDS_DB_PATH = "astrumotaku.db"
+
+# One Entry Of scheduleConfig.json's "rss_feeds"
+DEFAULT_FEED = {
+    "name": "animeschedule",
+    "url": "https://animeschedule.net/subrss.xml",
+    "label": "SUB",
+    "enabled": True,
+    "interval_minutes": 5,
+    # Empty Falls Back To The Schedule's channel_id
+    "channel_id": [],
+    # Case-Insensitive Title Keywords - Any include, No exclude
+    "include": [],
+    "exclude": [],
+    # Feeds Sharing A Namespace Never Post The Same Item Twice
+    "namespace": None,
+    "post_limit": 5,
+}
+
+# A Feed With Nothing New Is Polled Up To This Many Times Less Often
+MAX_BACKOFF = 8
+
+# Seen GUIDs Kept Per Namespace
+SEEN_KEEP = 2000
+
+FEED_POLLS = counter("rss_polls_total", "RSS polls by feed and result")
+
+
+def feed_config(raw: dict) -> dict:
+    feed = {**DEFAULT_FEED, **(raw or {})}
+    feed["namespace"] = feed.get("namespace") or feed["name"]
+    return feed
+
+
+def entry_guid(entry: dict) -> str:
+    return (
+        entry.get("guid")
+        or entry.get("id")
+        or f"{entry.get('link', '')}|{entry.get('title', '')}"
+    )
+
+
+def matches(feed: dict, entry: dict) -> bool:
+    title = str(entry.get("title") or "").casefold()
+
+    include = [str(k).casefold() for k in feed.get("include") or []]
+    if include and not any(k in title for k in include):
+        return False
+
+    exclude = [str(k).casefold() for k in feed.get("exclude") or []]
+    return not any(k in title for k in exclude)
+
+
+class FeedState:
+    # In-Memory Poll State - Losing It On Restart Costs One Extra Poll Per Feed
+
+    def __init__(self):
+        self.next_poll = 0.0
+        self.idle = 0
+        self.etag = None
+        self.modified = None
+
+    def interval(self, feed: dict) -> float:
+        base = max(1.0, float(feed.get("interval_minutes") or 5)) * 60
+        return base * min(2**self.idle, MAX_BACKOFF)
+
+    def due(self, now: float = None) -> bool:
+        return (time.monotonic() if now is None else now) >= self.next_poll
+
+    def polled(self, feed: dict, changed: bool):
+        # Each Quiet Poll Doubles The Wait, Any New Item Resets It
+        self.idle = 0 if changed else self.idle + 1
+        self.next_poll = time.monotonic() + self.interval(feed)
+
+
+class SeenStore:
+    # Posted GUIDs Per Dedupe Namespace
+
+    def __init__(self, db_path: str = FEEDS_DB_PATH):
+        self.connection = sqlite3.connect(db_path)
+        self.cursor = self.connection.cursor()
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rss_seen (
+                namespace TEXT NOT NULL,
+                guid TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (namespace, guid)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def unseen(self, namespace: str, guids: list) -> set:
+        if not guids:
+            return set()
+
+        seen = set()
+        for i in range(0, len(guids), 500):
+            chunk = guids[i : i + 500]
+            self.cursor.execute(
+                f"""
+                SELECT guid FROM rss_seen
+                WHERE namespace = ? AND guid IN ({", ".join("?" * len(chunk))})
+                """,
+                (namespace, *chunk),
+            )
+            seen.update(row[0] for row in self.cursor.fetchall())
+
+        return set(guids) - seen
+
+    @timed(DB_LATENCY)
+    def add(self, namespace: str, guids: list):
+        now = time.time()
+        self.cursor.executemany(
+            """
+            INSERT OR IGNORE INTO rss_seen (namespace, guid, seen_at) VALUES (?, ?, ?)
+            """,
+            [(namespace, guid, now) for guid in guids],
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def count(self, namespace: str) -> int:
+        self.cursor.execute(
+            """
+            SELECT COUNT(*) FROM rss_seen WHERE namespace = ?
+            """,
+            (namespace,),
+        )
+        return self.cursor.fetchone()[0]
+
+    @timed(DB_LATENCY)
+    def prune(self, namespace: str, keep: int = SEEN_KEEP):
+        self.cursor.execute(
+            """
+            DELETE FROM rss_seen
+            WHERE namespace = ? AND guid NOT IN (
+                SELECT guid FROM rss_seen
+                WHERE namespace = ?
+                ORDER BY seen_at DESC
+                LIMIT ?
+            )
+            """,
+            (namespace, namespace, keep),
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,131 @@
+import os
+import asyncio
+import functools
+import contextvars
+import discord
+from extensions.logger import setup_logger
+from extensions.metrics import counter
+
+logger = setup_logger(__name__)
+
+# Seconds A Handler Gets Before It's Deferred For It - Discord Gives Up At 3
+ACK_BUDGET = float(os.getenv("ACK_BUDGET_SECONDS") or 2.0)
+
+INTERACTION_ACKS = counter(
+    "interaction_acks_total",
+    "Interaction acks by command and whether the handler or the budget made them",
+)
+
+_guard: contextvars.ContextVar = contextvars.ContextVar("ack_guard", default=None)
+
+
+class AckGuard:
+    # Defers An Interaction Once Its Budget Runs Out Unless A Reply Has Started.
+    # Replies Made Through respond() / edit_message() Wait For An In-Flight Defer
+    # So The Two Never Race For The Single Initial Response.
+
+    def __init__(self, interaction, command: str, ephemeral: bool, budget: float):
+        self.interaction = interaction
+        self.command = command
+        self.ephemeral = ephemeral
+        self.budget = budget
+        self.deferred = False
+        self.replying = False
+        self._timer = None
+        self._defer_task = None
+
+    def start(self):
+        self._timer = asyncio.get_running_loop().call_later(self.budget, self._expire)
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+
+        if self._defer_task is None:
+            INTERACTION_ACKS.inc(command=self.command, by="handler")
+
+    def _expire(self):
+        if self.replying or self.interaction.response.is_done():
+            return
+
+        self._defer_task = asyncio.create_task(self._defer())
+
+    async def _defer(self):
+        try:
+            await self.interaction.response.defer(ephemeral=self.ephemeral)
+            self.deferred = True
+            INTERACTION_ACKS.inc(command=self.command, by="budget")
+        except (discord.InteractionResponded, discord.HTTPException):
+            pass
+        except Exception:
+            logger.exception(f"Failed Auto-Deferring {self.command}")
+
+    async def settle(self):
+        self.replying = True
+        if self._defer_task is not None:
+            await asyncio.shield(self._defer_task)
+
+
+def _find_interaction(args):
+    # Slash Commands Pass An ApplicationContext, Components An Interaction
+    for arg in args:
+        if hasattr(arg, "response") and hasattr(arg, "followup"):
+            return getattr(arg, "interaction", None) or arg
+
+    return None
+
+
+def ack_budget(command: str, ephemeral: bool = False, budget: float = None):
+    # Wraps A Slash Command Or Component Callback In An AckGuard.
+    # Buttons Should Pass ephemeral=True So A Late Defer Stays Out Of The Channel.
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            interaction = _find_interaction(args)
+            if interaction is None:
+                return await fn(*args, **kwargs)
+
+            guard = AckGuard(
+                interaction,
+                command,
+                ephemeral,
+                ACK_BUDGET if budget is None else budget,
+            )
+            token = _guard.set(guard)
+            guard.start()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                guard.stop()
+                _guard.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+async def _settle(interaction):
+    guard = _guard.get()
+    if guard is not None and guard.interaction is interaction:
+        await guard.settle()
+
+
+async def respond(target, *args, **kwargs):
+    # Initial Response If Nothing Has Acked Yet, Otherwise A Followup
+    interaction = getattr(target, "interaction", None) or target
+    await _settle(interaction)
+
+    if interaction.response.is_done():
+        return await interaction.followup.send(*args, **kwargs)
+
+    return await interaction.response.send_message(*args, **kwargs)
+
+
+async def edit_message(interaction, **kwargs):
+    # Edits The Component's Message, Through The Webhook Once Deferred
+    await _settle(interaction)
+
+    if interaction.response.is_done():
+        return await interaction.edit_original_response(**kwargs)
+
+    return await interaction.response.edit_message(**kwargs)
@@ -0,0 +1,158 @@
+import time
+import sqlite3
+from extensions.logger import setup_logger
+from extensions.metrics import DB_LATENCY, counter, timed
+
+logger = setup_logger(__name__)
+
+JOBS_DB_PATH = "astrumotaku.db"
+
+# What A Job Does About Slots Missed While The Bot Was Down. Under run-all Each
+# Run Stands For One Missed Slot, So A Job Must Post That Slot's Own Content -
+# The Daily Schedule Posts One Message Per Missed Weekday - Rather Than Repeat
+# Today's; A Job With Nothing Slot-Specific To Post Should Use run-once
+SKIP = "skip"
+RUN_ONCE = "run-once"
+RUN_ALL = "run-all"
+CATCH_UP_POLICIES = (SKIP, RUN_ONCE, RUN_ALL)
+
+# A Slot Less Late Than This Is On Time, Not Missed - Covers Loop Tick Jitter
+CATCH_UP_GRACE = 300.0
+
+# Upper Bound On Back-To-Back Runs Under run-all
+MAX_CATCH_UP = 10
+
+JOB_SLOTS = counter(
+    "scheduled_job_slots_total", "Scheduled job slots by job and what became of them"
+)
+
+
+class JobStore:
+    # Persisted last_run / next_due Per (job, channel) So Restarts Neither
+    # Re-Run Nor Reset Anything. Times Are Unix Seconds.
+
+    def __init__(self, db_path: str = JOBS_DB_PATH):
+        self.connection = sqlite3.connect(db_path)
+        self.cursor = self.connection.cursor()
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job TEXT NOT NULL,
+                channel_id INTEGER NOT NULL,
+                last_run REAL,
+                next_due REAL NOT NULL,
+                PRIMARY KEY (job, channel_id)
+            )
+            """
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def get(self, job: str, channel_id: int):
+        # (last_run, next_due) Or None
+        self.cursor.execute(
+            """
+            SELECT last_run, next_due FROM jobs WHERE job = ? AND channel_id = ?
+            """,
+            (job, channel_id),
+        )
+        return self.cursor.fetchone()
+
+    @timed(DB_LATENCY)
+    def set(self, job: str, channel_id: int, last_run, next_due: float):
+        self.cursor.execute(
+            """
+            INSERT INTO jobs (job, channel_id, last_run, next_due) VALUES (?, ?, ?, ?)
+            ON CONFLICT (job, channel_id) DO UPDATE SET
+                last_run = excluded.last_run,
+                next_due = excluded.next_due
+            """,
+            (job, channel_id, last_run, next_due),
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def reset(self, job: str, channel_id: int = None):
+        # Forget A Job's Timing - It's Due Again From Its First Slot
+        if channel_id is None:
+            self.cursor.execute("DELETE FROM jobs WHERE job = ?", (job,))
+        else:
+            self.cursor.execute(
+                "DELETE FROM jobs WHERE job = ? AND channel_id = ?", (job, channel_id)
+            )
+        self.connection.commit()
+
+    def reschedule(self, job: str, channel_id: int, next_due: float):
+        # Moves The Next Slot, Keeping last_run
+        row = self.get(job, channel_id)
+        self.set(job, channel_id, row[0] if row else None, next_due)
+
+    def take(
+        self,
+        job: str,
+        channel_id: int,
+        interval: float,
+        policy: str = RUN_ONCE,
+        first_due: float = None,
+        anchor: float = None,
+        now: float = None,
+    ) -> int:
+        # How Many Times To Run Now. next_due Is Advanced Past now Before The
+        # Caller Runs Anything, So A Crash Mid-Post Can't Lead To A Double Post.
+        # first_due : Slot Used When The Job Has No Row Yet (Default now)
+        # anchor    : Any Slot Time - A Stored next_due Off This Grid Is Realigned
+        now = time.time() if now is None else now
+        interval = max(1.0, float(interval))
+
+        row = self.get(job, channel_id)
+        last_run, next_due = (
+            row if row else (None, now if first_due is None else first_due)
+        )
+
+        if anchor is not None and (next_due - anchor) % interval:
+            # The Grid Moved (e.g. A New post_time) - Nothing Counts As Missed
+            next_due = (
+                anchor + ((now - CATCH_UP_GRACE - anchor) // interval + 1) * interval
+            )
+
+        if now < next_due:
+            if row is None or row[1] != next_due:
+                self.set(job, channel_id, last_run, next_due)
+            return 0
+
+        missed = int((now - next_due) // interval) + 1
+        late = now - next_due
+
+        if late <= CATCH_UP_GRACE:
+            runs = 1
+            kind = "on_time"
+        elif policy == SKIP:
+            runs = 0
+            kind = "skipped"
+        elif policy == RUN_ALL:
+            runs = min(missed, MAX_CATCH_UP)
+            kind = "catch_up"
+        else:
+            runs = 1
+            kind = "catch_up"
+
+        if kind != "on_time":
+            logger.info(f"Job {job}/{channel_id} Missed {missed} Slot(s) - {policy}")
+
+        self.set(
+            job, channel_id, now if runs else last_run, next_due + missed * interval
+        )
+        JOB_SLOTS.inc(runs or missed, job=job, kind=kind)
+        return runs
+
+    @timed(DB_LATENCY)
+    def close(self):
+        self.connection.close()
+
+
+def get_job_store(bot) -> JobStore:
+    store = getattr(bot, "job_store", None)
+    if store is None:
+        store = bot.job_store = JobStore()
+
+    return store
@@ -0,0 +1,306 @@
+import os
+import math
+import time
+import functools
+from bisect import bisect_left
+from contextlib import contextmanager
+from extensions.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+
+    body = ",".join(
+        '{}="{}"'.format(
+            k, v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        for k, v in key
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def samples(self):
+        for key, value in self.values.items():
+            yield self.name, key, value
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.values: dict[tuple, float] = {}
+        self._function = None
+
+    def set(self, value: float, **labels):
+        self.values[_label_key(labels)] = value
+
+    def set_function(self, fn):
+        # fn() -> float, Or {label_dict_tuple: float} For Labelled Gauges
+        self._function = fn
+
+    def samples(self):
+        if self._function is not None:
+            try:
+                result = self._function()
+            except Exception:
+                logger.exception(f"Failed Collecting Gauge {self.name}")
+                result = None
+
+            if isinstance(result, dict):
+                for labels, value in result.items():
+                    yield self.name, _label_key(dict(labels)), value
+            elif result is not None:
+                yield self.name, (), result
+
+        for key, value in self.values.items():
+            yield self.name, key, value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        series = self.values.get(key)
+        if series is None:
+            # [bucket counts..., +Inf count, sum]
+            series = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        for key, series in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield f"{self.name}_bucket", key + (("le", repr(bound)),), cumulative
+
+            cumulative += series[len(self.buckets)]
+            yield f"{self.name}_bucket", key + (("le", "+Inf"),), cumulative
+            yield f"{self.name}_count", key, cumulative
+            yield f"{self.name}_sum", key, series[-1]
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: dict[str, Counter | Gauge | Histogram] = {}
+
+    def _get(self, cls, name, help_text, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, help_text, **kwargs)
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} Already Registered As {metric.kind}")
+
+        return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name: str, help_text: str, buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+
+            for name, key, value in metric.samples():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+COMMAND_LATENCY = histogram(
+    "command_latency_seconds", "Slash command handling time by command and outcome"
+)
+COMPONENT_LATENCY = histogram(
+    "component_latency_seconds", "Button / component callback handling time"
+)
+UPSTREAM_LATENCY = histogram(
+    "upstream_request_seconds", "Upstream API request time by service and outcome"
+)
+UPSTREAM_REQUESTS = counter(
+    "upstream_requests_total", "Upstream API requests by service and outcome"
+)
+DB_LATENCY = histogram("db_query_seconds", "SQLite call time by database method")
+CACHE_REQUESTS = counter("cache_requests_total", "Cache lookups by cache and result")
+LOOP_LAG = histogram("event_loop_lag_seconds", "Event loop scheduling lag")
+QUEUE_DEPTH = gauge("queue_depth", "Pending items per internal queue")
+GATEWAY_LATENCY = gauge("gateway_latency_seconds", "Discord gateway heartbeat latency")
+
+
+def timed(hist: Histogram, **labels):
+    def decorator(fn):
+        label_set = labels or {"method": fn.__name__}
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - start, **label_set)
+
+        return wrapper
+
+    return decorator
+
+
+def _command_name(ctx) -> str:
+    command = getattr(ctx, "command", None)
+    return getattr(command, "qualified_name", None) or "unknown"
+
+
+def install(bot):
+    from extensions.sendqueue import get_send_queue
+
+    async def on_application_command(ctx):
+        ctx.metrics_started = time.perf_counter()
+
+    async def _finish(ctx, outcome):
+        started = getattr(ctx, "metrics_started", None)
+        if started is not None:
+            COMMAND_LATENCY.observe(
+                time.perf_counter() - started,
+                command=_command_name(ctx),
+                outcome=outcome,
+            )
+
+    async def on_application_command_completion(ctx):
+        await _finish(ctx, "ok")
+
+    async def on_application_command_error(ctx, error):
+        await _finish(ctx, "error")
+
+    bot.add_listener(on_application_command, "on_application_command")
+    bot.add_listener(
+        on_application_command_completion, "on_application_command_completion"
+    )
+    bot.add_listener(on_application_command_error, "on_application_command_error")
+
+    def _queue_depths():
+        depths = {(("queue", "send"),): get_send_queue(bot).depth}
+
+        # Claim Writes Waiting For The Next Group Commit
+        db = getattr(bot.get_cog("Waifu"), "db", None)
+        if db is not None:
+            depths[(("queue", "group_commit"),)] = db.writer.depth
+
+        return depths
+
+    GATEWAY_LATENCY.set_function(lambda: bot.latency)
+    QUEUE_DEPTH.set_function(_queue_depths)
+
+
+async def start(bot, host: str = None, port: int = None):
+    port = port or int(os.getenv("METRICS_PORT") or 0)
+    if not port:
+        return None
+
+    from aiohttp import web
+    from extensions import runtime
+    from extensions.watchdog import WATCHDOG
+
+    host = host or os.getenv("METRICS_HOST") or "127.0.0.1"
+
+    async def handle_metrics(request):
+        return web.Response(
+            text=REGISTRY.render(), content_type="text/plain", charset="utf-8"
+        )
+
+    async def handle_stalls(request):
+        return web.Response(
+            text=WATCHDOG.format_report(), content_type="text/plain", charset="utf-8"
+        )
+
+    async def handle_caches(request):
+        return web.Response(
+            text=runtime.format_report(bot), content_type="text/plain", charset="utf-8"
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_get("/stalls", handle_stalls)
+    app.router.add_get("/caches", handle_caches)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+
+    logger.info(f"Metrics Exporter Listening On http://{host}:{port}/metrics")
+    return runner
@@ -0,0 +1,179 @@
+import json
+from collections import Counter
+
+# Discord Shows At Most 25 Autocomplete Choices
+MAX_CHOICES = 25
+
+# Tag Names Are Few - Keep Them All At Every Node So Per-User Filtering Sees Each
+TAG_KEEP = 256
+
+# Deeper Prefixes Share The Node At This Depth And Are Filtered There
+MAX_DEPTH = 6
+
+# A Word Starts After Any Of These - "kita" Finds "marin-kitagawa"
+SEPARATORS = " -_"
+
+
+def normalize(text) -> str:
+    return " ".join(str(text or "").casefold().split())
+
+
+def word_starts(norm: str) -> list[str]:
+    # "itachi uchiha" -> ["itachi uchiha", "uchiha"]
+    return [
+        norm[i:]
+        for i, ch in enumerate(norm)
+        if ch not in SEPARATORS and (i == 0 or norm[i - 1] in SEPARATORS)
+    ]
+
+
+def parse_tags(value) -> list[str]:
+    # waifus.tags Holds A JSON List Of Names
+    try:
+        tags = json.loads(value) if value else []
+    except (TypeError, ValueError):
+        return []
+
+    return [str(t) for t in tags if t] if isinstance(tags, list) else []
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.top: list[str] = []
+
+
+class PrefixTrie:
+    # Word-Start Completion : "uch" Finds "Itachi Uchiha". Every Node Keeps Its
+    # First MAX_CHOICES Names, So A Lookup Is One Walk Down - Never A Subtree Scan
+
+    def __init__(self, keep: int = MAX_CHOICES):
+        self.keep = keep
+        self.root = _Node()
+        self.nodes = 1
+        self._names: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name) -> bool:
+        return normalize(name) in self._names
+
+    def add(self, name) -> bool:
+        norm = normalize(name)
+        if not norm or norm in self._names:
+            return False
+
+        self._names.add(norm)
+        display = str(name).strip()
+
+        for key in word_starts(norm):
+            self._insert(key, display)
+
+        return True
+
+    def _insert(self, key: str, display: str):
+        node = self.root
+        self._keep(node, display)
+
+        for depth, ch in enumerate(key[:MAX_DEPTH], start=1):
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _Node()
+                self.nodes += 1
+
+            node = child
+            if depth < MAX_DEPTH:
+                self._keep(node, display)
+            else:
+                # Deepest Node Keeps Every Name, So Longer Prefixes Filter A Full List
+                node.top.append(display)
+
+    def _keep(self, node: _Node, display: str):
+        if len(node.top) < self.keep and display not in node.top:
+            node.top.append(display)
+
+    def complete(self, prefix, limit: int = MAX_CHOICES) -> list[str]:
+        prefix = normalize(prefix)
+        node = self.root
+
+        for ch in prefix[:MAX_DEPTH]:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+
+        if len(prefix) < MAX_DEPTH:
+            return node.top[:limit]
+
+        # At Or Past The Indexed Depth : Re-Check Against Each Word Start. A Name
+        # Reaching This Node Through Two Word Starts Is Listed Once
+        matches: dict[str, None] = {}
+        for display in node.top:
+            if any(k.startswith(prefix) for k in word_starts(normalize(display))):
+                matches[display] = None
+                if len(matches) >= limit:
+                    break
+
+        return list(matches)
+
+    def sizes(self) -> tuple[int, int]:
+        # (names, approx bytes) - Each Node Is A Slotted Object, A Dict And A List
+        return len(self._names), self.nodes * 300
+
+
+class CollectionTags:
+    # Tag Counts Per Collection (users.id) Over Its Claimed Waifus, Plus One Trie
+    # Of Every Tag Seen. Kept In Step By The Claim Paths So Lookups Never Hit SQLite
+
+    def __init__(self):
+        self.tags = PrefixTrie(keep=TAG_KEEP)
+        self.counts: dict[int, Counter] = {}
+        self.owners: dict[tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def load(self, rows):
+        # rows : (guild_id, discord_id, user_id, tags JSON)
+        for guild_id, discord_id, user_id, tags in rows:
+            self.link(guild_id, discord_id, user_id)
+            self.add(user_id, parse_tags(tags))
+
+    def link(self, guild_id: int, discord_id: int, user_id: int):
+        self.owners[(guild_id, discord_id)] = user_id
+
+    def add(self, user_id: int, tags):
+        counts = self.counts.setdefault(user_id, Counter())
+        for tag in tags:
+            self.tags.add(tag)
+            counts[tag] += 1
+
+    def remove(self, user_id: int, tags):
+        counts = self.counts.get(user_id)
+        if counts is None:
+            return
+
+        counts.subtract(tags)
+        for tag in [t for t, n in counts.items() if n <= 0]:
+            del counts[tag]
+
+        if not counts:
+            del self.counts[user_id]
+
+    def complete(self, guild_id: int, discord_id: int, prefix) -> list[str]:
+        # That Member's Own Tags, Most-Collected First
+        counts = self.counts.get(self.owners.get((guild_id, discord_id)))
+        if not counts:
+            return []
+
+        names = self.tags.complete(prefix, limit=TAG_KEEP)
+        owned = [n for n in names if counts.get(n)]
+        owned.sort(key=lambda n: -counts[n])
+        return owned[:MAX_CHOICES]
+
+    def sizes(self) -> tuple[int, int]:
+        entries = sum(len(c) for c in self.counts.values())
+        _, trie_bytes = self.tags.sizes()
+        return entries, trie_bytes + entries * 120 + len(self.owners) * 150
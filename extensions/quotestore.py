@@ -0,0 +1,186 @@
+import os
+import json
+import random
+import difflib
+from extensions.logger import setup_logger
+from extensions.prefixindex import PrefixTrie
+
+logger = setup_logger(__name__)
+
+FUZZY_CUTOFF = 0.75
+FUZZY_LIMIT = 5
+
+
+def normalize(text) -> str:
+    return " ".join(str(text or "").casefold().split())
+
+
+def split_filters(value) -> list[str]:
+    # "Naruto, one piece" -> ["naruto", "one piece"]
+    if not value:
+        return []
+
+    terms = [normalize(part) for part in str(value).split(",")]
+    return [t for t in terms if t]
+
+
+class QuoteStore:
+    def __init__(self, path: str, seed=None):
+        self.path = path
+        self.quotes: list[tuple[str, str, str]] = []
+        self.by_character: dict[str, list[int]] = {}
+        self.by_show: dict[str, list[int]] = {}
+        self.synced = False
+
+        # Autocomplete For /quote - Filled As Index Keys Appear, Read Without I/O
+        self.characters = PrefixTrie()
+        self.shows = PrefixTrie()
+
+        self._seen: set[tuple[str, str]] = set()
+        self._resolved: dict[tuple[str, str, bool], tuple[str, ...]] = {}
+
+        for quote, character, show in seed or []:
+            self.add(quote, character, show)
+
+        self.load()
+
+    def __len__(self):
+        return len(self.quotes)
+
+    def add(self, quote, character, show) -> bool:
+        if not quote:
+            return False
+
+        key = (normalize(quote), normalize(character))
+        if key in self._seen:
+            return False
+
+        idx = len(self.quotes)
+        self.quotes.append((str(quote), str(character or "Unknown"), str(show or "")))
+        self._seen.add(key)
+
+        for index, trie, value in (
+            (self.by_character, self.characters, character),
+            (self.by_show, self.shows, show),
+        ):
+            norm = normalize(value)
+            if not norm:
+                continue
+
+            if norm not in index:
+                # New Index Key - Cached Resolutions May Now Be Incomplete
+                index[norm] = []
+                self._resolved.clear()
+                trie.add(value)
+
+            index[norm].append(idx)
+
+        return True
+
+    def merge(self, items) -> int:
+        added = 0
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+
+            if self.add(item.get("quote"), item.get("character"), item.get("show")):
+                added += 1
+
+        return added
+
+    def _resolve(self, field: str, term: str, fuzzy: bool) -> tuple[str, ...]:
+        cache_key = (field, term, fuzzy)
+        cached = self._resolved.get(cache_key)
+        if cached is not None:
+            return cached
+
+        index = self.by_character if field == "character" else self.by_show
+
+        if term in index:
+            keys = (term,)
+        else:
+            # "itachi" -> "itachi uchiha"
+            keys = tuple(k for k in index if term in k)
+
+            if not keys and fuzzy:
+                keys = tuple(
+                    difflib.get_close_matches(
+                        term, index.keys(), n=FUZZY_LIMIT, cutoff=FUZZY_CUTOFF
+                    )
+                )
+
+        self._resolved[cache_key] = keys
+        return keys
+
+    def search(self, characters=None, shows=None, fuzzy=True) -> list[int]:
+        candidates = None
+
+        for field, terms in (("character", characters), ("show", shows)):
+            if not terms:
+                continue
+
+            index = self.by_character if field == "character" else self.by_show
+
+            matched = set()
+            for term in terms:
+                for key in self._resolve(field, term, fuzzy):
+                    matched.update(index[key])
+
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return list(range(len(self.quotes)))
+
+        return sorted(candidates)
+
+    def random_quote(self, characters=None, shows=None, fuzzy=True):
+        if not characters and not shows:
+            return random.choice(self.quotes) if self.quotes else None
+
+        matches = self.search(characters, shows, fuzzy=fuzzy)
+        if not matches:
+            return None
+
+        return self.quotes[random.choice(matches)]
+
+    def complete(self, field: str, value) -> list[str]:
+        # "naruto, ita" -> ["naruto, Itachi Uchiha", ...] - Only The Last Term Completes
+        trie = self.characters if field == "character" else self.shows
+        head, sep, term = str(value or "").rpartition(",")
+        prefix = f"{head.strip()}, " if sep else ""
+
+        return [f"{prefix}{name}"[:100] for name in trie.complete(term)]
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception:
+            logger.exception("Failed Loading Quote Corpus")
+            return
+
+        loaded = 0
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, (list, tuple)) and len(item) == 3:
+                self.add(*item)
+                loaded += 1
+
+        # Only A Full Sync Writes The File - The Built-In Seed Alone Never Counts
+        self.synced = loaded > 0
+        logger.info(f"Loaded {len(self.quotes)} Quotes From {self.path}")
+
+    def save(self, quotes=None):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    self.quotes if quotes is None else quotes, f, ensure_ascii=False
+                )
+
+            os.replace(tmp_path, self.path)
+        except Exception:
+            logger.exception("Failed Saving Quote Corpus")
@@ -0,0 +1,101 @@
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Rarity:
+    tier: int
+    name: str
+    weight: float
+    points: int
+    stars: str
+
+
+# Tier Index Is What Gets Stored On waifus.rarity
+RARITIES = [
+    Rarity(0, "Common", 60.0, 1, "★"),
+    Rarity(1, "Uncommon", 25.0, 2, "★★"),
+    Rarity(2, "Rare", 10.0, 5, "★★★"),
+    Rarity(3, "Epic", 4.0, 15, "★★★★"),
+    Rarity(4, "Legendary", 1.0, 50, "★★★★★"),
+]
+RARITY_NAMES = [r.name for r in RARITIES]
+
+
+def rarity(tier) -> Rarity:
+    try:
+        return RARITIES[int(tier or 0)]
+    except (IndexError, TypeError, ValueError):
+        return RARITIES[0]
+
+
+class AliasTable:
+    # Walker / Vose Alias Method : O(n) Build, O(1) Sample
+
+    def __init__(self, items: list, weights: list[float]):
+        if not items or len(items) != len(weights):
+            raise ValueError("Alias Table Needs One Weight Per Item")
+
+        total = float(sum(max(0.0, w) for w in weights))
+        if total <= 0:
+            raise ValueError("Alias Table Needs A Positive Total Weight")
+
+        n = len(items)
+        self.items = list(items)
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        scaled = [max(0.0, w) * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # Leftovers Are 1.0 Up To Float Error
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+
+class RarityEngine:
+    # Caches One Alias Table Per (Scope, Guild), Rebuilt Only When Its Weights Change
+
+    def __init__(self, rng=random):
+        self.rng = rng
+        self._tables: dict[tuple, tuple[tuple, AliasTable]] = {}
+
+    def _table(self, key: tuple, weights: dict) -> AliasTable | None:
+        signature = tuple(sorted(weights.items()))
+        cached = self._tables.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        items = [k for k, w in signature if w > 0]
+        if not items:
+            self._tables.pop(key, None)
+            return None
+
+        table = AliasTable(items, [weights[k] for k in items])
+        self._tables[key] = (signature, table)
+        return table
+
+    def pick_tag(self, guild_id, tags: list[str], weights: dict, scope="sfw"):
+        # Unlisted Tags Keep Weight 1
+        merged = {t: float(weights.get(t, 1.0)) for t in tags}
+        table = self._table(("tag", scope, guild_id), merged)
+        return table.sample(self.rng) if table else None
+
+    def pick_rarity(self, guild_id, weights: dict) -> Rarity:
+        merged = {r.tier: float(weights.get(r.name, r.weight)) for r in RARITIES}
+        table = self._table(("rarity", guild_id), merged)
+        return RARITIES[table.sample(self.rng)] if table else RARITIES[0]
+
@@ -0,0 +1,207 @@
+import json
+import math
+import time
+import functools
+from extensions.logger import setup_logger
+from extensions.interactions import respond
+from extensions.metrics import counter, gauge
+
+logger = setup_logger(__name__)
+
+# Bot-Wide Baseline, Edited By Hand - Guild Admins Override It Per Guild In The
+# Database Through /config ratelimit
+CONFIG_PATH = "rateLimitConfig.json"
+
+SCOPES = ("user", "guild")
+LIMITED_COMMANDS = ("waifu", "nwaifu", "meme", "quote")
+
+# [rate_per_minute, burst] Per Scope - "default" Covers Commands Without Their Own
+DEFAULT_CONFIG = {
+    "enabled": True,
+    "limits": {
+        "default": {"user": [6, 3], "guild": [60, 20]},
+    },
+}
+
+# Idle Buckets Are Swept At Most This Often
+COMPACT_INTERVAL = 60.0
+
+RATE_LIMITED = counter(
+    "rate_limited_total",
+    "Commands turned away by the token bucket, by command and scope",
+)
+
+
+def load_config(path: str = CONFIG_PATH) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+            for k, v in DEFAULT_CONFIG.items():
+                data.setdefault(k, v)
+
+            return data
+    except FileNotFoundError:
+        save_config(DEFAULT_CONFIG, path)
+        return json.loads(json.dumps(DEFAULT_CONFIG))
+    except Exception:
+        logger.exception("Failed Loading Rate Limit Config - Using Defaults")
+        return json.loads(json.dumps(DEFAULT_CONFIG))
+
+
+def save_config(cfg: dict, path: str = CONFIG_PATH):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cfg, f, indent=2)
+    except Exception:
+        logger.exception("Failed Saving Rate Limit Config")
+
+
+class RateLimiter:
+    # Token Buckets Keyed By (scope, id, command, guild), Refilled Lazily On Each
+    # Check. A Bucket Is Only Stored While It's Below Burst - A Full One Is The Same
+    # As None. Guild Overrides Sit On Top Of The Bot-Wide Config.
+
+    def __init__(self, config: dict = None, path: str = CONFIG_PATH):
+        self.path = path
+        self.config = config if config is not None else load_config(path)
+        self.guilds: dict[int, dict] = {}
+        self._buckets: dict[tuple, list] = {}
+        self._compacted = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def load_guilds(self, overrides: dict):
+        # overrides : {guild_id: {"enabled"?, "limits"?}}
+        self.guilds = {int(g): cfg for g, cfg in (overrides or {}).items() if cfg}
+
+    def guild_config(self, guild_id) -> dict:
+        return self.guilds.get(guild_id) or {}
+
+    def set_guild(self, guild_id: int, cfg: dict):
+        if cfg:
+            self.guilds[guild_id] = cfg
+        else:
+            self.guilds.pop(guild_id, None)
+
+        # Buckets Were Sized For The Old Limits
+        for key in [k for k in self._buckets if k[3] == guild_id]:
+            del self._buckets[key]
+
+    def enabled(self, guild_id=None) -> bool:
+        return self.guild_config(guild_id).get(
+            "enabled", self.config.get("enabled", True)
+        )
+
+    def limit(self, command: str, scope: str, guild_id=None) -> tuple[float, float]:
+        # (tokens per second, burst) - The Guild's Rules Win Over The Bot's
+        rule = None
+        for cfg in (self.guild_config(guild_id), self.config):
+            limits = cfg.get("limits") or {}
+            rule = (limits.get(command) or {}).get(scope)
+            if rule is None:
+                rule = (limits.get("default") or {}).get(scope)
+            if rule is not None:
+                break
+
+        per_minute, burst = rule or [0, 0]
+        return per_minute / 60.0, float(burst)
+
+    def _level(self, key: tuple, rate: float, burst: float, now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return burst
+
+        tokens, stamp = bucket
+        return min(burst, tokens + (now - stamp) * rate)
+
+    def check(self, command: str, user_id: int, guild_id: int = None) -> float:
+        # 0 If Allowed (And A Token Is Taken From Each Bucket), Else Seconds To Wait
+        if not self.enabled(guild_id):
+            return 0.0
+
+        now = time.monotonic()
+        if now - self._compacted >= COMPACT_INTERVAL:
+            self.compact(now)
+
+        ids = {"user": user_id, "guild": guild_id}
+        buckets = []
+        wait = 0.0
+
+        for scope in SCOPES:
+            if ids[scope] is None:
+                continue
+
+            rate, burst = self.limit(command, scope, guild_id)
+            if burst <= 0:
+                # Zero Burst Means "No Limit" For This Scope
+                continue
+
+            key = (scope, ids[scope], command, guild_id)
+            level = self._level(key, rate, burst, now)
+            if level < 1.0:
+                wait = max(wait, (1.0 - level) / rate if rate > 0 else float("inf"))
+                RATE_LIMITED.inc(command=command, scope=scope)
+
+            buckets.append((key, level))
+
+        if wait:
+            return wait
+
+        # Both Scopes Must Allow It Before Either Is Charged
+        for key, level in buckets:
+            self._buckets[key] = [level - 1.0, now]
+
+        return 0.0
+
+    def compact(self, now: float = None) -> int:
+        # Drop Buckets That Have Refilled - They'd Start Full Anyway
+        now = time.monotonic() if now is None else now
+        idle = []
+        for key in self._buckets:
+            rate, burst = self.limit(key[2], key[0], key[3])
+            if self._level(key, rate, burst, now) >= burst:
+                idle.append(key)
+
+        for key in idle:
+            del self._buckets[key]
+
+        self._compacted = now
+        return len(idle)
+
+
+_limiter_gauge = gauge("rate_limit_buckets", "Token buckets currently held in memory")
+
+
+def get_rate_limiter(bot) -> RateLimiter:
+    limiter = getattr(bot, "rate_limiter", None)
+    if limiter is None:
+        limiter = bot.rate_limiter = RateLimiter()
+        _limiter_gauge.set_function(lambda: len(limiter))
+
+    return limiter
+
+
+def rate_limited(command: str):
+    # Turns The Caller Away With An Ephemeral Reply Before Any Upstream Work
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, ctx, *args, **kwargs):
+            user = getattr(ctx, "author", None)
+            wait = get_rate_limiter(ctx.bot).check(
+                command, getattr(user, "id", None), ctx.guild_id
+            )
+            if wait:
+                retry = "Later" if wait == float("inf") else f"In {math.ceil(wait)}s"
+                return await respond(
+                    ctx,
+                    f"⏳ Slow Down! Try `/{command}` Again {retry}.",
+                    ephemeral=True,
+                )
+
+            return await fn(self, ctx, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
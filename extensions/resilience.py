@@ -0,0 +1,249 @@
+import time
+import random
+import asyncio
+import aiohttp
+from extensions.logger import setup_logger
+from extensions.metrics import UPSTREAM_LATENCY, UPSTREAM_REQUESTS, counter, gauge
+
+logger = setup_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 15.0
+MAX_RESET_TIMEOUT = 300.0
+
+
+class UpstreamError(Exception):
+    def __init__(self, service: str, status: int, detail: str = ""):
+        super().__init__(f"{service} Returned {status}{f' : {detail}' if detail else ''}")
+        self.service = service
+        self.status = status
+
+    @property
+    def transient(self) -> bool:
+        # 4xx Means The Request Was Bad, Not That The Service Is Down
+        return self.status >= 500 or self.status == 429
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, service: str, retry_in: float):
+        super().__init__(f"{service} Circuit Open - Retry In {retry_in:.1f}s")
+        self.service = service
+        self.retry_in = retry_in
+
+
+def backoff_delay(attempt: int, base: float = 0.25, cap: float = 30.0) -> float:
+    # Full Jitter : Uniform Over [0, min(cap, base * 2^attempt)]
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def is_failure(exc: BaseException) -> bool:
+    if isinstance(exc, UpstreamError):
+        return exc.transient
+
+    return isinstance(exc, (asyncio.TimeoutError, aiohttp.ClientError, OSError))
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+        max_reset_timeout: float = MAX_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.opened_at = 0.0
+        self.open_for = reset_timeout
+        self._probing = False
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+
+        return max(0.0, self.opened_at + self.open_for - time.monotonic())
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                return False
+
+            self.state = HALF_OPEN
+            logger.info(f"Circuit {self.name} Half-Open - Probing")
+
+        # Half-Open : Let Exactly One Probe Through
+        if self._probing:
+            return False
+
+        self._probing = True
+        return True
+
+    def release(self):
+        self._probing = False
+
+    def record_success(self):
+        if self.state != CLOSED:
+            logger.info(f"Circuit {self.name} Closed")
+
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.open_for = self.reset_timeout
+        self._probing = False
+
+    def record_failure(self):
+        self._probing = False
+
+        if self.state == HALF_OPEN:
+            self._trip()
+            return
+
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self):
+        # Each Consecutive Trip Doubles The Open Window, Jittered To Avoid Herds
+        self.trips += 1
+        window = min(self.max_reset_timeout, self.reset_timeout * 2 ** (self.trips - 1))
+
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.open_for = window * random.uniform(0.8, 1.2)
+        self.failures = 0
+
+        logger.warning(f"Circuit {self.name} Open For {self.open_for:.1f}s")
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+gauge(
+    "circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)"
+).set_function(
+    lambda: {
+        (("service", name),): _STATE_VALUES[b.state] for name, b in _breakers.items()
+    }
+)
+
+
+def get_breaker(service: str, **kwargs) -> CircuitBreaker:
+    breaker = _breakers.get(service)
+    if breaker is None:
+        breaker = _breakers[service] = CircuitBreaker(service, **kwargs)
+
+    return breaker
+
+
+def _observe(service: str, outcome: str, start: float):
+    UPSTREAM_LATENCY.observe(
+        time.perf_counter() - start, service=service, outcome=outcome
+    )
+    UPSTREAM_REQUESTS.inc(service=service, outcome=outcome)
+
+
+async def call(service: str, factory, timeout: float = 10.0, retries: int = 0):
+    breaker = get_breaker(service)
+
+    for attempt in range(retries + 1):
+        if not breaker.allow():
+            UPSTREAM_REQUESTS.inc(service=service, outcome="open")
+            raise CircuitOpenError(service, breaker.retry_in())
+
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(factory(), timeout)
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as e:
+            if not is_failure(e):
+                # The Service Answered, Just Not With What We Wanted
+                _observe(service, "rejected", start)
+                breaker.record_success()
+                raise
+
+            _observe(service, "error", start)
+            breaker.record_failure()
+            if attempt >= retries or breaker.state != CLOSED:
+                raise
+
+            delay = backoff_delay(attempt)
+            logger.warning(f"{service} Failed ({e!r}) - Retrying In {delay:.2f}s")
+            await asyncio.sleep(delay)
+        else:
+            _observe(service, "ok", start)
+            breaker.record_success()
+            return result
+
+
+UPSTREAM_COALESCED = counter(
+    "upstream_coalesced_total",
+    "Upstream calls answered by joining an identical in-flight request",
+)
+
+
+def flight_key(service: str, params: dict) -> tuple:
+    # Order- And Case-Insensitive, So ["maid", "Waifu"] == ["waifu", "maid"]
+    def normalize(value):
+        if isinstance(value, (list, tuple, set)):
+            return tuple(sorted(normalize(v) for v in value))
+        if isinstance(value, str):
+            return value.strip().casefold()
+
+        return value
+
+    return service, tuple(sorted((k, normalize(v)) for k, v in (params or {}).items()))
+
+
+class SingleFlight:
+    # One In-Flight Call Per Key - Concurrent Callers Await The Same Task
+
+    def __init__(self):
+        self._calls: dict[tuple, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: tuple, factory) -> tuple:
+        # (result, leader) - leader Is False For Callers That Joined Someone Else's
+        task = self._calls.get(key)
+        leader = task is None
+
+        if leader:
+            task = self._calls[key] = asyncio.ensure_future(factory())
+            task.add_done_callback(lambda t: self._finish(key, t))
+        else:
+            UPSTREAM_COALESCED.inc(service=key[0])
+
+        # Shielded So One Caller Giving Up Doesn't Cancel It For The Rest
+        return await asyncio.shield(task), leader
+
+    def _finish(self, key: tuple, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Retrieved Here Too, In Case Every Caller Was Cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+_flights = SingleFlight()
+
+
+async def coalesce(service: str, params: dict, factory) -> tuple:
+    return await _flights.do(flight_key(service, params), factory)
@@ -0,0 +1,163 @@
+import os
+import sys
+import itertools
+import discord
+from extensions.logger import setup_logger
+from extensions.metrics import gauge
+
+logger = setup_logger(__name__)
+
+# "lean" (Default) Or "default" For py-cord's Stock Intents And Caches
+BOT_PROFILE = (os.getenv("BOT_PROFILE") or "lean").lower()
+
+# Messages Kept In py-cord's Message Cache Under The Lean Profile (0 = None)
+MAX_MESSAGES = int(os.getenv("MAX_MESSAGES") or 0)
+
+# Entries Measured Per Cache - The Rest Are Extrapolated From Their Average
+SIZE_SAMPLE = 64
+
+CACHE_ENTRIES = gauge("cache_entries", "Entries held per in-process cache")
+CACHE_BYTES = gauge("cache_bytes", "Approximate bytes held per in-process cache")
+PROCESS_RSS = gauge("process_resident_memory_bytes", "Resident set size")
+
+_caches: dict = {}
+
+
+def bot_options() -> dict:
+    if BOT_PROFILE == "default":
+        return {"intents": discord.Intents.default()}
+
+    # Everything Is Slash Commands And Buttons - Interactions Need No Intents.
+    # guilds Keeps Guild / Channel Lookups Working For Scheduled Posts.
+    intents = discord.Intents.none()
+    intents.guilds = True
+
+    return {
+        "intents": intents,
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "max_messages": MAX_MESSAGES or None,
+        "chunk_guilds_at_startup": False,
+    }
+
+
+def approx_size(obj) -> int:
+    # Object Plus Its Direct Attributes - Deep Enough For Cached Model Objects
+    size = sys.getsizeof(obj)
+
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+        values = attrs.values()
+    else:
+        slots = itertools.chain.from_iterable(
+            getattr(cls, "__slots__", ()) for cls in type(obj).__mro__
+        )
+        values = (getattr(obj, name, None) for name in slots)
+
+    return size + sum(sys.getsizeof(v) for v in values)
+
+
+def estimate(container) -> tuple[int, int]:
+    # (entries, approx bytes) For A Dict / Deque / Set Of Objects
+    if container is None:
+        return 0, 0
+
+    entries = len(container)
+    values = container.values() if hasattr(container, "values") else container
+    sample = list(itertools.islice(values, SIZE_SAMPLE))
+
+    per_entry = sum(approx_size(v) for v in sample) / len(sample) if sample else 0
+    return entries, int(sys.getsizeof(container) + per_entry * entries)
+
+
+def register_cache(name: str, sizer):
+    # sizer() -> (entries, approx bytes)
+    _caches[name] = sizer
+
+
+def unregister_cache(name: str):
+    _caches.pop(name, None)
+
+
+def _discord_caches(bot) -> dict[str, tuple[int, int]]:
+    # py-cord Internals - Read Defensively So A Library Update Only Drops A Row
+    state = getattr(bot, "_connection", None)
+    if state is None:
+        return {}
+
+    guilds = list(getattr(state, "_guilds", {}).values())
+    report = {
+        "guilds": estimate(getattr(state, "_guilds", None)),
+        "users": estimate(getattr(state, "_users", None)),
+        "emojis": estimate(getattr(state, "_emojis", None)),
+        "stickers": estimate(getattr(state, "_stickers", None)),
+        "private_channels": estimate(getattr(state, "_private_channels", None)),
+        "messages": estimate(getattr(state, "_messages", None)),
+    }
+
+    for name, attr in (
+        ("members", "_members"),
+        ("channels", "_channels"),
+        ("roles", "_roles"),
+    ):
+        entries = total = 0
+        for guild in guilds:
+            n, size = estimate(getattr(guild, attr, None))
+            entries += n
+            total += size
+        report[name] = (entries, total)
+
+    return report
+
+
+def cache_report(bot) -> dict[str, tuple[int, int]]:
+    report = _discord_caches(bot)
+    for name, sizer in list(_caches.items()):
+        try:
+            report[name] = sizer()
+        except Exception:
+            logger.exception(f"Failed Sizing Cache {name}")
+
+    return report
+
+
+def resident_memory() -> int | None:
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+
+        # Peak, Not Current - Best Available Off Linux (KiB On Linux, Bytes On macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def format_report(bot) -> str:
+    lines = [f"Runtime Profile : {BOT_PROFILE}"]
+
+    rss = resident_memory()
+    if rss is not None:
+        lines.append(f"Resident Memory : {rss / 1_048_576:.1f} MiB")
+
+    for name, (entries, size) in sorted(cache_report(bot).items()):
+        lines.append(f"{name:<18} {entries:>9} entries  {size / 1024:>10.1f} KiB")
+
+    return "\n".join(lines) + "\n"
+
+
+def install(bot):
+    def _entries():
+        return {(("cache", k),): v[0] for k, v in cache_report(bot).items()}
+
+    def _bytes():
+        return {(("cache", k),): v[1] for k, v in cache_report(bot).items()}
+
+    CACHE_ENTRIES.set_function(_entries)
+    CACHE_BYTES.set_function(_bytes)
+    PROCESS_RSS.set_function(resident_memory)
@@ -0,0 +1,187 @@
+import time
+import heapq
+import asyncio
+import itertools
+from extensions.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Interaction Replies Go Over The Interaction Webhook, Not The Channel's Message
+# Route, So They Never Queue Here - Lower Numbers Still Jump Ahead If Ever Needed
+PRIORITY_BACKGROUND = 10
+
+# Discord Allows ~5 Messages / 5s Per Channel And 50 Requests / s Globally
+CHANNEL_RATE = 1.0
+CHANNEL_BURST = 5
+GLOBAL_RATE = 40.0
+GLOBAL_BURST = 40
+
+WORKERS = 4
+MAX_IDLE_BUCKETS = 5000
+
+
+class TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def delay(self, n: float = 1.0) -> float:
+        # Seconds Until n Tokens Are Available, 0 If Available Now
+        self._refill(time.monotonic())
+        if self.tokens >= n:
+            return 0.0
+
+        return (n - self.tokens) / self.rate
+
+    def consume(self, n: float = 1.0) -> bool:
+        self._refill(time.monotonic())
+        if self.tokens < n:
+            return False
+
+        self.tokens -= n
+        return True
+
+    @property
+    def idle(self) -> bool:
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+class SendQueue:
+    def __init__(
+        self,
+        workers: int = WORKERS,
+        channel_rate: float = CHANNEL_RATE,
+        channel_burst: float = CHANNEL_BURST,
+        global_rate: float = GLOBAL_RATE,
+        global_burst: float = GLOBAL_BURST,
+    ):
+        self.workers = workers
+        self.channel_rate = channel_rate
+        self.channel_burst = channel_burst
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+
+        self._seq = itertools.count()
+        self._pending: dict[int, list] = {}
+        self._buckets: dict[int, TokenBucket] = {}
+        self._ready: asyncio.PriorityQueue | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        return sum(len(heap) for heap in self._pending.values())
+
+    def _bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            if len(self._buckets) >= MAX_IDLE_BUCKETS:
+                self._buckets = {
+                    cid: b
+                    for cid, b in self._buckets.items()
+                    if not b.idle or cid in self._pending
+                }
+
+            bucket = self._buckets[channel_id] = TokenBucket(
+                self.channel_rate, self.channel_burst
+            )
+
+        return bucket
+
+    def _ensure_workers(self):
+        if self._tasks:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._ready = asyncio.PriorityQueue()
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    def _schedule(self, channel_id: int):
+        heap = self._pending.get(channel_id)
+        if heap:
+            self._ready.put_nowait((heap[0][0], next(self._seq), channel_id))
+
+    def submit(self, channel_id: int, factory, priority: int = PRIORITY_BACKGROUND):
+        self._ensure_workers()
+
+        future = asyncio.get_running_loop().create_future()
+        heap = self._pending.get(channel_id)
+
+        if heap is None:
+            # Each Channel Sits In The Ready Queue At Most Once, So Its Sends Stay Ordered
+            heap = self._pending[channel_id] = []
+            heapq.heappush(heap, (priority, next(self._seq), factory, future))
+            self._schedule(channel_id)
+        else:
+            heapq.heappush(heap, (priority, next(self._seq), factory, future))
+
+        return future
+
+    async def send(self, channel, *args, priority: int = PRIORITY_BACKGROUND, **kwargs):
+        return await self.submit(
+            channel.id, lambda: channel.send(*args, **kwargs), priority
+        )
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            _, _, channel_id = await self._ready.get()
+
+            heap = self._pending.get(channel_id)
+            if not heap:
+                self._pending.pop(channel_id, None)
+                continue
+
+            bucket = self._bucket(channel_id)
+            wait = max(bucket.delay(), self.global_bucket.delay())
+            if wait > 0:
+                # Park This Channel Without Holding Up Other Channels
+                loop.call_later(wait, self._schedule, channel_id)
+                continue
+
+            bucket.consume()
+            self.global_bucket.consume()
+
+            _, _, factory, future = heapq.heappop(heap)
+
+            try:
+                if not future.cancelled():
+                    result = await factory()
+                    if not future.cancelled():
+                        future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                if heap:
+                    self._schedule(channel_id)
+                else:
+                    self._pending.pop(channel_id, None)
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+
+        self._tasks = []
+
+
+def get_send_queue(bot) -> SendQueue:
+    queue = getattr(bot, "send_queue", None)
+    if queue is None:
+        queue = bot.send_queue = SendQueue()
+
+    return queue
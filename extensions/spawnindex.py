@@ -0,0 +1,139 @@
+import sys
+import math
+import hashlib
+from collections import OrderedDict
+
+# Sized For Every Guild's Claims Together; ~1.2 MB Of Bits At 1% False Positives
+BLOOM_CAPACITY = 1_000_000
+BLOOM_ERROR_RATE = 0.01
+
+# Spawns Remembered Per Channel, And How Many Channels Are Tracked At Once
+RECENT_PER_CHANNEL = 256
+MAX_CHANNELS = 4096
+
+
+class BloomFilter:
+    def __init__(
+        self, capacity: int = BLOOM_CAPACITY, error_rate: float = BLOOM_ERROR_RATE
+    ):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Kirsch-Mitzenmacher : k Positions From Two 64-Bit Halves Of One Digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class RecentSet:
+    # Bounded Insertion-Ordered Set - Oldest Entry Falls Out First
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._items: OrderedDict = OrderedDict()
+
+    def add(self, key):
+        self._items[key] = None
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SpawnIndex:
+    # Decides Whether A Candidate Image Is Worth Posting To A Channel.
+    # Claimed Images Live In A Bloom Filter Keyed By (guild, waifu_api_id) - A False
+    # Positive Only Skips A Candidate, And Released Waifus Stay Marked Until Restart.
+    # Recent Spawns Are Exact, Per Channel, In Bounded LRUs.
+
+    def __init__(
+        self,
+        capacity: int = BLOOM_CAPACITY,
+        error_rate: float = BLOOM_ERROR_RATE,
+        per_channel: int = RECENT_PER_CHANNEL,
+        max_channels: int = MAX_CHANNELS,
+    ):
+        self.claimed_filter = BloomFilter(capacity, error_rate)
+        self.per_channel = per_channel
+        self.max_channels = max_channels
+        self._recent: OrderedDict[int, RecentSet] = OrderedDict()
+
+    @staticmethod
+    def _claim_key(guild_id, api_id) -> str:
+        return f"{guild_id or 0}:{api_id}"
+
+    def load_claimed(self, pairs):
+        # pairs : Iterable Of (guild_id, waifu_api_id)
+        for guild_id, api_id in pairs:
+            self.mark_claimed(guild_id, api_id)
+
+    def mark_claimed(self, guild_id, api_id):
+        if api_id is not None:
+            self.claimed_filter.add(self._claim_key(guild_id, api_id))
+
+    def is_claimed(self, guild_id, api_id) -> bool:
+        return self._claim_key(guild_id, api_id) in self.claimed_filter
+
+    def mark_spawned(self, channel_id, api_id):
+        if channel_id is None or api_id is None:
+            return
+
+        recent = self._recent.get(channel_id)
+        if recent is None:
+            recent = self._recent[channel_id] = RecentSet(self.per_channel)
+            if len(self._recent) > self.max_channels:
+                self._recent.popitem(last=False)
+        else:
+            self._recent.move_to_end(channel_id)
+
+        recent.add(api_id)
+
+    def recently_spawned(self, channel_id, api_id) -> bool:
+        recent = self._recent.get(channel_id)
+        return recent is not None and api_id in recent
+
+    def sizes(self) -> dict[str, tuple[int, int]]:
+        # (entries, approx bytes) Per Structure, For The Runtime Cache Report
+        recent = sum(len(r) for r in self._recent.values())
+        return {
+            "spawn_claimed_filter": (
+                self.claimed_filter.count,
+                sys.getsizeof(self.claimed_filter.bits),
+            ),
+            "spawn_recent": (
+                recent,
+                sys.getsizeof(self._recent)
+                + sum(sys.getsizeof(r._items) for r in self._recent.values()),
+            ),
+        }
+
+    def reject_reason(self, guild_id, channel_id, api_id) -> str | None:
+        if api_id is None:
+            return None
+        if self.is_claimed(guild_id, api_id):
+            return "claimed"
+        if self.recently_spawned(channel_id, api_id):
+            return "recent"
+
+        return None
@@ -0,0 +1,62 @@
+import time
+
+
+class TimerWheel:
+    # Hashed Timing Wheel : O(1) Schedule / Cancel, And Each Tick Visits One Slot.
+    # Timers Keep Their Absolute Tick, So One Further Out Than A Full Turn Simply
+    # Stays In Its Slot Until The Wheel Comes Round To It Again.
+
+    def __init__(self, tick: float, slots: int, start: float = None):
+        self.tick = tick
+        self.slots: list[dict] = [{} for _ in range(slots)]
+        self.current = int((time.time() if start is None else start) // tick)
+        self._where: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key) -> bool:
+        return key in self._where
+
+    def schedule(self, key, when: float, payload=None):
+        # Past Times Fire On The Next Tick. Re-Scheduling A Key Moves It.
+        self.cancel(key)
+
+        target = max(int(when // self.tick), self.current + 1)
+        slot = target % len(self.slots)
+        self.slots[slot][key] = (target, payload)
+        self._where[key] = slot
+
+    def cancel(self, key) -> bool:
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return False
+
+        del self.slots[slot][key]
+        return True
+
+    def _expire(self, slot: int, upto: int, fired: list):
+        bucket = self.slots[slot]
+        for key, (target, payload) in list(bucket.items()):
+            if target <= upto:
+                del bucket[key]
+                del self._where[key]
+                fired.append((key, payload))
+
+    def advance(self, now: float = None) -> list:
+        # [(key, payload)] For Every Timer Due By now
+        due = int((time.time() if now is None else now) // self.tick)
+        fired: list = []
+
+        if due - self.current >= len(self.slots):
+            # Fell A Full Turn Behind - One Sweep Covers Every Slot
+            for slot in range(len(self.slots)):
+                self._expire(slot, due, fired)
+            self.current = due
+            return fired
+
+        while self.current < due:
+            self.current += 1
+            self._expire(self.current % len(self.slots), self.current, fired)
+
+        return fired
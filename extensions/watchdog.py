@@ -0,0 +1,178 @@
+import os
+import sys
+import time
+import heapq
+import asyncio
+import logging
+import threading
+import traceback
+from dataclasses import dataclass, field
+from extensions.logger import setup_logger
+from extensions.metrics import LOOP_LAG, counter
+
+logger = setup_logger(__name__)
+
+WATCHDOG_INTERVAL = float(os.getenv("WATCHDOG_INTERVAL") or 0.25)
+WATCHDOG_THRESHOLD = float(os.getenv("WATCHDOG_THRESHOLD") or 0.1)
+WATCHDOG_KEEP = 20
+SLOW_CALLBACK_MS = float(os.getenv("SLOW_CALLBACK_MS") or 100)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_STALLS = counter("event_loop_stalls_total", "Event loop stalls by call site")
+
+
+@dataclass(order=True)
+class Stall:
+    duration: float
+    when: float = field(compare=False)
+    site: str = field(compare=False)
+    stack: str = field(compare=False)
+
+
+def _call_site(frame) -> str:
+    # Deepest Frame In Our Own Code, Else The Deepest Frame Overall
+    deepest = None
+    while frame is not None:
+        code = frame.f_code
+        site = f"{os.path.relpath(code.co_filename, PROJECT_ROOT)}:{frame.f_lineno} ({code.co_name})"
+        deepest = deepest or site
+
+        filename = os.path.abspath(code.co_filename)
+        if (
+            filename.startswith(PROJECT_ROOT)
+            and "site-packages" not in filename
+            and filename != os.path.abspath(__file__)
+        ):
+            return site
+
+        frame = frame.f_back
+
+    return deepest or "unknown"
+
+
+class LoopWatchdog:
+    def __init__(
+        self,
+        interval: float = WATCHDOG_INTERVAL,
+        threshold: float = WATCHDOG_THRESHOLD,
+        keep: int = WATCHDOG_KEEP,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.keep = keep
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worst: list[Stall] = []
+        self._pending: tuple[float, str, str] | None = None
+        self._due = time.monotonic() + interval
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._task is not None:
+            return
+
+        self._loop_thread = threading.get_ident()
+        self._due = time.monotonic() + self.interval
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._monitor, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _heartbeat(self):
+        while True:
+            self._due = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+
+            lag = max(0.0, time.monotonic() - self._due)
+            LOOP_LAG.observe(lag)
+            self._resolve(lag)
+
+    def _monitor(self):
+        # Runs Off-Loop So It Can See The Loop Thread's Stack While It Is Blocked
+        while not self._stop.wait(self.interval / 2):
+            due = self._due
+            if time.monotonic() - due < self.threshold:
+                continue
+
+            with self._lock:
+                if self._pending is not None and self._pending[0] == due:
+                    continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+
+            site = _call_site(frame)
+            stack = "".join(traceback.format_stack(frame))
+
+            with self._lock:
+                self._pending = (due, site, stack)
+
+    def _resolve(self, lag: float):
+        with self._lock:
+            pending, self._pending = self._pending, None
+
+        if pending is None or lag < self.threshold:
+            return
+
+        _, site, stack = pending
+        stall = Stall(lag, time.time(), site, stack)
+
+        with self._lock:
+            if len(self._worst) < self.keep:
+                heapq.heappush(self._worst, stall)
+            else:
+                heapq.heappushpop(self._worst, stall)
+
+        LOOP_STALLS.inc(site=site)
+        logger.warning(f"Event Loop Blocked For {lag * 1000:.0f}ms At {site}")
+
+    def worst(self) -> list[Stall]:
+        with self._lock:
+            return sorted(self._worst, reverse=True)
+
+    def format_report(self) -> str:
+        stalls = self.worst()
+        if not stalls:
+            return "No Event Loop Stalls Recorded\n"
+
+        parts = []
+        for s in stalls:
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(s.when))
+            parts.append(f"[{when}] {s.duration * 1000:.0f}ms At {s.site}\n{s.stack}")
+
+        return "\n".join(parts)
+
+
+WATCHDOG = LoopWatchdog()
+
+
+def configure_debug(loop: asyncio.AbstractEventLoop):
+    # Opt-In : asyncio's Own Slow-Callback Logging Has Exact Handle Names
+    if (os.getenv("ASYNCIO_DEBUG") or "").lower() not in ("1", "true", "yes"):
+        return
+
+    loop.set_debug(True)
+    loop.slow_callback_duration = SLOW_CALLBACK_MS / 1000
+    setup_logger("asyncio", logging.WARNING)
+
+    logger.info(f"Asyncio Debug Mode On - Slow Callback Threshold {SLOW_CALLBACK_MS:.0f}ms")
+
+
+def start():
+    configure_debug(asyncio.get_running_loop())
+    WATCHDOG.start()
+    return WATCHDOG
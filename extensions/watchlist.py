@@ -0,0 +1,108 @@
+import sqlite3
+from extensions.logger import setup_logger
+from extensions.metrics import DB_LATENCY, timed
+
+logger = setup_logger(__name__)
+
+WATCH_DB_PATH = "astrumotaku.db"
+
+
+class WatchStore:
+    # Show Subscriptions. Keyed By (route, user_id) So "Who Watches This Route"
+    # Is One Index Range Per Airing; A Second Index Serves /watch list.
+    # channel_id NULL Means Ping By DM.
+
+    def __init__(self, db_path: str = WATCH_DB_PATH):
+        self.connection = sqlite3.connect(db_path)
+        self.cursor = self.connection.cursor()
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS watches (
+                route TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                guild_id INTEGER,
+                channel_id INTEGER,
+                PRIMARY KEY (route, user_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_watches_user ON watches (user_id)
+            """
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def add(self, route, user_id, title, guild_id=None, channel_id=None):
+        self.cursor.execute(
+            """
+            INSERT INTO watches (route, user_id, title, guild_id, channel_id)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (route, user_id) DO UPDATE SET
+                title = excluded.title,
+                guild_id = excluded.guild_id,
+                channel_id = excluded.channel_id
+            """,
+            (route, user_id, title, guild_id, channel_id),
+        )
+        self.connection.commit()
+
+    @timed(DB_LATENCY)
+    def remove(self, route, user_id) -> bool:
+        self.cursor.execute(
+            """
+            DELETE FROM watches WHERE route = ? AND user_id = ?
+            """,
+            (route, user_id),
+        )
+        self.connection.commit()
+        return self.cursor.rowcount > 0
+
+    @timed(DB_LATENCY)
+    def for_user(self, user_id):
+        # [(route, title, channel_id)]
+        self.cursor.execute(
+            """
+            SELECT route, title, channel_id FROM watches
+            WHERE user_id = ?
+            ORDER BY title
+            """,
+            (user_id,),
+        )
+        return self.cursor.fetchall()
+
+    @timed(DB_LATENCY)
+    def count_for_user(self, user_id) -> int:
+        self.cursor.execute(
+            """
+            SELECT COUNT(*) FROM watches WHERE user_id = ?
+            """,
+            (user_id,),
+        )
+        return self.cursor.fetchone()[0]
+
+    @timed(DB_LATENCY)
+    def subscribers(self, route):
+        # [(user_id, channel_id)]
+        self.cursor.execute(
+            """
+            SELECT user_id, channel_id FROM watches WHERE route = ?
+            """,
+            (route,),
+        )
+        return self.cursor.fetchall()
+
+    @timed(DB_LATENCY)
+    def routes(self) -> set:
+        self.cursor.execute(
+            """
+            SELECT DISTINCT route FROM watches
+            """
+        )
+        return {row[0] for row in self.cursor.fetchall()}
+
+    @timed(DB_LATENCY)
+    def close(self):
+        self.connection.close()